@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""Benchmark harness for the last30days processing pipeline.
+
+Synthesizes N Reddit + X items from the --mock fixtures and times each
+processing stage (normalize, score, dedupe, cluster, render, store) with no
+network access. Each stage is timed with time.perf_counter (best of
+--repeat runs) and its peak allocation measured in a separate tracemalloc
+pass, so tracing overhead does not skew the timings.
+
+dedupe and cluster are quadratic in the item count, so the default sizes
+stop at 10^3; pass --sizes for the larger tiers.
+
+Usage:
+    python3 benchmark.py                                 # 100, 1000 items
+    python3 benchmark.py --sizes 100,1000,10000,100000   # add the 10^4/10^5 tiers
+    python3 benchmark.py --output bench.json             # write the JSON report
+    python3 benchmark.py --baseline bench.json           # compare, exit 1 on regression
+    python3 benchmark.py --update-baseline               # refresh the reference baseline
+
+When fixtures/benchmark_baseline.json exists it is the default --baseline.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+sys.path.insert(0, str(SCRIPT_DIR))
+
+from lib import cluster, dates, dedupe, normalize, openai_reddit, render, schema, score, xai_x
+
+import store
+
+FIXTURES_DIR = SCRIPT_DIR.parent / "fixtures"
+# Reference report compared against when --baseline is not given
+BASELINE_FILE = FIXTURES_DIR / "benchmark_baseline.json"
+
+STAGES = ("normalize", "score", "dedupe", "cluster", "render", "store")
+DEFAULT_SIZES = (100, 1000)
+
+# A stage regresses when it is this much slower than the baseline...
+DEFAULT_TOLERANCE = 0.25
+# ...and at least this much slower in absolute terms (timer noise)
+NOISE_FLOOR_SECONDS = 0.005
+
+# Every Nth synthetic item keeps its template's text, so dedupe has work to do
+DUPLICATE_EVERY = 10
+
+VOCAB = (
+    "agents", "benchmark", "cache", "context", "deploy", "eval", "fine-tune",
+    "latency", "memory", "open-source", "prompt", "release", "reasoning",
+    "skills", "tokens", "tooling", "vision", "workflow",
+)
+
+
+def _load_fixture(name: str) -> dict:
+    with open(FIXTURES_DIR / name) as f:
+        return json.load(f)
+
+
+def synthesize_items(n: int, from_date: str, to_date: str, seed: int = 0) -> Dict[str, List[dict]]:
+    """Build n raw items (half Reddit, half X) from the fixture responses.
+
+    Items get unique URLs, dates spread over the range and varied text;
+    every DUPLICATE_EVERY-th item repeats its template's text verbatim.
+    Output depends only on (n, dates, seed).
+    """
+    rng = random.Random(seed)
+    start = date.fromisoformat(from_date)
+    span = max(0, (date.fromisoformat(to_date) - start).days)
+
+    templates = {
+        "reddit": openai_reddit.parse_reddit_response(_load_fixture("openai_sample.json")),
+        "x": xai_x.parse_x_response(_load_fixture("xai_sample.json")),
+    }
+    text_key = {"reddit": "title", "x": "text"}
+    counts = {"reddit": n - n // 2, "x": n // 2}
+
+    items: Dict[str, List[dict]] = {}
+    for source, base in templates.items():
+        items[source] = []
+        for i in range(counts[source]):
+            item = dict(base[i % len(base)])
+            item["id"] = f"{source[0].upper()}{i + 1}"
+            item["url"] = f"{item.get('url', '')}/{i}"
+            item["date"] = (start + timedelta(days=rng.randint(0, span))).isoformat()
+            item["relevance"] = round(rng.uniform(0.3, 1.0), 2)
+            if i % DUPLICATE_EVERY:
+                words = " ".join(rng.sample(VOCAB, 4))
+                item[text_key[source]] = f"{item.get(text_key[source], '')} {words} #{i}"
+            items[source].append(item)
+    return items
+
+
+def _findings(items_by_source: Dict[str, list]) -> List[dict]:
+    findings = []
+    for item in items_by_source["reddit"]:
+        findings.append({
+            "source": "reddit",
+            "url": item.url,
+            "title": item.title,
+            "author": item.subreddit,
+            "content": item.title,
+            "engagement_score": item.engagement.score if item.engagement else 0,
+            "relevance_score": item.relevance,
+        })
+    for item in items_by_source["x"]:
+        findings.append({
+            "source": "x",
+            "url": item.url,
+            "title": item.text[:100],
+            "author": item.author_handle,
+            "content": item.text,
+            "engagement_score": item.engagement.likes if item.engagement else 0,
+            "relevance_score": item.relevance,
+        })
+    return findings
+
+
+def _store_findings(db_path: Path, report: schema.Report, items_by_source: Dict[str, list]) -> int:
+    """Persist the pre-cluster items, as last30days.py --store does."""
+    store._db_override = db_path
+    try:
+        store.init_db(db_path)
+        topic_id = store.add_topic(report.topic)["id"]
+        run_id = store.record_run(topic_id, source_mode=report.mode)
+        counts = store.store_findings(run_id, topic_id, _findings(items_by_source))
+        return counts["new"] + counts["updated"]
+    finally:
+        store.close_connections()
+        store._db_override = None
+
+
+def run_pipeline(
+    raw: Dict[str, List[dict]],
+    from_date: str,
+    to_date: str,
+    measure: Callable[[str, Callable[[], Any]], Any],
+    db_path: Path,
+):
+    """Run every stage once, passing each through measure(stage, fn)."""
+    normalized = measure("normalize", lambda: {
+        "reddit": normalize.normalize_reddit_items(raw["reddit"], from_date, to_date),
+        "x": normalize.normalize_x_items(raw["x"], from_date, to_date),
+    })
+    scored = measure("score", lambda: {
+        "reddit": score.sort_items(score.score_reddit_items(normalized["reddit"])),
+        "x": score.sort_items(score.score_x_items(normalized["x"])),
+    })
+    deduped = measure("dedupe", lambda: {
+        "reddit": dedupe.dedupe_reddit(scored["reddit"]),
+        "x": dedupe.dedupe_x(scored["x"]),
+    })
+    clustered, _ = measure("cluster", lambda: cluster.merge_clusters(deduped))
+
+    report = schema.create_report("benchmark", from_date, to_date, "both", "mock", "mock")
+    report.reddit = clustered["reddit"]
+    report.x = clustered["x"]
+    measure("render", lambda: (render.render_compact(report), render.render_context_snippet(report)))
+    measure("store", lambda: _store_findings(db_path, report, deduped))
+
+
+def _count(result: Any) -> Optional[int]:
+    if isinstance(result, dict):
+        return sum(len(v) for v in result.values() if isinstance(v, list))
+    if isinstance(result, tuple) and result and isinstance(result[0], dict):
+        return _count(result[0])
+    if isinstance(result, int):
+        return result
+    return None
+
+
+def benchmark_size(n: int, repeat: int, memory: bool, seed: int = 0) -> Dict[str, Dict[str, Any]]:
+    """Time (and optionally trace) every stage for n synthetic items."""
+    from_date, to_date = dates.get_date_range(30)
+    raw = synthesize_items(n, from_date, to_date, seed)
+    results: Dict[str, Dict[str, Any]] = {stage: {} for stage in STAGES}
+
+    def timed(stage, fn):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        entry = results[stage]
+        entry["seconds"] = min(entry.get("seconds", elapsed), elapsed)
+        entry["items_out"] = _count(result)
+        return result
+
+    def traced(stage, fn):
+        tracemalloc.start()
+        try:
+            result = fn()
+            results[stage]["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        return result
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Stages mutate their input, so every pass starts from fresh items
+        for i in range(max(1, repeat)):
+            run_pipeline(_copy_raw(raw), from_date, to_date, timed, Path(tmp) / f"time{i}.db")
+        if memory:
+            run_pipeline(_copy_raw(raw), from_date, to_date, traced, Path(tmp) / "trace.db")
+
+    for entry in results.values():
+        entry["seconds"] = round(entry["seconds"], 6)
+    return results
+
+
+def _copy_raw(raw: Dict[str, List[dict]]) -> Dict[str, List[dict]]:
+    return {source: [dict(item) for item in items] for source, items in raw.items()}
+
+
+def compare(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[Dict[str, Any]]:
+    """Stages that got slower than the baseline beyond tolerance and noise.
+
+    Only sizes and stages present in both reports are compared.
+    """
+    regressions = []
+    for size, stages in report.get("sizes", {}).items():
+        base_stages = baseline.get("sizes", {}).get(size, {})
+        for stage, entry in stages.items():
+            base = base_stages.get(stage)
+            if not base or "seconds" not in base:
+                continue
+            current, previous = entry["seconds"], base["seconds"]
+            if current > previous * (1 + tolerance) and current - previous > NOISE_FLOOR_SECONDS:
+                regressions.append({
+                    "size": size,
+                    "stage": stage,
+                    "seconds": current,
+                    "baseline_seconds": previous,
+                    "ratio": round(current / previous, 2) if previous else None,
+                })
+    return regressions
+
+
+# findings_au as created by SCHEMA_V1, before migration 3 narrowed it
+_FTS_TRIGGER_V1 = """
+DROP TRIGGER IF EXISTS findings_au;
+CREATE TRIGGER findings_au AFTER UPDATE ON findings BEGIN
+    INSERT INTO findings_fts(findings_fts, rowid, content, summary, source_title, author)
+    VALUES ('delete', old.id, old.content, old.summary, old.source_title, old.author);
+    INSERT INTO findings_fts(rowid, content, summary, source_title, author)
+    VALUES (new.id, new.content, new.summary, new.source_title, new.author);
+END;
+"""
+
+
+def measure_resighting_writes(n: int, legacy_trigger: bool = False) -> Dict[str, Any]:
+    """Write cost of re-sighting n stored findings (a second identical run).
+
+    Reports rows written per re-sighted finding (sqlite total_changes, which
+    counts FTS trigger writes), WAL bytes appended and wall time.
+
+    Args:
+        legacy_trigger: Use the pre-migration findings_au that reindexes FTS
+            on every UPDATE
+    """
+    findings = [
+        {
+            "source": "reddit",
+            "url": f"https://reddit.com/r/bench/comments/{i}",
+            "title": f"Benchmark thread {i} about {' '.join(VOCAB[i % len(VOCAB):][:3])}",
+            "author": "bench",
+            "content": " ".join(VOCAB) * 4,
+            "engagement_score": i % 500,
+        }
+        for i in range(n)
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "resighting.db"
+        store._db_override = db_path
+        try:
+            store.init_db(db_path)
+            topic_id = store.add_topic("benchmark")["id"]
+            store.store_findings(store.record_run(topic_id), topic_id, findings)
+            with store.connection() as conn:
+                if legacy_trigger:
+                    conn.executescript(_FTS_TRIGGER_V1)
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                run_id = store.record_run(topic_id)
+                wal_path = Path(f"{db_path}-wal")
+                wal_before = wal_path.stat().st_size if wal_path.exists() else 0
+                changes_before = conn.total_changes
+                start = time.perf_counter()
+                store.store_findings(run_id, topic_id, findings)
+                elapsed = time.perf_counter() - start
+                changes = conn.total_changes - changes_before
+                wal_after = wal_path.stat().st_size if wal_path.exists() else 0
+        finally:
+            store.close_connections()
+            store._db_override = None
+
+    return {
+        "findings": n,
+        "rows_written_per_finding": round(changes / max(1, n), 2),
+        "wal_bytes": wal_after - wal_before,
+        "seconds": round(elapsed, 6),
+    }
+
+
+def load_baseline(path: Optional[str]) -> Optional[Dict[str, Any]]:
+    """The report to compare against: path, else BASELINE_FILE if present."""
+    if path:
+        with open(path) as f:
+            return json.load(f)
+    if BASELINE_FILE.exists():
+        with open(BASELINE_FILE) as f:
+            return json.load(f)
+    return None
+
+
+def _print_table(report: Dict[str, Any]):
+    sys.stderr.write(f"{'items':>8}  {'stage':<10} {'seconds':>10} {'peak KiB':>10} {'out':>8}\n")
+    for size, stages in report["sizes"].items():
+        for stage in STAGES:
+            entry = stages[stage]
+            peak = entry.get("peak_bytes")
+            sys.stderr.write(
+                f"{size:>8}  {stage:<10} {entry['seconds']:>10.4f} "
+                f"{(peak // 1024) if peak is not None else '-':>10} "
+                f"{entry.get('items_out') if entry.get('items_out') is not None else '-':>8}\n"
+            )
+    sys.stderr.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the last30days pipeline on fixture data")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(n) for n in DEFAULT_SIZES),
+        help="Comma-separated item counts (default: 100,1000)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per size; the best is kept")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc pass")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for synthetic items")
+    parser.add_argument("--output", help="Write the JSON report to this file (default: stdout)")
+    parser.add_argument(
+        "--baseline",
+        help="Compare against a previous JSON report (default: fixtures/benchmark_baseline.json if present)",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write this run to fixtures/benchmark_baseline.json instead of comparing",
+    )
+    parser.add_argument(
+        "--store-writes",
+        type=int,
+        metavar="N",
+        help="Only measure re-sighting write amplification for N findings, before and after the FTS trigger migration",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Allowed slowdown vs baseline as a fraction (default: 0.25)",
+    )
+    args = parser.parse_args()
+
+    if args.store_writes:
+        print(json.dumps({
+            "before": measure_resighting_writes(args.store_writes, legacy_trigger=True),
+            "after": measure_resighting_writes(args.store_writes),
+        }, indent=2))
+        return
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    report = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "seed": args.seed,
+        "sizes": {},
+    }
+    for n in sizes:
+        sys.stderr.write(f"[bench] {n} items...\n")
+        sys.stderr.flush()
+        report["sizes"][str(n)] = benchmark_size(n, args.repeat, not args.no_memory, args.seed)
+
+    _print_table(report)
+
+    regressions = []
+    baseline = None if args.update_baseline else load_baseline(args.baseline)
+    if baseline is not None:
+        regressions = compare(report, baseline, args.tolerance)
+        report["regressions"] = regressions
+        for r in regressions:
+            sys.stderr.write(
+                f"[bench] REGRESSION {r['stage']} @ {r['size']} items: "
+                f"{r['seconds']:.4f}s vs {r['baseline_seconds']:.4f}s baseline\n"
+            )
+
+    output = json.dumps(report, indent=2)
+    if args.update_baseline:
+        with open(BASELINE_FILE, "w") as f:
+            f.write(output + "\n")
+        sys.stderr.write(f"[bench] baseline written to {BASELINE_FILE}\n")
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
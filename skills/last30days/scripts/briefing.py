@@ -142,7 +142,7 @@ def generate_weekly() -> dict:
     week_ago = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
     two_weeks_ago = (datetime.now() - timedelta(days=14)).strftime("%Y-%m-%d")
 
-    topics = store.list_topics()
+    topics = store.get_weekly_rollup(week_ago, two_weeks_ago)
     if not topics:
         return {"status": "no_topics", "message": "No watchlist topics."}
 
@@ -152,24 +152,8 @@ def generate_weekly() -> dict:
         if not topic["enabled"]:
             continue
 
-        # This week's findings
-        this_week = store.get_new_findings(topic["id"], week_ago)
-
-        # Last week's findings (for comparison)
-        conn = store._connect()
-        try:
-            last_week_rows = conn.execute(
-                """SELECT * FROM findings
-                   WHERE topic_id = ? AND first_seen >= ? AND first_seen < ? AND dismissed = 0
-                   ORDER BY engagement_score DESC""",
-                (topic["id"], two_weeks_ago, week_ago),
-            ).fetchall()
-            last_week = [dict(r) for r in last_week_rows]
-        finally:
-            conn.close()
-
-        this_engagement = sum(f.get("engagement_score", 0) for f in this_week)
-        last_engagement = sum(f.get("engagement_score", 0) for f in last_week)
+        this_engagement = topic["this_week_engagement"]
+        last_engagement = topic["last_week_engagement"]
 
         # Trend calculation
         if last_engagement > 0:
@@ -179,12 +163,13 @@ def generate_weekly() -> dict:
 
         weekly_topics.append({
             "name": topic["name"],
-            "this_week_count": len(this_week),
-            "last_week_count": len(last_week),
+            "this_week_count": topic["this_week_count"],
+            "last_week_count": topic["last_week_count"],
             "this_week_engagement": this_engagement,
             "last_week_engagement": last_engagement,
             "engagement_change_pct": round(engagement_change, 1),
-            "top_findings": this_week[:5],  # Top 5 by engagement (already sorted)
+            # 5 most recent this week
+            "top_findings": store.get_new_findings(topic["id"], week_ago, limit=5),
         })
 
     result = {
@@ -241,10 +226,12 @@ def main():
     args = parser.parse_args()
 
     if args.command == "generate":
-        if args.weekly:
-            result = generate_weekly()
-        else:
-            result = generate_daily(since=args.since)
+        # One database connection for every query in the briefing
+        with store.connection():
+            if args.weekly:
+                result = generate_weekly()
+            else:
+                result = generate_daily(since=args.since)
         print(json.dumps(result, indent=2, default=str))
 
     elif args.command == "show":
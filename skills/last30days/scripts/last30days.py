@@ -7,25 +7,41 @@ Usage:
 
 Options:
     --mock              Use fixtures instead of real API calls
-    --emit=MODE         Output mode: compact|json|md|context|path (default: compact)
+    --emit=MODE         Output mode: compact|json|md|context|path|jsonl-stream (default: compact)
     --sources=MODE      Source selection: auto|reddit|x|both (default: auto)
     --quick             Faster research with fewer sources (8-12 each)
     --deep              Comprehensive research with more sources (50-70 Reddit, 40-60 X)
     --debug             Enable verbose debug logging
     --store             Persist findings to SQLite database
     --diagnose          Show source availability diagnostics and exit
+    --phase2=MODE       Phase 2 drill-downs: adaptive|barrier (default: adaptive)
+    --incremental       Reuse the last run's items and only fetch the new days
+    --topics-file=FILE  Research each topic in FILE in one process (JSON per line)
+    --max-tokens=N      Fit compact/context output into an N-token budget
 """
 
+# Annotations reference lazily imported lib modules (ui, schema), so they
+# must not be evaluated at definition time
+from __future__ import annotations
+
 import argparse
 import atexit
+import contextlib
+import functools
+import hashlib
+import importlib
 import json
 import os
+import queue
+import shutil
 import signal
 import sys
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait as wait_futures
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
 
 # Add lib to path
 SCRIPT_DIR = Path(__file__).parent.resolve()
@@ -80,7 +96,9 @@ def _install_global_timeout(timeout_seconds: int):
             sys.stderr.write(f"\n[TIMEOUT] Global timeout ({timeout_seconds}s) exceeded. Cleaning up.\n")
             sys.stderr.flush()
             _cleanup_children()
-            sys.exit(1)
+            # Exit now instead of joining source threads stuck in I/O
+            sys.stdout.flush()
+            os._exit(1)
         signal.signal(signal.SIGALRM, _handler)
         signal.alarm(timeout_seconds)
     else:
@@ -94,25 +112,119 @@ def _install_global_timeout(timeout_seconds: int):
         timer.daemon = True
         timer.start()
 
-from lib import (
-    bird_x,
-    dates,
-    dedupe,
-    entity_extract,
-    env,
-    http,
-    models,
-    normalize,
-    openai_reddit,
-    reddit_enrich,
-    render,
-    schema,
-    score,
-    ui,
-    websearch,
-    xai_x,
-    youtube_yt,
-)
+
+class DaemonThreadPool(Executor):
+    """A ThreadPoolExecutor stand-in whose workers are daemon threads.
+
+    ThreadPoolExecutor workers are joined at interpreter exit, so a source
+    call stuck in I/O keeps the process alive long after its timeout fired.
+    Every pool whose stragglers may be abandoned (source jobs, enrichment,
+    Phase 2, research_many topics) uses this instead; tracked child
+    processes are still killed by the atexit hook.
+    """
+
+    def __init__(self, max_workers: int):
+        self._max_workers = max(1, max_workers)
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._idle = threading.Semaphore(0)
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._shutdown = False
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future: Future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            self._queue.put((future, fn, args, kwargs))
+            if not self._idle.acquire(blocking=False) and len(self._threads) < self._max_workers:
+                thread = threading.Thread(target=self._worker, daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        return future
+
+    def _worker(self):
+        while True:
+            work = self._queue.get()
+            if work is None:
+                return
+            future, fn, args, kwargs = work
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = fn(*args, **kwargs)
+                except BaseException as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+            del work, future
+            self._idle.release()
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                while True:
+                    try:
+                        work = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if work is not None:
+                        work[0].cancel()
+            for _ in self._threads:
+                self._queue.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+
+class _LazyModule:
+    """A lib module that is imported on first attribute access.
+
+    The CLI is short-lived and most invocations only touch a few adapters
+    (--diagnose needs env alone, --sources=reddit never loads the X or
+    YouTube adapters), so nothing under lib is imported at startup.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr: str):
+        module = self._module
+        if module is None:
+            module = self._module = importlib.import_module(f"lib.{self._name}")
+        return getattr(module, attr)
+
+    def __setattr__(self, attr: str, value):
+        if attr.startswith("_"):
+            object.__setattr__(self, attr, value)
+        else:
+            setattr(importlib.import_module(f"lib.{self._name}"), attr, value)
+
+
+bird_x = _LazyModule("bird_x")
+budget = _LazyModule("budget")
+cache = _LazyModule("cache")
+cluster = _LazyModule("cluster")
+dates = _LazyModule("dates")
+dedupe = _LazyModule("dedupe")
+entity_extract = _LazyModule("entity_extract")
+env = _LazyModule("env")
+http = _LazyModule("http")
+latency_stats = _LazyModule("latency_stats")
+models = _LazyModule("models")
+normalize = _LazyModule("normalize")
+openai_reddit = _LazyModule("openai_reddit")
+ratelimit = _LazyModule("ratelimit")
+reddit_enrich = _LazyModule("reddit_enrich")
+render = _LazyModule("render")
+schema = _LazyModule("schema")
+score = _LazyModule("score")
+timing = _LazyModule("timing")
+ui = _LazyModule("ui")
+websearch = _LazyModule("websearch")
+xai_x = _LazyModule("xai_x")
+youtube_yt = _LazyModule("youtube_yt")
 
 
 def load_fixture(name: str) -> dict:
@@ -132,9 +244,14 @@ def _search_reddit(
     to_date: str,
     depth: str,
     mock: bool,
+    fallback: bool = True,
 ) -> tuple:
     """Search Reddit via OpenAI (runs in thread).
 
+    Args:
+        fallback: Retry with a simpler and a subreddit-targeted query when
+            the search returns few items
+
     Returns:
         Tuple of (reddit_items, raw_openai, error)
     """
@@ -145,7 +262,8 @@ def _search_reddit(
         raw_openai = load_fixture("openai_sample.json")
     else:
         try:
-            raw_openai = openai_reddit.search_reddit(
+            raw_openai = ratelimit.paced(
+                "openai", openai_reddit.search_reddit,
                 config["OPENAI_API_KEY"],
                 selected_models["openai"],
                 topic,
@@ -164,11 +282,12 @@ def _search_reddit(
     reddit_items = openai_reddit.parse_reddit_response(raw_openai or {})
 
     # Quick retry with simpler query if few results
-    if len(reddit_items) < 5 and not mock and not reddit_error:
+    if fallback and len(reddit_items) < 5 and not mock and not reddit_error:
         core = openai_reddit._extract_core_subject(topic)
         if core.lower() != topic.lower():
             try:
-                retry_raw = openai_reddit.search_reddit(
+                retry_raw = ratelimit.paced(
+                    "openai", openai_reddit.search_reddit,
                     config["OPENAI_API_KEY"],
                     selected_models["openai"],
                     core,
@@ -185,10 +304,11 @@ def _search_reddit(
                 pass
 
     # Subreddit-targeted fallback if still < 3 results
-    if len(reddit_items) < 3 and not mock and not reddit_error:
+    if fallback and len(reddit_items) < 3 and not mock and not reddit_error:
         sub_query = openai_reddit._build_subreddit_query(topic)
         try:
-            sub_raw = openai_reddit.search_reddit(
+            sub_raw = ratelimit.paced(
+                "openai", openai_reddit.search_reddit,
                 config["OPENAI_API_KEY"],
                 selected_models["openai"],
                 sub_query,
@@ -235,7 +355,8 @@ def _search_x(
     # Use Bird if specified
     if x_source == "bird":
         try:
-            raw_response = bird_x.search_x(
+            raw_response = ratelimit.paced(
+                "bird", bird_x.search_x,
                 topic,
                 from_date,
                 to_date,
@@ -255,7 +376,8 @@ def _search_x(
 
     # Use xAI (original behavior)
     try:
-        raw_response = xai_x.search_x(
+        raw_response = ratelimit.paced(
+            "xai", xai_x.search_x,
             config["XAI_API_KEY"],
             selected_models["xai"],
             topic,
@@ -289,7 +411,8 @@ def _search_youtube(
     youtube_error = None
 
     try:
-        response = youtube_yt.search_and_transcribe(
+        response = ratelimit.paced(
+            "youtube", youtube_yt.search_and_transcribe,
             topic, from_date, to_date, depth=depth,
         )
     except Exception as e:
@@ -355,6 +478,23 @@ def _search_web(
     return raw_results, web_error
 
 
+# Phase 2 (adaptive): minimum items a single source must return before its
+# entities are trusted enough to start drill-downs ahead of the Phase 1 barrier
+SPECULATIVE_MIN_ITEMS = 5
+SUPPLEMENTAL_TIMEOUT = 30
+
+
+def _supplemental_caps(depth: str) -> tuple:
+    """Depth-dependent Phase 2 caps.
+
+    Returns:
+        Tuple of (max_handles, max_subreddits, count_per)
+    """
+    if depth == "default":
+        return 3, 3, 3
+    return 5, 5, 5  # deep
+
+
 def _run_supplemental(
     topic: str,
     reddit_items: list,
@@ -365,6 +505,7 @@ def _run_supplemental(
     x_source: str,
     progress: ui.ProgressDisplay = None,
     skip_reddit: bool = False,
+    tracer: Optional[timing.SpanTracer] = None,
 ) -> tuple:
     """Run Phase 2 supplemental searches based on entities from Phase 1.
 
@@ -381,19 +522,13 @@ def _run_supplemental(
         x_source: 'bird' or 'xai'
         progress: Optional progress display
         skip_reddit: If True, skip Reddit supplemental (e.g. rate-limited)
+        tracer: Optional SpanTracer; records phase2.reddit / phase2.x
 
     Returns:
         Tuple of (supplemental_reddit, supplemental_x)
     """
-    # Depth-dependent caps
-    if depth == "default":
-        max_handles = 3
-        max_subs = 3
-        count_per = 3
-    else:  # deep
-        max_handles = 5
-        max_subs = 5
-        count_per = 5
+    max_handles, max_subs, count_per = _supplemental_caps(depth)
+    tracer = tracer or timing.SpanTracer()
 
     # Extract entities from Phase 1 results
     entities = entity_extract.extract_entities(
@@ -426,62 +561,854 @@ def _run_supplemental(
     for item in x_items:
         existing_urls.add(item.get("url", ""))
 
-    # Run supplemental searches in parallel
-    reddit_future = None
-    x_future = None
+    # Run supplemental searches in parallel under loop-owned timeouts
+    submitted = time.perf_counter()
+    phase2_deadline = time.monotonic() + SUPPLEMENTAL_TIMEOUT
+    paced = functools.partial(ratelimit.paced, deadline=phase2_deadline)
+    jobs = []
+    if has_subs:
+        jobs.append(("reddit", None, paced, (
+            "reddit", openai_reddit.search_subreddits,
+            entities["reddit_subreddits"], topic, from_date, to_date, count_per,
+        ), SUPPLEMENTAL_TIMEOUT))
+    if has_handles:
+        jobs.append(("x", None, paced, (
+            "bird", bird_x.search_handles,
+            entities["x_handles"], topic, from_date, count_per,
+        ), SUPPLEMENTAL_TIMEOUT))
+
+    for kind, (raw, error) in sorted(_run_source_jobs(jobs).items()):
+        label = _SOURCE_LABELS[kind]
+        if isinstance(error, TimeoutError):
+            sys.stderr.write(f"[Phase 2] Supplemental {label} timed out ({SUPPLEMENTAL_TIMEOUT}s)\n")
+            continue
+        if error is not None:
+            sys.stderr.write(f"[Phase 2] Supplemental {label} error: {error}\n")
+            continue
+        # Filter out URLs already found in Phase 1
+        fresh = [item for item in raw if item.get("url", "") not in existing_urls]
+        if kind == "reddit":
+            supplemental_reddit = fresh
+        else:
+            supplemental_x = fresh
+        tracer.add(
+            f"phase2.{kind}", time.perf_counter() - submitted,
+            len(fresh), _payload_bytes(raw), start=submitted,
+        )
 
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        if has_subs:
-            reddit_future = executor.submit(
-                openai_reddit.search_subreddits,
-                entities["reddit_subreddits"],
-                topic,
-                from_date,
-                to_date,
-                count_per,
+    if supplemental_reddit or supplemental_x:
+        sys.stderr.write(
+            f"[Phase 2] +{len(supplemental_reddit)} Reddit, +{len(supplemental_x)} X\n"
+        )
+        sys.stderr.flush()
+
+    return supplemental_reddit, supplemental_x
+
+
+class SpeculativeSupplemental:
+    """Adaptive Phase 2: drill-downs fired per source while Phase 1 is running.
+
+    As soon as Reddit (or X via Bird) returns enough items, entities are
+    extracted from that source alone and one targeted search per subreddit /
+    handle is started in a dedicated pool. When Phase 1 is complete,
+    ``collect()`` re-ranks entities over all results, cancels drill-downs whose
+    entity no longer makes the cut, starts any newly ranked ones, and gathers
+    the rest. Most drill-downs are finished by then, so Phase 2 is no longer a
+    serial wait after Phase 1.
+
+    Unlike barrier mode, which makes one search_subreddits / search_handles
+    call for all entities, each entity is its own call so it can be started
+    and cancelled on its own. count_per applies per entity in both adapters,
+    so the same entities yield the same items; the difference is one paced
+    request per entity, each drawing its own token from the upstream bucket.
+    """
+
+    def __init__(
+        self,
+        topic: str,
+        from_date: str,
+        to_date: str,
+        depth: str,
+        x_source: str,
+    ):
+        self.topic = topic
+        self.from_date = from_date
+        self.to_date = to_date
+        self.x_source = x_source
+        self.max_handles, self.max_subs, self.count_per = _supplemental_caps(depth)
+        self._pool = DaemonThreadPool(self.max_handles + self.max_subs)
+        self._futures = {}  # (kind, entity) -> (future, submitted_at)
+        self._lock = threading.Lock()
+
+    def on_items(self, source: str, items: list, stage: str):
+        """Phase 1 callback: start drill-downs from a single source's entities."""
+        if stage != "search" or len(items) < SPECULATIVE_MIN_ITEMS:
+            return
+        if source == "reddit":
+            entities = entity_extract.extract_entities(
+                items, [], max_handles=self.max_handles, max_subreddits=self.max_subs,
             )
+            self._start("reddit", entities["reddit_subreddits"])
+        elif source == "x" and self.x_source == "bird":
+            entities = entity_extract.extract_entities(
+                [], items, max_handles=self.max_handles, max_subreddits=self.max_subs,
+            )
+            self._start("x", entities["x_handles"])
+
+    def _start(self, kind: str, entities: list):
+        started = []
+        with self._lock:
+            for entity in entities:
+                key = (kind, entity)
+                if key in self._futures:
+                    continue
+                deadline = time.monotonic() + SUPPLEMENTAL_TIMEOUT
+                if kind == "reddit":
+                    future = self._pool.submit(
+                        ratelimit.paced, "reddit", openai_reddit.search_subreddits,
+                        [entity], self.topic, self.from_date, self.to_date, self.count_per,
+                        deadline=deadline,
+                    )
+                else:
+                    future = self._pool.submit(
+                        ratelimit.paced, "bird", bird_x.search_handles,
+                        [entity], self.topic, self.from_date, self.count_per,
+                        deadline=deadline,
+                    )
+                self._futures[key] = (future, time.monotonic())
+                started.append(entity)
+        if started:
+            prefix = "r/" if kind == "reddit" else "@"
+            sys.stderr.write(f"[Phase 2] Early drill into {prefix}{(', ' + prefix).join(started)}\n")
+            sys.stderr.flush()
 
-        if has_handles:
-            x_future = executor.submit(
-                bird_x.search_handles,
-                entities["x_handles"],
-                topic,
-                from_date,
-                count_per,
+    def collect(
+        self,
+        reddit_items: list,
+        x_items: list,
+        skip_reddit: bool = False,
+    ) -> tuple:
+        """Reconcile drill-downs against the full Phase 1 results and gather them.
+
+        Args:
+            reddit_items: All Phase 1 Reddit items (raw dicts)
+            x_items: All Phase 1 X items (raw dicts)
+            skip_reddit: If True, drop Reddit drill-downs (e.g. rate-limited)
+
+        Returns:
+            Tuple of (supplemental_reddit, supplemental_x)
+        """
+        entities = entity_extract.extract_entities(
+            reddit_items, x_items,
+            max_handles=self.max_handles,
+            max_subreddits=self.max_subs,
+        )
+        wanted = set()
+        if not skip_reddit:
+            wanted.update(("reddit", sub) for sub in entities["reddit_subreddits"])
+        if self.x_source == "bird":
+            wanted.update(("x", handle) for handle in entities["x_handles"])
+
+        # Entities that only ranked once everything was in
+        self._start("reddit", [e for k, e in sorted(wanted) if k == "reddit"])
+        self._start("x", [e for k, e in sorted(wanted) if k == "x"])
+
+        with self._lock:
+            futures = dict(self._futures)
+
+        dropped = [key for key in futures if key not in wanted]
+        for key in dropped:
+            futures.pop(key)[0].cancel()
+        if dropped:
+            sys.stderr.write(
+                f"[Phase 2] Cancelled {len(dropped)} drill-down(s) that no longer rank\n"
             )
 
-        if reddit_future:
+        existing_urls = {item.get("url", "") for item in reddit_items}
+        existing_urls.update(item.get("url", "") for item in x_items)
+
+        # Each drill-down keeps the SUPPLEMENTAL_TIMEOUT it started with
+        now = time.monotonic()
+        outcomes = _await_futures({
+            key: (future, max(0, submitted_at + SUPPLEMENTAL_TIMEOUT - now))
+            for key, (future, submitted_at) in futures.items()
+        })
+
+        supplemental_reddit = []
+        supplemental_x = []
+        for (kind, entity), (raw, error) in sorted(outcomes.items()):
+            label = _SOURCE_LABELS[kind]
+            if isinstance(error, TimeoutError):
+                sys.stderr.write(
+                    f"[Phase 2] Supplemental {label} ({entity}) timed out ({SUPPLEMENTAL_TIMEOUT}s)\n"
+                )
+                continue
+            if error is not None:
+                sys.stderr.write(f"[Phase 2] Supplemental {label} ({entity}) error: {error}\n")
+                continue
+            target = supplemental_reddit if kind == "reddit" else supplemental_x
+            for item in raw:
+                url = item.get("url", "")
+                if url not in existing_urls:
+                    existing_urls.add(url)
+                    target.append(item)
+
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+        if supplemental_reddit or supplemental_x:
+            sys.stderr.write(
+                f"[Phase 2] +{len(supplemental_reddit)} Reddit, +{len(supplemental_x)} X\n"
+            )
+        sys.stderr.flush()
+
+        return supplemental_reddit, supplemental_x
+
+
+def _chain_callbacks(*callbacks) -> Optional[Callable]:
+    """Combine optional ``(source, items, stage)`` callbacks into one."""
+    active = [cb for cb in callbacks if cb]
+    if not active:
+        return None
+
+    def _chained(source: str, items: list, stage: str):
+        for cb in active:
+            cb(source, items, stage)
+
+    return _chained
+
+
+DELTA_SOURCES = ("reddit", "x", "youtube", "web")
+# Snapshot key on each cached item: the to_date of the run that first fetched it
+DELTA_FIRST_SEEN = "_delta_first_seen"
+
+
+def _delta_snapshot_path(topic: str, sources: str, depth: str) -> Path:
+    """Cache path for the raw items of the last --incremental run of a query.
+
+    The key is window-independent (dates are wildcards) so any earlier run of
+    the same topic/sources/depth can seed a shifted window.
+    """
+    key = cache.get_cache_key(topic, "*", "*", f"{sources}:{depth}:delta")
+    return cache.get_cache_path(key)
+
+
+def _load_delta_snapshot(path: Path, from_date: str, to_date: str) -> Optional[dict]:
+    """Load a delta snapshot if its window overlaps the start of this one."""
+    if not path.exists():
+        return None
+    try:
+        with open(path) as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None
+    # The cached window must cover from_date, otherwise the gap would be lost
+    if not snapshot.get("from_date", "") <= from_date <= snapshot.get("to_date", "") <= to_date:
+        return None
+    return snapshot
+
+
+def _merge_delta(cached: list, fresh: list, from_date: str) -> list:
+    """Merge cached raw items with freshly fetched ones.
+
+    Fresh items win on URL collisions (newer engagement numbers); cached items
+    dated before the new window are dropped. Undated items age out by the
+    DELTA_FIRST_SEEN stamp _save_delta_snapshot() gives them, so the merge
+    holds what a cold run over the window could still return.
+    """
+    fresh_urls = {item.get("url") for item in fresh}
+    kept = [
+        item for item in cached
+        if item.get("url") not in fresh_urls
+        and (item.get("date") or item.get(DELTA_FIRST_SEEN, "")) >= from_date
+    ]
+    return list(fresh) + kept
+
+
+def _save_delta_snapshot(path: Path, from_date: str, to_date: str, items: dict):
+    """Persist raw per-source items for the next --incremental run.
+
+    Items not stamped yet get DELTA_FIRST_SEEN = to_date (the day they were
+    first fetched). Failures are ignored: the next run just fetches the
+    full window.
+    """
+    snapshot = {
+        "from_date": from_date,
+        "to_date": to_date,
+        "saved_at": datetime.now(timezone.utc).isoformat(),
+        **{
+            source: [
+                {**item, DELTA_FIRST_SEEN: item.get(DELTA_FIRST_SEEN) or to_date}
+                for item in items.get(source, [])
+            ]
+            for source in DELTA_SOURCES
+        },
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot, f, default=str)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        sys.stderr.write(f"[delta] Could not save snapshot: {e}\n")
+        sys.stderr.flush()
+
+
+def _process_source(
+    source: str,
+    items: list,
+    from_date: str,
+    to_date: str,
+    tracer: Optional[timing.SpanTracer] = None,
+) -> list:
+    """Normalize, date-filter, score, sort and dedupe one source's raw items.
+
+    Args:
+        source: 'reddit', 'x', 'youtube' or 'web'
+        items: Raw item dicts as returned by the source search
+        from_date: Start date
+        to_date: End date
+        tracer: Optional SpanTracer; records <source>.normalize/score/dedupe
+
+    Returns:
+        Ranked, deduplicated schema items
+    """
+    if not items:
+        return []
+    tracer = tracer or timing.SpanTracer()
+
+    if source == "reddit":
+        with tracer.span("reddit.normalize") as span:
+            normalized = normalize.normalize_reddit_items(items, from_date, to_date)
+            # Hard date filter: exclude items with verified dates outside the range
+            # This is the safety net - even if prompts let old content through, this filters it
+            filtered = normalize.filter_by_date_range(normalized, from_date, to_date)
+            span["items"] = len(filtered)
+        with tracer.span("reddit.score") as span:
+            ranked = score.sort_items(score.score_reddit_items(filtered))
+            span["items"] = len(ranked)
+        with tracer.span("reddit.dedupe") as span:
+            deduped = dedupe.dedupe_reddit(ranked)
+            span["items"] = len(deduped)
+
+        # Minimum result guarantee: if all Reddit results were filtered out but
+        # we had raw results, keep top 3 by relevance regardless of score
+        if not deduped and normalized:
+            print("[REDDIT WARNING] All results scored below threshold, keeping top 3 by relevance", file=sys.stderr)
+            by_relevance = sorted(normalized, key=lambda item: item.relevance, reverse=True)
+            deduped = by_relevance[:3]
+        return deduped
+
+    if source == "x":
+        with tracer.span("x.normalize") as span:
+            normalized = normalize.normalize_x_items(items, from_date, to_date)
+            filtered = normalize.filter_by_date_range(normalized, from_date, to_date)
+            span["items"] = len(filtered)
+        with tracer.span("x.score") as span:
+            ranked = score.sort_items(score.score_x_items(filtered))
+            span["items"] = len(ranked)
+        with tracer.span("x.dedupe") as span:
+            deduped = dedupe.dedupe_x(ranked)
+            span["items"] = len(deduped)
+        return deduped
+
+    if source == "youtube":
+        # YouTube: skip hard date filter — youtube_yt.py already applies a soft filter
+        # that prefers recent videos but keeps older ones for evergreen topics.
+        # YouTube content has a longer shelf life than tweets/posts.
+        with tracer.span("youtube.normalize") as span:
+            normalized = normalize.normalize_youtube_items(items, from_date, to_date)
+            span["items"] = len(normalized)
+        with tracer.span("youtube.score") as span:
+            ranked = score.sort_items(score.score_youtube_items(normalized))
+            span["items"] = len(ranked)
+        with tracer.span("youtube.dedupe") as span:
+            deduped = dedupe.dedupe_youtube(ranked)
+            span["items"] = len(deduped)
+        return deduped
+
+    if source == "web":
+        with tracer.span("web.normalize") as span:
+            normalized = websearch.normalize_websearch_items(items, from_date, to_date)
+            filtered = normalize.filter_by_date_range(normalized, from_date, to_date)
+            span["items"] = len(filtered)
+        with tracer.span("web.score") as span:
+            ranked = score.sort_items(score.score_websearch_items(filtered)) if filtered else []
+            span["items"] = len(ranked)
+        with tracer.span("web.dedupe") as span:
+            deduped = websearch.dedupe_websearch(ranked) if ranked else []
+            span["items"] = len(deduped)
+        return deduped
+
+    raise ValueError(f"Unknown source: {source}")
+
+
+class JsonlStream:
+    """Writes ranked partial results as JSON lines while sources are still running.
+
+    Used by --emit=jsonl-stream. Each time a source lands (or is updated by
+    enrichment / Phase 2), its items are pushed through the same
+    normalize -> score -> dedupe path as the final report and written as one
+    line, so consumers can start reading Reddit while X or YouTube is still
+    in flight. The last line is always the full report: the stream closes
+    once it is written, and partial results from sources that were given up
+    on but finish later are dropped.
+    """
+
+    def __init__(self, from_date: str, to_date: str, out=None):
+        self.from_date = from_date
+        self.to_date = to_date
+        self.out = out or sys.stdout
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def emit_items(self, source: str, items: list, stage: str = "search"):
+        """Rank one source's raw items and write them as a partial result."""
+        if self._closed:
+            return
+        ranked = _process_source(source, list(items), self.from_date, self.to_date)
+        self._write({
+            "type": "partial",
+            "source": source,
+            "stage": stage,
+            "count": len(ranked),
+            "items": [item.to_dict() for item in ranked],
+        })
+
+    def emit_report(
+        self,
+        report: schema.Report,
+        web_needed: bool = False,
+        corroboration: dict = None,
+        timings: dict = None,
+    ):
+        """Write the final merged report and close the stream."""
+        self._write({
+            "type": "report",
+            "web_needed": web_needed,
+            "report": report.to_dict(),
+            "corroboration": corroboration or {},
+            "timings": timings or {},
+        }, close=True)
+
+    def _write(self, record: dict, close: bool = False):
+        line = json.dumps(record, default=str)
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = close
+            self.out.write(line + "\n")
+            self.out.flush()
+
+
+def _payload_bytes(payload: Any) -> int:
+    """Size of a payload serialized as JSON (0 if empty)."""
+    if not payload:
+        return 0
+    return len(json.dumps(payload, default=str).encode())
+
+
+_SOURCE_LABELS = {"reddit": "Reddit", "x": "X", "youtube": "YouTube", "web": "Web"}
+
+# Max concurrent source calls per upstream, shared by every research run in
+# the process (matters once several topics run side by side)
+UPSTREAM_CONCURRENCY = {"bird": 2, "youtube": 2}
+DEFAULT_UPSTREAM_CONCURRENCY = 4
+_upstream_slots: dict = {}
+_upstream_slots_lock = threading.Lock()
+
+
+def _upstream_slot(upstream: str) -> threading.BoundedSemaphore:
+    """Process-wide concurrency slot for an upstream (openai, xai, bird, ...)."""
+    with _upstream_slots_lock:
+        slot = _upstream_slots.get(upstream)
+        if slot is None:
+            limit = UPSTREAM_CONCURRENCY.get(upstream, DEFAULT_UPSTREAM_CONCURRENCY)
+            slot = _upstream_slots[upstream] = threading.BoundedSemaphore(limit)
+        return slot
+
+
+# Retries per enrichment fetch after a 429 (each waits out the backoff)
+ENRICH_RATE_LIMIT_RETRIES = 1
+
+
+def _latency_stats() -> latency_stats.LatencyStats:
+    """Search latency history, kept next to the model selection cache."""
+    return latency_stats.LatencyStats(Path(cache.MODEL_CACHE_FILE).parent / "latency_stats.json")
+
+
+async def _gather_source_jobs(
+    jobs: list,
+    on_done: Optional[Callable],
+    concurrency: Optional[int] = None,
+    total_timeout: Optional[float] = None,
+) -> dict:
+    """Run blocking source adapters concurrently under loop-owned timeouts."""
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + total_timeout if total_timeout is not None else None
+    slots = asyncio.Semaphore(concurrency) if concurrency else None
+    # The adapters block (urllib / subprocess), so they run on a private pool
+    # that is abandoned, not joined, when the loop gives up on them. Hedged
+    # jobs may need a second thread each; threads start only when needed.
+    executor = DaemonThreadPool(len(jobs) * 2)
+
+    async def _run(name, upstream, func, args, timeout, hedge_after=None):
+        def _call():
+            with _upstream_slot(upstream) if upstream else contextlib.nullcontext():
+                return func(*args)
+        acquired = False
+        try:
+            if slots:
+                # A queued job's own timeout starts once it has a slot
+                await asyncio.wait_for(
+                    slots.acquire(), deadline - loop.time() if deadline is not None else None,
+                )
+                acquired = True
+            if deadline is not None:
+                timeout = min(timeout, deadline - loop.time())
+            primary = loop.run_in_executor(executor, _call)
+            if not hedge_after or hedge_after >= timeout:
+                value = await asyncio.wait_for(primary, timeout)
+                return name, value, None
+            # Slow tail: after hedge_after, race a second identical request
+            # and take whichever answers first
+            done, _ = await asyncio.wait({primary}, timeout=hedge_after)
+            if not done:
+                backup = loop.run_in_executor(executor, _call)
+                done, pending = await asyncio.wait(
+                    {primary, backup},
+                    timeout=timeout - hedge_after,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for future in pending:
+                    future.cancel()
+                if not done:
+                    raise TimeoutError()
+            return name, done.pop().result(), None
+        except Exception as e:  # includes TimeoutError from wait_for
+            return name, None, e
+        finally:
+            if acquired:
+                slots.release()
+
+    results = {}
+    tasks = [asyncio.ensure_future(_run(*job)) for job in jobs]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            name, value, error = await next_done
+            results[name] = (value, error)
+            if on_done and on_done(name, value, error) is True:
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        executor.shutdown(wait=False, cancel_futures=True)
+    return results
+
+
+def _run_on_loop(coro_fn: Callable, *args):
+    """Run coro_fn(*args) to completion on a fresh event loop."""
+    # asyncio is a large share of cold start and only needed once sources run
+    import asyncio
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro_fn(*args))
+    finally:
+        loop.close()
+
+
+def _run_source_jobs(
+    jobs: list,
+    on_done: Optional[Callable] = None,
+    concurrency: Optional[int] = None,
+    total_timeout: Optional[float] = None,
+) -> dict:
+    """Run blocking source jobs on one event loop.
+
+    Used for the Phase 1 sources, Reddit enrichment and barrier-mode Phase 2.
+
+    Args:
+        jobs: List of (name, upstream, func, args, timeout[, hedge_after]);
+            upstream names the process-wide slot the call holds (None for
+            none), timeout counts from when the job starts, and a job with
+            hedge_after fires a second identical call if the first has not
+            answered after that many seconds
+        on_done: Optional ``on_done(name, value, error)`` called as each job
+            finishes (on the calling thread); returning True cancels the
+            jobs still running, which are left out of the result
+        concurrency: Jobs run at a time (default: all at once); the rest
+            wait in order, and their timeout does not run while they wait
+        total_timeout: Optional cap on the whole run from the start of the
+            loop; jobs still waiting or running then fail with TimeoutError
+
+    Returns:
+        Dict of name -> (value, error); error is a TimeoutError when the job
+        exceeded its timeout or the total timeout
+    """
+    if not jobs:
+        return {}
+    return _run_on_loop(_gather_source_jobs, jobs, on_done, concurrency, total_timeout)
+
+
+async def _gather_futures(futures: dict) -> dict:
+    """Await running futures concurrently, each under its own loop timeout."""
+    import asyncio
+
+    async def _one(key, future, timeout):
+        try:
+            # wait_for(..., 0) times out even on a finished future, and a
+            # drill-down that finished while Phase 1 ran has no time left
+            if future.done():
+                return key, future.result(), None
+            return key, await asyncio.wait_for(asyncio.wrap_future(future), timeout), None
+        except Exception as e:  # includes TimeoutError from wait_for
+            return key, None, e
+
+    results = {}
+    for next_done in asyncio.as_completed([_one(key, *entry) for key, entry in futures.items()]):
+        key, value, error = await next_done
+        results[key] = (value, error)
+    return results
+
+
+def _await_futures(futures: dict) -> dict:
+    """Wait for already-running futures on one event loop.
+
+    Args:
+        futures: Dict of key -> (concurrent.futures.Future, timeout in seconds)
+
+    Returns:
+        Dict of key -> (value, error); error is a TimeoutError when the future
+        did not finish in time (it is cancelled if it had not started)
+    """
+    if not futures:
+        return {}
+    return _run_on_loop(_gather_futures, futures)
+
+
+# Concurrent Reddit thread fetches during enrichment
+ENRICH_CONCURRENCY = 5
+
+# Provisional score weights used to order enrichment (before real scoring)
+ENRICH_PRIORITY_WEIGHTS = {"relevance": 0.45, "recency": 0.25, "engagement": 0.30}
+
+
+def _enrich_priority(reddit_items: list) -> List[int]:
+    """Indices of raw Reddit items, most promising first.
+
+    Cheap provisional score from search relevance, recency and (when the
+    search already returned it) engagement, so the enrichment budget goes to
+    items likely to rank in the final report. Ties keep search order.
+    """
+    engagement = []
+    for item in reddit_items:
+        eng = item.get("engagement")
+        raw = None
+        if isinstance(eng, dict):
             try:
-                raw_reddit = reddit_future.result(timeout=30)
-                # Filter out URLs already found in Phase 1
-                supplemental_reddit = [
-                    item for item in raw_reddit
-                    if item.get("url", "") not in existing_urls
-                ]
-            except TimeoutError:
-                sys.stderr.write("[Phase 2] Supplemental Reddit timed out (30s)\n")
-            except Exception as e:
-                sys.stderr.write(f"[Phase 2] Supplemental Reddit error: {e}\n")
+                raw = score.compute_reddit_engagement_raw(schema.Engagement(**eng))
+            except TypeError:
+                raw = None
+        engagement.append(raw)
+    max_engagement = max((e for e in engagement if e), default=0)
+
+    weights = ENRICH_PRIORITY_WEIGHTS
+    provisional = []
+    for item, raw in zip(reddit_items, engagement):
+        value = (
+            weights["relevance"] * 100 * float(item.get("relevance") or 0)
+            + weights["recency"] * dates.recency_score(item.get("date"))
+        )
+        if max_engagement:
+            value += weights["engagement"] * 100 * (raw or 0) / max_engagement
+        provisional.append(value)
+
+    return sorted(range(len(reddit_items)), key=lambda i: (-provisional[i], i))
+
+
+def _enrich_reddit(
+    reddit_items: list,
+    timeouts: dict,
+    mock: bool,
+    progress: ui.ProgressDisplay = None,
+    tracer: Optional[timing.SpanTracer] = None,
+) -> tuple:
+    """Enrich Reddit items with real thread data (parallel, capped).
+
+    Items are enriched in _enrich_priority() order, so when the budget runs
+    out the unenriched ones are the least promising. Fetches run as
+    _run_source_jobs() jobs (ENRICH_CONCURRENCY at a time), paced by the
+    shared "reddit" token bucket. The loop enforces both budgets: each fetch
+    gets ``enrich_per`` seconds from when it starts and all of them together
+    ``enrich_total``. A 429 pauses the bucket for its Retry-After and the
+    fetch is retried once; enrichment stops when a backoff would outlast the
+    total budget. Items whose fetch timed out or never ran are kept as-is.
+    With a tracer, each fetch is recorded as a reddit.enrich_fetch span.
+
+    Returns:
+        Tuple of (reddit_items, raw_reddit_enriched, rate_limited)
+    """
+    enrich_max = timeouts["enrich_max_items"]
+    enrich_per_timeout = timeouts["enrich_per"]
+    enrich_total_timeout = timeouts["enrich_total"]
+    enrich_order = _enrich_priority(reddit_items)[:enrich_max]
+    items_to_enrich = [reddit_items[i] for i in enrich_order]
+    raw_reddit_enriched = []
+    rate_limited = False  # Set True if Reddit returns 429 during enrichment
+
+    if not items_to_enrich:
+        return reddit_items, raw_reddit_enriched, rate_limited
+
+    if progress:
+        progress.start_reddit_enrich(1, len(items_to_enrich))
 
-        if x_future:
+    if mock:
+        # Sequential mock enrichment (fast, no need for parallelism)
+        for n, i in enumerate(enrich_order):
+            item = reddit_items[i]
+            if progress and n > 0:
+                progress.update_reddit_enrich(n + 1, len(items_to_enrich))
             try:
-                raw_x = x_future.result(timeout=30)
-                supplemental_x = [
-                    item for item in raw_x
-                    if item.get("url", "") not in existing_urls
-                ]
-            except TimeoutError:
-                sys.stderr.write("[Phase 2] Supplemental X timed out (30s)\n")
+                mock_thread = load_fixture("reddit_thread_sample.json")
+                reddit_items[i] = reddit_enrich.enrich_reddit_item(item, mock_thread)
             except Exception as e:
-                sys.stderr.write(f"[Phase 2] Supplemental X error: {e}\n")
+                if progress:
+                    progress.show_error(f"Enrich failed for {item.get('url', 'unknown')}: {e}")
+            raw_reddit_enriched.append(reddit_items[i])
+    else:
+        # Parallel enrichment with bounded concurrency and total timeout
+        # Uses short HTTP timeout (10s) and 1 retry to fail fast on 429
+        completed_count = 0
+        deadline = time.monotonic() + enrich_total_timeout
+
+        def _fetch(item):
+            for attempt in range(ENRICH_RATE_LIMIT_RETRIES + 1):
+                start = time.perf_counter()
+                try:
+                    enriched = ratelimit.paced("reddit", reddit_enrich.enrich_reddit_item, item, deadline=deadline)
+                    break
+                except reddit_enrich.RedditRateLimitError:
+                    # paced() paused the bucket; the retry waits out the backoff
+                    if attempt == ENRICH_RATE_LIMIT_RETRIES:
+                        raise
+            if tracer:
+                tracer.add("reddit.enrich_fetch", time.perf_counter() - start,
+                           1, _payload_bytes(enriched), start=start)
+            return enriched
+
+        timed_out = 0
+
+        def _on_fetched(idx, value, error):
+            nonlocal completed_count, rate_limited, timed_out
+            if isinstance(error, TimeoutError):
+                # Keep unenriched items as-is
+                timed_out += 1
+                raw_reddit_enriched.append(reddit_items[idx])
+                return False
+            completed_count += 1
+            if progress:
+                progress.update_reddit_enrich(completed_count, len(items_to_enrich))
+            if isinstance(error, (reddit_enrich.RedditRateLimitError, ratelimit.RateBudgetExceeded)):
+                rate_limited = True
+                if progress:
+                    progress.show_error(
+                        "Reddit rate-limited (429) — skipping remaining enrichment"
+                    )
+                return True
+            if error is not None:
+                if progress:
+                    progress.show_error(
+                        f"Enrich failed for {reddit_items[idx].get('url', 'unknown')}: {error}"
+                    )
+            else:
+                reddit_items[idx] = value
+            raw_reddit_enriched.append(reddit_items[idx])
+            return False
+
+        # Both budgets are hard caps enforced by the loop; stragglers are
+        # abandoned, not waited on
+        _run_source_jobs(
+            [(i, None, _fetch, (reddit_items[i],), enrich_per_timeout) for i in enrich_order],
+            on_done=_on_fetched,
+            concurrency=ENRICH_CONCURRENCY,
+            total_timeout=enrich_total_timeout,
+        )
+        if timed_out and progress:
+            progress.show_error(
+                f"Enrichment timed out for {timed_out} item(s) "
+                f"({enrich_per_timeout}s each, {enrich_total_timeout}s total; "
+                f"{completed_count}/{len(items_to_enrich)} done)"
+            )
 
-    if supplemental_reddit or supplemental_x:
-        sys.stderr.write(
-            f"[Phase 2] +{len(supplemental_reddit)} Reddit, +{len(supplemental_x)} X\n"
+    if progress:
+        progress.end_reddit_enrich()
+
+    return reddit_items, raw_reddit_enriched, rate_limited
+
+
+def _search_and_enrich_reddit(
+    topic: str,
+    config: dict,
+    selected_models: dict,
+    from_date: str,
+    to_date: str,
+    depth: str,
+    mock: bool,
+    timeouts: dict,
+    progress: ui.ProgressDisplay = None,
+    on_items: Optional[Callable] = None,
+    searched: Optional[threading.Event] = None,
+    latency: Optional[latency_stats.LatencyStats] = None,
+    tracer: Optional[timing.SpanTracer] = None,
+    fallback: bool = True,
+) -> tuple:
+    """Search Reddit, then enrich the results right away (runs in thread).
+
+    Enrichment starts as soon as the search returns instead of waiting for
+    the X/YouTube/web searches, so it overlaps with the rest of Phase 1.
+
+    Args:
+        searched: Optional event set once the search itself has finished
+        latency: Optional LatencyStats; records the search time only, since
+            enrichment has its own budget
+        tracer: Optional SpanTracer; records reddit.search and reddit.enrich
+        fallback: Passed to _search_reddit()
+
+    Returns:
+        Tuple of (reddit_items, raw_openai, error, raw_reddit_enriched, rate_limited)
+    """
+    tracer = tracer or timing.SpanTracer()
+    search_start = time.monotonic()
+    with tracer.span("reddit.search") as span:
+        reddit_items, raw_openai, reddit_error = _search_reddit(
+            topic, config, selected_models, from_date, to_date, depth, mock, fallback,
         )
-        sys.stderr.flush()
+        span["items"] = len(reddit_items)
+        span["bytes"] = _payload_bytes(raw_openai)
+    if latency and not reddit_error:
+        latency.record(depth, "reddit", time.monotonic() - search_start)
+    if searched:
+        searched.set()
+    if progress:
+        if reddit_error:
+            progress.show_error(f"Reddit error: {reddit_error}")
+        progress.end_reddit(len(reddit_items))
+    if on_items and reddit_items:
+        on_items("reddit", reddit_items, "search")
+
+    with tracer.span("reddit.enrich") as span:
+        reddit_items, raw_reddit_enriched, rate_limited = _enrich_reddit(
+            reddit_items, timeouts, mock, progress, tracer,
+        )
+        span["items"] = len(raw_reddit_enriched)
+    if on_items and raw_reddit_enriched:
+        on_items("reddit", reddit_items, "enriched")
 
-    return supplemental_reddit, supplemental_x
+    return reddit_items, raw_openai, reddit_error, raw_reddit_enriched, rate_limited
 
 
 def run_research(
@@ -497,9 +1424,31 @@ def run_research(
     x_source: str = "xai",
     run_youtube: bool = False,
     timeouts: dict = None,
+    on_items: Optional[Callable] = None,
+    phase2: str = "adaptive",
+    latency: Optional[latency_stats.LatencyStats] = None,
+    tracer: Optional[timing.SpanTracer] = None,
+    incremental: bool = False,
 ) -> tuple:
     """Run the research pipeline.
 
+    Args:
+        timeouts: Timeout profile; LatencyStats.timeouts() adds learned
+            per-source "<source>_future" timeouts and "hedge_after"
+        on_items: Optional callback ``on_items(source, raw_items, stage)``
+            invoked as soon as a source's items land, and again when
+            enrichment or Phase 2 changes them (used by --emit=jsonl-stream)
+        phase2: 'adaptive' starts Phase 2 drill-downs per source while Phase 1
+            is still running; 'barrier' runs them after all of Phase 1
+        latency: Optional LatencyStats that Phase 1 search times are
+            recorded into (and saved) for future runs
+        tracer: Optional SpanTracer for per-stage timings (phase1, each
+            source search, enrichment, phase2)
+        incremental: The window only covers the days since the last
+            --incremental snapshot. Few results are expected there, so
+            Reddit's few-results fallback searches are skipped, and its
+            short-window latencies are not recorded into latency
+
     Returns:
         Tuple of (reddit_items, x_items, youtube_items, web_items, web_needed,
                   raw_openai, raw_xai, raw_reddit_enriched,
@@ -511,7 +1460,10 @@ def run_research(
     """
     if timeouts is None:
         timeouts = TIMEOUT_PROFILES[depth]
+    if incremental:
+        latency = None
     future_timeout = timeouts["future"]
+    tracer = tracer or timing.SpanTracer()
 
     reddit_items = []
     x_items = []
@@ -524,6 +1476,7 @@ def run_research(
     x_error = None
     youtube_error = None
     web_error = None
+    rate_limited = False  # Set True if Reddit returns 429 during enrichment
 
     # Determine web search mode
     do_web = sources in ("all", "web", "reddit-web", "x-web")
@@ -537,7 +1490,10 @@ def run_research(
             sys.stderr.write(f"[web] Searching via {web_backend}\n")
             sys.stderr.flush()
             try:
-                web_items, web_error = _search_web(topic, config, from_date, to_date, depth)
+                with tracer.span("web.search") as span:
+                    web_items, web_error = _search_web(topic, config, from_date, to_date, depth)
+                    span["items"] = len(web_items)
+                    span["bytes"] = _payload_bytes(web_items)
                 if web_error and progress:
                     progress.show_error(f"Web error: {web_error}")
             except Exception as e:
@@ -546,6 +1502,8 @@ def run_research(
                     progress.show_error(f"Web error: {e}")
             sys.stderr.write(f"[web] {len(web_items)} results\n")
             sys.stderr.flush()
+            if on_items and web_items:
+                on_items("web", web_items, "search")
         else:
             # No native backend — assistant handles WebSearch
             if progress:
@@ -556,7 +1514,10 @@ def run_research(
             if progress:
                 progress.start_youtube()
             try:
-                youtube_items, youtube_error = _search_youtube(topic, from_date, to_date, depth)
+                with tracer.span("youtube.search") as span:
+                    youtube_items, youtube_error = _search_youtube(topic, from_date, to_date, depth)
+                    span["items"] = len(youtube_items)
+                    span["bytes"] = _payload_bytes(youtube_items)
                 if youtube_error and progress:
                     progress.show_error(f"YouTube error: {youtube_error}")
             except Exception as e:
@@ -565,202 +1526,635 @@ def run_research(
                     progress.show_error(f"YouTube error: {e}")
             if progress:
                 progress.end_youtube(len(youtube_items))
+            if on_items and youtube_items:
+                on_items("youtube", youtube_items, "search")
         return reddit_items, x_items, youtube_items, web_items, web_needed, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error, youtube_error, web_error
 
     # Determine which searches to run
     do_reddit = sources in ("both", "reddit", "all", "reddit-web")
     do_x = sources in ("both", "x", "all", "x-web")
 
-    # Run Reddit, X, YouTube, and Web searches in parallel
-    reddit_future = None
-    x_future = None
-    youtube_future = None
-    web_future = None
-    max_workers = 2 + (1 if run_youtube else 0) + (1 if web_backend else 0)
-
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit searches
-        if do_reddit:
-            if progress:
-                progress.start_reddit()
-            reddit_future = executor.submit(
-                _search_reddit, topic, config, selected_models,
-                from_date, to_date, depth, mock
-            )
+    # Phase 2 runs on default/deep only, and never in mock mode
+    run_phase2 = depth != "quick" and not mock
+    speculative = None
+    if run_phase2 and phase2 == "adaptive":
+        speculative = SpeculativeSupplemental(topic, from_date, to_date, depth, x_source)
+    notify = _chain_callbacks(on_items, speculative.on_items if speculative else None)
+
+    # Run Reddit (search + enrichment), X, YouTube, and Web concurrently on
+    # one event loop; each source gets its own loop-enforced timeout
+    reddit_searched = threading.Event()
+    source_timeouts = {
+        # The Reddit job covers both the search and its enrichment budget
+        "reddit": timeouts.get("reddit_future", future_timeout) + timeouts["enrich_total"],
+        "x": timeouts.get("x_future", future_timeout),
+        "youtube": timeouts.get("youtube_future", future_timeout),
+        "web": timeouts.get("web_future", future_timeout),
+    }
+    hedge_after = timeouts.get("hedge_after", {})
+    phase1_start = time.monotonic()
+    phase1_perf = time.perf_counter()
+    jobs = []
 
-        if do_x:
-            if progress:
-                progress.start_x()
-            x_future = executor.submit(
-                _search_x, topic, config, selected_models,
-                from_date, to_date, depth, mock, x_source
-            )
+    if do_reddit:
+        if progress:
+            progress.start_reddit()
+        jobs.append(("reddit", "openai", _search_and_enrich_reddit, (
+            topic, config, selected_models, from_date, to_date, depth, mock,
+            timeouts, progress, notify, reddit_searched, latency, tracer,
+            not incremental,
+        )))
+
+    if do_x:
+        if progress:
+            progress.start_x()
+        jobs.append(("x", x_source, _search_x, (
+            topic, config, selected_models, from_date, to_date, depth, mock, x_source,
+        )))
 
-        if run_youtube:
-            if progress:
-                progress.start_youtube()
-            youtube_future = executor.submit(
-                _search_youtube, topic, from_date, to_date, depth
-            )
+    if run_youtube:
+        if progress:
+            progress.start_youtube()
+        jobs.append(("youtube", "youtube", _search_youtube, (
+            topic, from_date, to_date, depth,
+        )))
 
-        if web_backend:
-            sys.stderr.write(f"[web] Searching via {web_backend}\n")
+    if web_backend:
+        sys.stderr.write(f"[web] Searching via {web_backend}\n")
+        sys.stderr.flush()
+        jobs.append(("web", web_backend, _search_web, (
+            topic, config, from_date, to_date, depth,
+        )))
+
+    def _on_source_done(source: str, value, error: Optional[BaseException]):
+        """Report each source as it finishes, in completion order."""
+        label = _SOURCE_LABELS[source]
+        if latency and source != "reddit":
+            # The Reddit job records its own search time
+            if isinstance(error, TimeoutError):
+                # Censored sample: the search took at least this long
+                latency.record(depth, source, source_timeouts[source])
+            elif error is None and not value[-1]:
+                # Adapter-reported errors (an instant 401, an empty Bird
+                # reply) would drag p50 down and trigger hedging
+                latency.record(depth, source, time.monotonic() - phase1_start)
+        elif latency and isinstance(error, TimeoutError) and not reddit_searched.is_set():
+            latency.record(depth, source, source_timeouts[source] - timeouts["enrich_total"])
+        if progress:
+            if isinstance(error, TimeoutError):
+                progress.show_error(f"{label} search timed out after {source_timeouts[source]}s")
+            elif error is not None:
+                progress.show_error(f"{label} error: {error}")
+            elif source != "reddit" and value[-1]:
+                progress.show_error(f"{label} error: {value[-1]}")
+
+        if source == "reddit":
+            # The Reddit job reports and streams its own results once searched
+            if progress and not reddit_searched.is_set():
+                progress.end_reddit(0)
+            return
+
+        items = value[0] if value else []
+        tracer.add(
+            f"{source}.search", time.perf_counter() - phase1_perf,
+            len(items), _payload_bytes(items), start=phase1_perf,
+        )
+        if source == "x" and progress:
+            progress.end_x(len(items))
+        elif source == "youtube" and progress:
+            progress.end_youtube(len(items))
+        elif source == "web":
+            sys.stderr.write(f"[web] {len(items)} results\n")
             sys.stderr.flush()
-            web_future = executor.submit(
-                _search_web, topic, config, from_date, to_date, depth
+        if notify and items:
+            notify(source, items, "search")
+
+    with tracer.span("phase1"):
+        outcomes = _run_source_jobs(
+            [
+                (name, upstream, func, args, source_timeouts[name], hedge_after.get(name))
+                for name, upstream, func, args in jobs
+            ],
+            on_done=_on_source_done,
+        )
+    if latency:
+        latency.save()
+
+    for source, (value, error) in outcomes.items():
+        if error is None:
+            if source == "reddit":
+                reddit_items, raw_openai, reddit_error, raw_reddit_enriched, rate_limited = value
+            elif source == "x":
+                x_items, raw_xai, x_error = value
+            elif source == "youtube":
+                youtube_items, youtube_error = value
+            elif source == "web":
+                web_items, web_error = value
+            continue
+
+        if isinstance(error, TimeoutError):
+            failure = f"{_SOURCE_LABELS[source]} search timed out after {source_timeouts[source]}s"
+        else:
+            failure = f"{type(error).__name__}: {error}"
+        if source == "reddit":
+            reddit_error = failure
+        elif source == "x":
+            x_error = failure
+        elif source == "youtube":
+            youtube_error = failure
+        elif source == "web":
+            web_error = failure
+
+    # Phase 2: Supplemental search based on entities from Phase 1
+    # Skip on --quick (speed matters), mock mode, or if Reddit is rate-limiting
+    sup_reddit, sup_x = [], []
+    if speculative:
+        # Drill-downs are already running; drop the ones that stopped ranking
+        with tracer.span("phase2") as span:
+            sup_reddit, sup_x = speculative.collect(
+                reddit_items, x_items, skip_reddit=rate_limited,
+            )
+            span["items"] = len(sup_reddit) + len(sup_x)
+    elif run_phase2 and (reddit_items or x_items):
+        with tracer.span("phase2") as span:
+            sup_reddit, sup_x = _run_supplemental(
+                topic, reddit_items, x_items,
+                from_date, to_date, depth, x_source, progress,
+                skip_reddit=rate_limited,
+                tracer=tracer,
             )
+            span["items"] = len(sup_reddit) + len(sup_x)
+    if sup_reddit:
+        reddit_items.extend(sup_reddit)
+        if on_items:
+            on_items("reddit", reddit_items, "supplemental")
+    if sup_x:
+        x_items.extend(sup_x)
+        if on_items:
+            on_items("x", x_items, "supplemental")
 
-        # Collect results (with timeouts to prevent indefinite blocking)
-        if reddit_future:
-            reddit_timeout = timeouts.get("reddit_future", future_timeout)
-            try:
-                reddit_items, raw_openai, reddit_error = reddit_future.result(timeout=reddit_timeout)
-                if reddit_error and progress:
-                    progress.show_error(f"Reddit error: {reddit_error}")
-            except TimeoutError:
-                reddit_error = f"Reddit search timed out after {reddit_timeout}s"
-                if progress:
-                    progress.show_error(reddit_error)
-            except Exception as e:
-                reddit_error = f"{type(e).__name__}: {e}"
-                if progress:
-                    progress.show_error(f"Reddit error: {e}")
-            if progress:
-                progress.end_reddit(len(reddit_items))
+    return reddit_items, x_items, youtube_items, web_items, web_needed, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error, youtube_error, web_error
 
-        if x_future:
-            try:
-                x_items, raw_xai, x_error = x_future.result(timeout=future_timeout)
-                if x_error and progress:
-                    progress.show_error(f"X error: {x_error}")
-            except TimeoutError:
-                x_error = f"X search timed out after {future_timeout}s"
-                if progress:
-                    progress.show_error(x_error)
-            except Exception as e:
-                x_error = f"{type(e).__name__}: {e}"
-                if progress:
-                    progress.show_error(f"X error: {e}")
-            if progress:
-                progress.end_x(len(x_items))
 
-        if youtube_future:
-            yt_timeout = timeouts.get("youtube_future", future_timeout)
-            try:
-                youtube_items, youtube_error = youtube_future.result(timeout=yt_timeout)
-                if youtube_error and progress:
-                    progress.show_error(f"YouTube error: {youtube_error}")
-            except TimeoutError:
-                youtube_error = f"YouTube search timed out after {yt_timeout}s"
-                if progress:
-                    progress.show_error(youtube_error)
-            except Exception as e:
-                youtube_error = f"{type(e).__name__}: {e}"
-                if progress:
-                    progress.show_error(f"YouTube error: {e}")
-            if progress:
-                progress.end_youtube(len(youtube_items))
+# Bird/yt-dlp detection shells out; reuse a recent result while nothing changed
+SOURCE_PROBE_TTL_SECONDS = 600
+SOURCE_PROBE_BINARIES = ("bird", "node", "yt-dlp")
 
-        if web_future:
-            try:
-                web_items, web_error = web_future.result(timeout=future_timeout)
-                if web_error and progress:
-                    progress.show_error(f"Web error: {web_error}")
-            except TimeoutError:
-                web_error = f"Web search timed out after {future_timeout}s"
-                if progress:
-                    progress.show_error(web_error)
-            except Exception as e:
-                web_error = f"{type(e).__name__}: {e}"
-                if progress:
-                    progress.show_error(f"Web error: {e}")
-            sys.stderr.write(f"[web] {len(web_items)} results\n")
-            sys.stderr.flush()
 
-    # Enrich Reddit items with real data (parallel, capped)
-    enrich_max = timeouts["enrich_max_items"]
-    enrich_total_timeout = timeouts["enrich_total"]
-    items_to_enrich = reddit_items[:enrich_max]
-    rate_limited = False  # Set True if Reddit returns 429 during enrichment
+def _source_probe_path() -> Path:
+    """Probe cache file, kept next to the model selection cache."""
+    return Path(cache.MODEL_CACHE_FILE).parent / "source_probe.json"
 
-    if items_to_enrich:
-        if progress:
-            progress.start_reddit_enrich(1, len(items_to_enrich))
 
-        if mock:
-            # Sequential mock enrichment (fast, no need for parallelism)
-            for i, item in enumerate(items_to_enrich):
-                if progress and i > 0:
-                    progress.update_reddit_enrich(i + 1, len(items_to_enrich))
+def _source_probe_fingerprint(config: dict) -> str:
+    """Hash of everything a probe result depends on: config and binaries."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps(sorted(config.items()), default=str).encode())
+    for binary in SOURCE_PROBE_BINARIES:
+        path = shutil.which(binary)
+        try:
+            mtime = os.path.getmtime(path) if path else None
+        except OSError:
+            mtime = None
+        digest.update(f"{binary}={path}:{mtime}\n".encode())
+    return digest.hexdigest()
+
+
+def _probe_sources(config: dict, fresh: bool = False) -> tuple:
+    """Detect the X backend and yt-dlp, reusing a recent probe when possible.
+
+    The cached result is used only if it is younger than
+    SOURCE_PROBE_TTL_SECONDS and neither the config nor the Bird/node/yt-dlp
+    binaries changed since.
+
+    Args:
+        fresh: Probe without reading or writing the cache (--diagnose, which
+            thereby loads lib.env alone)
+
+    Returns:
+        Tuple of (x_source_status, has_ytdlp)
+    """
+    if fresh:
+        return env.get_x_source_status(config), env.is_ytdlp_available()
+
+    path = _source_probe_path()
+    fingerprint = _source_probe_fingerprint(config)
+
+    try:
+        with open(path) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        cached = None
+    if (
+        cached
+        and cached.get("fingerprint") == fingerprint
+        and time.time() - cached.get("saved_at", 0) < SOURCE_PROBE_TTL_SECONDS
+    ):
+        return cached["x_source_status"], cached["has_ytdlp"]
+
+    # Auto-detect Bird (no prompts - just use it if available)
+    x_source_status = env.get_x_source_status(config)
+    # Auto-detect yt-dlp for YouTube search
+    has_ytdlp = env.is_ytdlp_available()
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({
+                "fingerprint": fingerprint,
+                "saved_at": time.time(),
+                "x_source_status": x_source_status,
+                "has_ytdlp": has_ytdlp,
+            }, f, default=str)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # The cache is an optimization only
+
+    return x_source_status, has_ytdlp
+
+
+def _resolve_sources(
+    config: dict,
+    x_source: Optional[str],
+    requested: str,
+    include_web: bool,
+    mock: bool,
+) -> tuple:
+    """Resolve --sources against the configured keys and Bird availability.
+
+    Returns:
+        Tuple of (sources, error); error may be a WebSearch fallback note
+    """
+    # Mock mode can work without keys
+    if mock:
+        return ("both" if requested == "auto" else requested), None
+
+    # Check available sources (accounting for Bird auto-detection)
+    available = env.get_available_sources(config)
+
+    # Override available if Bird is ready
+    if x_source == 'bird':
+        if available == 'reddit':
+            available = 'both'  # Now have both Reddit + X (via Bird)
+        elif available == 'web':
+            available = 'x'  # Now have X via Bird
+
+    # Validate requested sources against available
+    return env.validate_sources(requested, available, include_web)
+
+
+def _select_models(config: dict, mock: bool) -> dict:
+    """Select OpenAI/xAI models (fixtures in mock mode)."""
+    if mock:
+        mock_openai_models = load_fixture("models_openai_sample.json").get("data", [])
+        mock_xai_models = load_fixture("models_xai_sample.json").get("data", [])
+        return models.get_models(
+            {
+                "OPENAI_API_KEY": "mock",
+                "XAI_API_KEY": "mock",
+                **config,
+            },
+            mock_openai_models,
+            mock_xai_models,
+        )
+    return models.get_models(config)
+
+
+def _mode_for_sources(sources: str) -> str:
+    """Report mode string for a resolved sources value."""
+    if sources == "all":
+        return "all"  # reddit + x + web
+    if sources == "both":
+        return "both"  # reddit + x
+    if sources == "reddit":
+        return "reddit-only"
+    if sources == "reddit-web":
+        return "reddit-web"
+    if sources == "x":
+        return "x-only"
+    if sources == "x-web":
+        return "x-web"
+    if sources == "web":
+        return "web-only"
+    return sources
+
+
+def _build_report(
+    topic: str,
+    from_date: str,
+    to_date: str,
+    mode: str,
+    selected_models: dict,
+    reddit_items: list,
+    x_items: list,
+    youtube_items: list,
+    web_items: list,
+    errors: tuple,
+    tracer: Optional[timing.SpanTracer] = None,
+) -> tuple:
+    """Process raw source items into a report.
+
+    Args:
+        errors: Tuple of (reddit_error, x_error, youtube_error, web_error)
+        tracer: Optional SpanTracer for the per-source and cluster/render stages
+
+    Returns:
+        Tuple of (report, corroboration, deduped) where deduped holds each
+        source's items before clustering; that is what gets persisted, since
+        clustering only decides what is shown
+    """
+    tracer = tracer or timing.SpanTracer()
+
+    # Normalize, date-filter, score, sort and dedupe each source
+    deduped_reddit = _process_source("reddit", reddit_items, from_date, to_date, tracer)
+    deduped_x = _process_source("x", x_items, from_date, to_date, tracer)
+    deduped_youtube = _process_source("youtube", youtube_items, from_date, to_date, tracer)
+    deduped_web = _process_source("web", web_items, from_date, to_date, tracer)
+
+    deduped = {
+        "reddit": deduped_reddit,
+        "x": deduped_x,
+        "youtube": deduped_youtube,
+        "web": deduped_web,
+    }
+
+    # Cross-source clustering: one representative per story, the rest become
+    # corroborating sightings and boost the representative's score
+    with tracer.span("cluster") as span:
+        clustered, corroboration = cluster.merge_clusters(deduped)
+        span["items"] = sum(len(items) for items in clustered.values())
+
+    # Create report
+    report = schema.create_report(
+        topic,
+        from_date,
+        to_date,
+        mode,
+        selected_models.get("openai"),
+        selected_models.get("xai"),
+    )
+    report.reddit = clustered["reddit"]
+    report.x = clustered["x"]
+    report.youtube = clustered["youtube"]
+    report.web = clustered["web"]
+    report.reddit_error, report.x_error, report.youtube_error, report.web_error = errors
+
+    # Generate context snippet
+    with tracer.span("render.context") as span:
+        report.context_snippet_md = render.render_context_snippet(report)
+        span["bytes"] = len(report.context_snippet_md.encode())
+
+    return report, corroboration, deduped
+
+
+def _findings_from_items(items_by_source: Dict[str, list]) -> List[Dict[str, Any]]:
+    """Convert per-source schema items to store.store_findings() dicts."""
+    findings = []
+    for item in items_by_source.get("reddit", []):
+        findings.append({
+            "source": "reddit",
+            "url": item.url,
+            "title": item.title,
+            "author": item.subreddit,
+            "content": item.title,
+            "summary": getattr(item, "top_comments_summary", "") or "",
+            "engagement_score": item.engagement.score if item.engagement else 0,
+            "relevance_score": item.relevance,
+        })
+    for item in items_by_source.get("x", []):
+        findings.append({
+            "source": "x",
+            "url": item.url,
+            "title": item.text[:100],
+            "author": item.author_handle,
+            "content": item.text,
+            "engagement_score": item.engagement.likes if item.engagement else 0,
+            "relevance_score": item.relevance,
+        })
+    for item in items_by_source.get("youtube", []):
+        findings.append({
+            "source": "youtube",
+            "url": item.url,
+            "title": item.title,
+            "author": item.channel_name,
+            "content": item.transcript_snippet[:500] if item.transcript_snippet else item.title,
+            "engagement_score": item.engagement.views if item.engagement and item.engagement.views else 0,
+            "relevance_score": item.relevance,
+        })
+    for item in items_by_source.get("web", []):
+        findings.append({
+            "source": "web",
+            "url": item.url,
+            "title": item.title,
+            "author": item.source_domain,
+            "content": item.snippet,
+            "engagement_score": 0,
+            "relevance_score": item.relevance,
+        })
+    return findings
+
+
+def _persist_findings(topic: str, mode: str, findings: List[Dict[str, Any]], timings: Optional[dict] = None):
+    """Store findings (see _findings_from_items) in the SQLite accumulator.
+
+    timings (SpanTracer.to_dict()) is saved on the run row when given.
+    """
+    import store as store_mod
+    store_mod.init_db()
+
+    # Topic, run and findings land together or not at all
+    with store_mod.transaction():
+        topic_id = store_mod.add_topic(topic)["id"]
+        run_id = store_mod.record_run(topic_id, source_mode=mode, status="completed")
+        counts = store_mod.store_findings(run_id, topic_id, findings)
+        run_fields = {
+            "status": "completed",
+            "findings_new": counts["new"],
+            "findings_updated": counts["updated"],
+        }
+        if timings:
+            run_fields["timings"] = json.dumps(timings)
+            run_fields["duration_seconds"] = timings["total_seconds"]
+        store_mod.update_run(run_id, **run_fields)
+    sys.stderr.write(
+        f"[store] {topic}: saved {counts['new']} new, {counts['updated']} updated findings\n"
+    )
+    sys.stderr.flush()
+
+
+# Topics researched side by side by research_many()
+BATCH_CONCURRENCY = 4
+# Extra time the batch-mode watchdog gives research_many to report timeouts
+BATCH_WATCHDOG_GRACE = 10
+
+
+def _batch_timeout(topic_timeout: float, topics: int, max_workers: int = BATCH_CONCURRENCY) -> float:
+    """Deadline for a whole batch: one topic timeout per round of workers."""
+    workers = max(1, min(max_workers, topics))
+    return topic_timeout * max(1, -(-topics // workers))
+
+
+def research_many(
+    topics: List[str],
+    days: int = 30,
+    depth: str = "default",
+    requested_sources: str = "auto",
+    include_web: bool = False,
+    mock: bool = False,
+    phase2: str = "adaptive",
+    store: bool = False,
+    max_workers: int = BATCH_CONCURRENCY,
+    topic_timeout: Optional[float] = None,
+    batch_timeout: Optional[float] = None,
+    budget_check: Optional[Callable[[], Optional[str]]] = None,
+) -> List[Dict[str, Any]]:
+    """Research several topics in one process.
+
+    Config loading, Bird/yt-dlp detection and model selection run once;
+    topics then run concurrently and share the process-wide upstream slots.
+
+    Each topic gets topic_timeout seconds from when it starts (default: the
+    depth's global timeout) and the whole batch gets batch_timeout (default:
+    one topic_timeout per round of max_workers). A topic past either deadline
+    is reported as failed and abandoned on its daemon thread, so a hung
+    source cannot keep the process from exiting.
+
+    budget_check, if given, is called as each topic is about to start; a
+    non-empty return value is the reason to skip it (e.g. the daily budget
+    is spent), so a batch stops starting topics once the budget runs out.
+
+    Returns:
+        One dict per topic, in input order:
+        {"topic", "status": "completed"|"failed"|"skipped", "duration",
+        "report"|"error"|"reason"}.
+        Completed topics also carry "findings": every deduped item, including
+        the ones clustering folded into another source's item, in
+        store.store_findings() format
+    """
+    config = env.get_config()
+    x_source_status, has_ytdlp = _probe_sources(config)
+    x_source = x_source_status["source"]
+
+    sources, error = _resolve_sources(config, x_source, requested_sources, include_web, mock)
+    if error and "WebSearch fallback" not in error:
+        return [{"topic": t, "status": "failed", "duration": 0, "error": error} for t in topics]
+
+    selected_models = _select_models(config, mock)
+    mode = _mode_for_sources(sources)
+    from_date, to_date = dates.get_date_range(days)
+    # Fixture runs would teach the stats near-zero latencies
+    latency = None if mock else _latency_stats()
+    timeouts = latency.timeouts(depth, TIMEOUT_PROFILES[depth]) if latency else TIMEOUT_PROFILES[depth]
+
+    workers = max(1, min(max_workers, len(topics)))
+    topic_timeout = topic_timeout or TIMEOUT_PROFILES[depth]["global"]
+    if batch_timeout is None:
+        batch_timeout = _batch_timeout(topic_timeout, len(topics), workers)
+    started: Dict[int, float] = {}  # topic index -> monotonic start
+    abandoned: set = set()  # timed-out topic indices
+
+    def _research_one(index: int, topic: str) -> Dict[str, Any]:
+        start = started[index] = time.monotonic()
+        reason = budget_check() if budget_check else None
+        if reason:
+            return {"topic": topic, "status": "skipped", "duration": 0, "reason": reason}
+        tracer = timing.SpanTracer()
+        (reddit_items, x_items, youtube_items, web_items, _web_needed,
+         _raw_openai, _raw_xai, _raw_enriched,
+         reddit_error, x_error, youtube_error, web_error) = run_research(
+            topic, sources, config, selected_models, from_date, to_date,
+            depth, mock, None,
+            x_source=x_source or "xai",
+            run_youtube=has_ytdlp,
+            timeouts=timeouts,
+            phase2=phase2,
+            latency=latency,
+            tracer=tracer,
+        )
+        report, corroboration, deduped = _build_report(
+            topic, from_date, to_date, mode, selected_models,
+            reddit_items, x_items, youtube_items, web_items,
+            (reddit_error, x_error, youtube_error, web_error),
+            tracer,
+        )
+        timings = tracer.to_dict()
+        findings = _findings_from_items(deduped)
+        # A topic already reported as timed out must not store findings late
+        if store and index not in abandoned:
+            _persist_findings(topic, mode, findings, timings)
+        data = report.to_dict()
+        if corroboration:
+            data["corroboration"] = corroboration
+        data["timings"] = timings
+        return {
+            "topic": topic,
+            "status": "completed",
+            "duration": time.monotonic() - start,
+            "report": data,
+            "findings": findings,
+        }
+
+    results: Dict[int, Dict[str, Any]] = {}
+    batch_deadline = time.monotonic() + batch_timeout
+    pool = DaemonThreadPool(workers)
+    futures = {pool.submit(_research_one, i, topic): i for i, topic in enumerate(topics)}
+    try:
+        pending = set(futures)
+        while pending:
+            now = time.monotonic()
+            deadlines = [batch_deadline] + [
+                started[futures[f]] + topic_timeout for f in pending if futures[f] in started
+            ]
+            # A topic starting during the wait ends no sooner than now + topic_timeout
+            done, pending = wait_futures(
+                pending,
+                timeout=max(0, min(min(deadlines) - now, topic_timeout)),
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                index = futures[future]
                 try:
-                    mock_thread = load_fixture("reddit_thread_sample.json")
-                    reddit_items[i] = reddit_enrich.enrich_reddit_item(item, mock_thread)
+                    results[index] = future.result()
                 except Exception as e:
-                    if progress:
-                        progress.show_error(f"Enrich failed for {item.get('url', 'unknown')}: {e}")
-                raw_reddit_enriched.append(reddit_items[i])
-        else:
-            # Parallel enrichment with bounded concurrency and total timeout
-            # Uses short HTTP timeout (10s) and 1 retry to fail fast on 429
-            completed_count = 0
-            rate_limited = False
-            with ThreadPoolExecutor(max_workers=5) as enrich_pool:
-                futures = {
-                    enrich_pool.submit(reddit_enrich.enrich_reddit_item, item): i
-                    for i, item in enumerate(items_to_enrich)
+                    results[index] = {
+                        "topic": topics[index],
+                        "status": "failed",
+                        "duration": time.monotonic() - started.get(index, now),
+                        "error": f"{type(e).__name__}: {e}",
+                    }
+
+            now = time.monotonic()
+            for future in list(pending):
+                index = futures[future]
+                begun = started.get(index)
+                if begun is not None and now >= begun + topic_timeout:
+                    limit = topic_timeout
+                elif now >= batch_deadline:
+                    limit = batch_timeout
+                else:
+                    continue
+                abandoned.add(index)
+                future.cancel()
+                pending.discard(future)
+                results[index] = {
+                    "topic": topics[index],
+                    "status": "failed",
+                    "duration": now - begun if begun is not None else 0,
+                    "error": f"Research timed out after {limit:.0f}s",
                 }
-                try:
-                    for future in as_completed(futures, timeout=enrich_total_timeout):
-                        idx = futures[future]
-                        completed_count += 1
-                        if progress:
-                            progress.update_reddit_enrich(completed_count, len(items_to_enrich))
-                        try:
-                            reddit_items[idx] = future.result(timeout=timeouts["enrich_per"])
-                        except reddit_enrich.RedditRateLimitError:
-                            rate_limited = True
-                            if progress:
-                                progress.show_error(
-                                    "Reddit rate-limited (429) — skipping remaining enrichment"
-                                )
-                            # Cancel remaining futures and bail
-                            for f in futures:
-                                f.cancel()
-                            break
-                        except Exception as e:
-                            if progress:
-                                progress.show_error(
-                                    f"Enrich failed for {items_to_enrich[idx].get('url', 'unknown')}: {e}"
-                                )
-                        raw_reddit_enriched.append(reddit_items[idx])
-                except TimeoutError:
-                    if progress:
-                        progress.show_error(
-                            f"Enrichment timed out after {enrich_total_timeout}s "
-                            f"({completed_count}/{len(items_to_enrich)} done)"
-                        )
-                    # Keep unenriched items as-is
-                    for idx in futures.values():
-                        if reddit_items[idx] not in raw_reddit_enriched:
-                            raw_reddit_enriched.append(reddit_items[idx])
-
-        if progress:
-            progress.end_reddit_enrich()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    return [results[i] for i in range(len(topics))]
 
-    # Phase 2: Supplemental search based on entities from Phase 1
-    # Skip on --quick (speed matters), mock mode, or if Reddit is rate-limiting
-    if depth != "quick" and not mock and (reddit_items or x_items):
-        sup_reddit, sup_x = _run_supplemental(
-            topic, reddit_items, x_items,
-            from_date, to_date, depth, x_source, progress,
-            skip_reddit=rate_limited,
-        )
-        if sup_reddit:
-            reddit_items.extend(sup_reddit)
-        if sup_x:
-            x_items.extend(sup_x)
 
-    return reddit_items, x_items, youtube_items, web_items, web_needed, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error, youtube_error, web_error
+def _read_topics_file(path: str) -> List[str]:
+    """One topic per line; blank lines and # comments are ignored."""
+    with open(path) as f:
+        return [
+            line.strip() for line in f
+            if line.strip() and not line.lstrip().startswith("#")
+        ]
 
 
 def main():
@@ -776,7 +2170,7 @@ def main():
     parser.add_argument("--mock", action="store_true", help="Use fixtures")
     parser.add_argument(
         "--emit",
-        choices=["compact", "json", "md", "context", "path"],
+        choices=["compact", "json", "md", "context", "path", "jsonl-stream"],
         default="compact",
         help="Output mode",
     )
@@ -824,6 +2218,29 @@ def main():
         action="store_true",
         help="Show source availability diagnostics and exit",
     )
+    parser.add_argument(
+        "--topics-file",
+        metavar="FILE",
+        help="Research every topic in FILE (one per line) in one process; emits one JSON document per line",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse items from the last overlapping run and only fetch the new days",
+    )
+    parser.add_argument(
+        "--phase2",
+        choices=["adaptive", "barrier"],
+        default="adaptive",
+        help="Phase 2 drill-downs: start per source during Phase 1 (adaptive) or after it (barrier)",
+    )
+    parser.add_argument(
+        "--max-tokens",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Token budget for --emit=compact/context; lowest score-per-token items are trimmed first",
+    )
     parser.add_argument(
         "--timeout",
         type=int,
@@ -837,9 +2254,7 @@ def main():
     # Enable debug logging if requested
     if args.debug:
         os.environ["LAST30DAYS_DEBUG"] = "1"
-        # Re-import http to pick up debug flag
-        from lib import http as http_module
-        http_module.DEBUG = True
+        http.DEBUG = True
 
     # Determine depth
     if args.quick and args.deep:
@@ -854,22 +2269,27 @@ def main():
 
     # Install global timeout watchdog
     timeouts = TIMEOUT_PROFILES[depth]
-    global_timeout = args.timeout or timeouts["global"]
+    topics = _read_topics_file(args.topics_file) if args.topics_file else None
+    if topics:
+        # In batch mode research_many enforces per-topic and batch deadlines
+        # itself; the watchdog is a backstop that fires only after them
+        batch_timeout = args.timeout or _batch_timeout(timeouts["global"], len(topics))
+        global_timeout = batch_timeout + BATCH_WATCHDOG_GRACE
+    else:
+        global_timeout = args.timeout or timeouts["global"]
     _install_global_timeout(global_timeout)
 
     # Load config
     config = env.get_config()
 
-    # Auto-detect Bird (no prompts - just use it if available)
-    x_source_status = env.get_x_source_status(config)
+    # Detect Bird and yt-dlp (cached briefly; --diagnose probes fresh and
+    # leaves the cache alone)
+    x_source_status, has_ytdlp = _probe_sources(config, fresh=args.diagnose)
     x_source = x_source_status["source"]  # 'bird', 'xai', or None
-
-    # Auto-detect yt-dlp for YouTube search
-    has_ytdlp = env.is_ytdlp_available()
+    web_source = env.get_web_search_source(config)
 
     # --diagnose: show source availability and exit
     if args.diagnose:
-        web_source = env.get_web_search_source(config)
         diag = {
             "openai": bool(config.get("OPENAI_API_KEY")),
             "xai": bool(config.get("XAI_API_KEY")),
@@ -886,6 +2306,24 @@ def main():
         print(json.dumps(diag, indent=2))
         sys.exit(0)
 
+    # Batch mode: one setup, N topics, one JSON document per topic
+    if topics is not None:
+        for result in research_many(
+            topics,
+            days=args.days,
+            depth=depth,
+            requested_sources=args.sources,
+            include_web=args.include_web,
+            mock=args.mock,
+            phase2=args.phase2,
+            store=args.store,
+            batch_timeout=batch_timeout,
+        ):
+            # Findings duplicate the report; they are for callers that store
+            result.pop("findings", None)
+            print(json.dumps(result, default=str), flush=True)
+        return
+
     # Validate topic (--diagnose doesn't need one)
     if not args.topic:
         print("Error: Please provide a topic to research.", file=sys.stderr)
@@ -896,7 +2334,6 @@ def main():
     progress = ui.ProgressDisplay(args.topic, show_banner=True)
 
     # Show diagnostic banner when sources are missing
-    web_source = env.get_web_search_source(config)
     diag = {
         "openai": bool(config.get("OPENAI_API_KEY")),
         "xai": bool(config.get("XAI_API_KEY")),
@@ -909,32 +2346,14 @@ def main():
     }
     ui.show_diagnostic_banner(diag)
 
-    # Check available sources (accounting for Bird auto-detection)
-    available = env.get_available_sources(config)
-
-    # Override available if Bird is ready
-    if x_source == 'bird':
-        if available == 'reddit':
-            available = 'both'  # Now have both Reddit + X (via Bird)
-        elif available == 'web':
-            available = 'x'  # Now have X via Bird
-
-    # Mock mode can work without keys
-    if args.mock:
-        if args.sources == "auto":
-            sources = "both"
+    sources, error = _resolve_sources(config, x_source, args.sources, args.include_web, args.mock)
+    if error:
+        # If it's a warning about WebSearch fallback, print but continue
+        if "WebSearch fallback" in error:
+            print(f"Note: {error}", file=sys.stderr)
         else:
-            sources = args.sources
-    else:
-        # Validate requested sources against available
-        sources, error = env.validate_sources(args.sources, available, args.include_web)
-        if error:
-            # If it's a warning about WebSearch fallback, print but continue
-            if "WebSearch fallback" in error:
-                print(f"Note: {error}", file=sys.stderr)
-            else:
-                print(f"Error: {error}", file=sys.stderr)
-                sys.exit(1)
+            print(f"Error: {error}", file=sys.stderr)
+            sys.exit(1)
 
     # Get date range
     from_date, to_date = dates.get_date_range(args.days)
@@ -946,48 +2365,48 @@ def main():
     if missing_keys != 'none':
         progress.show_promo(missing_keys, diag=diag)
 
-    # Select models
-    if args.mock:
-        # Use mock models
-        mock_openai_models = load_fixture("models_openai_sample.json").get("data", [])
-        mock_xai_models = load_fixture("models_xai_sample.json").get("data", [])
-        selected_models = models.get_models(
-            {
-                "OPENAI_API_KEY": "mock",
-                "XAI_API_KEY": "mock",
-                **config,
-            },
-            mock_openai_models,
-            mock_xai_models,
-        )
-    else:
-        selected_models = models.get_models(config)
+    selected_models = _select_models(config, args.mock)
+    mode = _mode_for_sources(sources)
+
+    # Incremental refresh: reuse the last overlapping run, fetch only new days.
+    # The last cached day is fetched again since it was only partially covered.
+    delta_path = None
+    snapshot = None
+    fetch_from = from_date
+    if args.incremental and not args.mock:
+        delta_path = _delta_snapshot_path(args.topic, sources, depth)
+        snapshot = _load_delta_snapshot(delta_path, from_date, to_date)
+        if snapshot:
+            fetch_from = snapshot["to_date"]
+            cached_count = sum(len(snapshot.get(src, [])) for src in DELTA_SOURCES)
+            sys.stderr.write(
+                f"[delta] Reusing {cached_count} cached items from "
+                f"{snapshot['from_date']}..{snapshot['to_date']}, fetching {fetch_from}..{to_date}\n"
+            )
+            sys.stderr.flush()
 
-    # Determine mode string
-    if sources == "all":
-        mode = "all"  # reddit + x + web
-    elif sources == "both":
-        mode = "both"  # reddit + x
-    elif sources == "reddit":
-        mode = "reddit-only"
-    elif sources == "reddit-web":
-        mode = "reddit-web"
-    elif sources == "x":
-        mode = "x-only"
-    elif sources == "x-web":
-        mode = "x-web"
-    elif sources == "web":
-        mode = "web-only"
-    else:
-        mode = sources
+    # Per-source timeouts learned from recent runs (static profile in mock mode)
+    latency = None if args.mock else _latency_stats()
+    if latency:
+        timeouts = latency.timeouts(depth, timeouts)
+
+    # Stream ranked partial results while sources are still running
+    stream = JsonlStream(from_date, to_date) if args.emit == "jsonl-stream" else None
+    on_items = stream.emit_items if stream else None
+    if stream and snapshot:
+        # Partial results should already include the reused items
+        def on_items(source, items, stage):
+            merged = _merge_delta(snapshot.get(source, []), items, from_date)
+            stream.emit_items(source, merged, stage)
 
     # Run research
-    reddit_items, x_items, youtube_items, web_items, web_needed, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error, youtube_error, web_error = run_research(
+    tracer = timing.SpanTracer()
+    results = run_research(
         args.topic,
         sources,
         config,
         selected_models,
-        from_date,
+        fetch_from,
         to_date,
         depth,
         args.mock,
@@ -995,83 +2414,62 @@ def main():
         x_source=x_source or "xai",
         run_youtube=has_ytdlp,
         timeouts=timeouts,
+        on_items=on_items,
+        phase2=args.phase2,
+        latency=latency,
+        tracer=tracer,
+        incremental=bool(snapshot),
     )
+    reddit_items, x_items, youtube_items, web_items, web_needed, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error, youtube_error, web_error = results
+
+    if snapshot:
+        reddit_items = _merge_delta(snapshot.get("reddit", []), reddit_items, from_date)
+        x_items = _merge_delta(snapshot.get("x", []), x_items, from_date)
+        youtube_items = _merge_delta(snapshot.get("youtube", []), youtube_items, from_date)
+        web_items = _merge_delta(snapshot.get("web", []), web_items, from_date)
+    failed_sources = [
+        _SOURCE_LABELS[source] for source, error in zip(
+            DELTA_SOURCES, (reddit_error, x_error, youtube_error, web_error),
+        ) if error
+    ]
+    if delta_path and failed_sources:
+        # Advancing the window would lose the failed source's new days for
+        # good; the previous snapshot (if any) stays valid for the next run
+        sys.stderr.write(
+            f"[delta] Not saving snapshot: {', '.join(failed_sources)} failed this run\n"
+        )
+        sys.stderr.flush()
+    elif delta_path:
+        _save_delta_snapshot(delta_path, from_date, to_date, {
+            "reddit": reddit_items,
+            "x": x_items,
+            "youtube": youtube_items,
+            "web": web_items,
+        })
 
     # Processing phase
     progress.start_processing()
-
-    # Normalize items
-    normalized_reddit = normalize.normalize_reddit_items(reddit_items, from_date, to_date)
-    normalized_x = normalize.normalize_x_items(x_items, from_date, to_date)
-    normalized_youtube = normalize.normalize_youtube_items(youtube_items, from_date, to_date) if youtube_items else []
-    normalized_web = websearch.normalize_websearch_items(web_items, from_date, to_date) if web_items else []
-
-    # Hard date filter: exclude items with verified dates outside the range
-    # This is the safety net - even if prompts let old content through, this filters it
-    filtered_reddit = normalize.filter_by_date_range(normalized_reddit, from_date, to_date)
-    filtered_x = normalize.filter_by_date_range(normalized_x, from_date, to_date)
-    # YouTube: skip hard date filter — youtube_yt.py already applies a soft filter
-    # that prefers recent videos but keeps older ones for evergreen topics.
-    # YouTube content has a longer shelf life than tweets/posts.
-    filtered_youtube = normalized_youtube
-    filtered_web = normalize.filter_by_date_range(normalized_web, from_date, to_date) if normalized_web else []
-
-    # Score items
-    scored_reddit = score.score_reddit_items(filtered_reddit)
-    scored_x = score.score_x_items(filtered_x)
-    scored_youtube = score.score_youtube_items(filtered_youtube) if filtered_youtube else []
-    scored_web = score.score_websearch_items(filtered_web) if filtered_web else []
-
-    # Sort items
-    sorted_reddit = score.sort_items(scored_reddit)
-    sorted_x = score.sort_items(scored_x)
-    sorted_youtube = score.sort_items(scored_youtube) if scored_youtube else []
-    sorted_web = score.sort_items(scored_web) if scored_web else []
-
-    # Dedupe items
-    deduped_reddit = dedupe.dedupe_reddit(sorted_reddit)
-    deduped_x = dedupe.dedupe_x(sorted_x)
-    deduped_youtube = dedupe.dedupe_youtube(sorted_youtube) if sorted_youtube else []
-    deduped_web = websearch.dedupe_websearch(sorted_web) if sorted_web else []
-
-    # Minimum result guarantee: if all Reddit results were filtered out but
-    # we had raw results, keep top 3 by relevance regardless of score
-    if not deduped_reddit and normalized_reddit:
-        print("[REDDIT WARNING] All results scored below threshold, keeping top 3 by relevance", file=sys.stderr)
-        by_relevance = sorted(normalized_reddit, key=lambda item: item.relevance, reverse=True)
-        deduped_reddit = by_relevance[:3]
-
-    progress.end_processing()
-
-    # Create report
-    report = schema.create_report(
-        args.topic,
-        from_date,
-        to_date,
-        mode,
-        selected_models.get("openai"),
-        selected_models.get("xai"),
+    report, corroboration, deduped = _build_report(
+        args.topic, from_date, to_date, mode, selected_models,
+        reddit_items, x_items, youtube_items, web_items,
+        (reddit_error, x_error, youtube_error, web_error),
+        tracer,
     )
-    report.reddit = deduped_reddit
-    report.x = deduped_x
-    report.youtube = deduped_youtube
-    report.web = deduped_web
-    report.reddit_error = reddit_error
-    report.x_error = x_error
-    report.youtube_error = youtube_error
-    report.web_error = web_error
-
-    # Generate context snippet
-    report.context_snippet_md = render.render_context_snippet(report)
+    progress.end_processing()
 
     # Write outputs
-    render.write_outputs(report, raw_openai, raw_xai, raw_reddit_enriched)
+    with tracer.span("render.write_outputs"):
+        render.write_outputs(report, raw_openai, raw_xai, raw_reddit_enriched)
+    timings = tracer.to_dict()
+    if args.debug:
+        sys.stderr.write(tracer.render() + "\n")
+        sys.stderr.flush()
 
     # Show completion
     if sources == "web":
         progress.show_web_only_complete()
     else:
-        progress.show_complete(len(deduped_reddit), len(deduped_x), len(deduped_youtube))
+        progress.show_complete(len(report.reddit), len(report.x), len(report.youtube))
 
     # Build source info for status footer
     source_info = {}
@@ -1088,69 +2486,18 @@ def main():
         source_info["web_skip_reason"] = "assistant will use WebSearch (add BRAVE_API_KEY for native search)"
 
     # Output result
-    output_result(report, args.emit, web_needed, args.topic, from_date, to_date, missing_keys, args.days, source_info)
+    if stream:
+        stream.emit_report(report, web_needed, corroboration, timings)
+    else:
+        output_result(
+            report, args.emit, web_needed, args.topic, from_date, to_date,
+            missing_keys, args.days, source_info, corroboration, args.max_tokens,
+            timings,
+        )
 
     # Persist findings to SQLite if requested
     if args.store:
-        import store as store_mod
-        store_mod.init_db()
-        topic_row = store_mod.add_topic(args.topic)
-        topic_id = topic_row["id"]
-        run_id = store_mod.record_run(topic_id, source_mode=mode, status="completed")
-
-        findings = []
-        for item in deduped_reddit:
-            findings.append({
-                "source": "reddit",
-                "url": item.url,
-                "title": item.title,
-                "author": item.subreddit,
-                "content": item.title,
-                "engagement_score": item.engagement.score if item.engagement else 0,
-                "relevance_score": item.relevance,
-            })
-        for item in deduped_x:
-            findings.append({
-                "source": "x",
-                "url": item.url,
-                "title": item.text[:100],
-                "author": item.author_handle,
-                "content": item.text,
-                "engagement_score": item.engagement.likes if item.engagement else 0,
-                "relevance_score": item.relevance,
-            })
-        for item in deduped_youtube:
-            findings.append({
-                "source": "youtube",
-                "url": item.url,
-                "title": item.title,
-                "author": item.channel_name,
-                "content": item.transcript_snippet[:500] if item.transcript_snippet else item.title,
-                "engagement_score": item.engagement.views if item.engagement and item.engagement.views else 0,
-                "relevance_score": item.relevance,
-            })
-        for item in deduped_web:
-            findings.append({
-                "source": "web",
-                "url": item.url,
-                "title": item.title,
-                "author": item.source_domain,
-                "content": item.snippet,
-                "engagement_score": 0,
-                "relevance_score": item.relevance,
-            })
-
-        counts = store_mod.store_findings(run_id, topic_id, findings)
-        store_mod.update_run(
-            run_id,
-            status="completed",
-            findings_new=counts["new"],
-            findings_updated=counts["updated"],
-        )
-        sys.stderr.write(
-            f"[store] Saved {counts['new']} new, {counts['updated']} updated findings\n"
-        )
-        sys.stderr.flush()
+        _persist_findings(args.topic, mode, _findings_from_items(deduped), timings)
 
 
 def output_result(
@@ -1163,18 +2510,48 @@ def output_result(
     missing_keys: str = "none",
     days: int = 30,
     source_info: dict = None,
+    corroboration: dict = None,
+    max_tokens: Optional[int] = None,
+    timings: Optional[dict] = None,
 ):
-    """Output the result based on emit mode."""
+    """Output the result based on emit mode.
+
+    corroboration maps a representative item ID to the cross-source sightings
+    that were folded into it (see lib.cluster). max_tokens trims compact and
+    context output to a token budget (see lib.budget). timings
+    (SpanTracer.to_dict()) is added to JSON output.
+    """
     if emit_mode == "compact":
-        print(render.render_compact(report, missing_keys=missing_keys))
-        # Append source status footer
-        print(render.render_source_status(report, source_info))
+        def _render(r: schema.Report) -> str:
+            parts = [render.render_compact(r, missing_keys=missing_keys)]
+            if corroboration:
+                parts.append(cluster.render_corroboration(
+                    {"reddit": r.reddit, "x": r.x, "youtube": r.youtube, "web": r.web},
+                    corroboration,
+                ))
+            # Append source status footer
+            parts.append(render.render_source_status(r, source_info))
+            return "\n".join(parts)
+
+        if max_tokens:
+            # Footers and the budget note count against the budget too
+            print(budget.fit_with_note(report, max_tokens, _render)[1])
+        else:
+            print(_render(report))
     elif emit_mode == "json":
-        print(json.dumps(report.to_dict(), indent=2))
+        data = report.to_dict()
+        if corroboration:
+            data["corroboration"] = corroboration
+        if timings:
+            data["timings"] = timings
+        print(json.dumps(data, indent=2))
     elif emit_mode == "md":
         print(render.render_full_report(report))
     elif emit_mode == "context":
-        print(report.context_snippet_md)
+        if max_tokens:
+            print(budget.fit_with_note(report, max_tokens, render.render_context_snippet)[1])
+        else:
+            print(report.context_snippet_md)
     elif emit_mode == "path":
         print(render.get_context_path())
 
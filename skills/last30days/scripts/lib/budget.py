@@ -0,0 +1,192 @@
+"""Token budgeting for compact/context output.
+
+The renderers emit items by count, but the agent reading the output pays per
+token. fit_report() trims a report so its rendering stays under a token
+budget: long free-text fields are shortened first, then the items with the
+least score per token are dropped. The result depends only on the report,
+so identical inputs render identically.
+"""
+
+import copy
+from typing import Any, Callable, Dict, List, Tuple
+
+SOURCES = ("reddit", "x", "youtube", "web")
+
+# Free-text fields shortened (progressively) before any item is dropped
+TRUNCATE_FIELDS = ("top_comments_summary", "snippet", "transcript_snippet")
+TRUNCATE_STEPS = (400, 200, 100)
+
+# Rough chars per token for English markdown; no tokenizer dependency
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of text."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def truncate_text(text: str, limit: int) -> str:
+    """Cut text to at most limit chars on a word boundary, marking the cut."""
+    if not text or len(text) <= limit:
+        return text
+    cut = text[:limit].rsplit(" ", 1)[0] or text[:limit]
+    return cut.rstrip(" ,.;:") + "…"
+
+
+def _with_items(report: Any, items_by_source: Dict[str, list]) -> Any:
+    trimmed = copy.copy(report)
+    for source in SOURCES:
+        setattr(trimmed, source, list(items_by_source.get(source, [])))
+    return trimmed
+
+
+def _truncate_items(items_by_source: Dict[str, list], limit: int) -> Tuple[Dict[str, list], int]:
+    """Copy items with long free-text fields cut to limit chars.
+
+    Returns:
+        Tuple of (items_by_source, number of fields truncated)
+    """
+    truncated = 0
+    result: Dict[str, list] = {}
+    for source in SOURCES:
+        result[source] = []
+        for item in items_by_source[source]:
+            shortened = None
+            for field in TRUNCATE_FIELDS:
+                value = getattr(item, field, None)
+                if isinstance(value, str) and len(value) > limit:
+                    if shortened is None:
+                        shortened = copy.copy(item)
+                    setattr(shortened, field, truncate_text(value, limit))
+                    truncated += 1
+            result[source].append(shortened or item)
+    return result, truncated
+
+
+def fit_report(
+    report: Any,
+    max_tokens: int,
+    render_fn: Callable[[Any], str],
+) -> Tuple[Any, str, Dict[str, Any]]:
+    """Trim a report so render_fn(report) fits in max_tokens.
+
+    Steps, stopping as soon as the rendering fits:
+    1. Shorten TRUNCATE_FIELDS to each of TRUNCATE_STEPS in turn
+    2. Keep items greedily by score per estimated token, where an item's
+       cost is what it adds to the rendering on its own
+    3. Drop the lowest-value kept items until the full rendering fits
+
+    Ties are broken by source order and rank, so the output is deterministic.
+
+    Args:
+        report: schema.Report (not modified)
+        max_tokens: Token budget for the rendered output
+        render_fn: Renderer, e.g. render.render_compact
+
+    Returns:
+        Tuple of (trimmed_report, rendered, summary) where summary is
+        {"max_tokens", "estimated_tokens", "truncated_fields", "truncated_to",
+         "dropped": {source: [item ids]}}
+    """
+    original = {source: list(getattr(report, source, None) or []) for source in SOURCES}
+    summary: Dict[str, Any] = {
+        "max_tokens": max_tokens,
+        "estimated_tokens": 0,
+        "truncated_fields": 0,
+        "truncated_to": None,
+        "dropped": {},
+    }
+
+    items = original
+    rendered = render_fn(_with_items(report, items))
+    for limit in TRUNCATE_STEPS:
+        if estimate_tokens(rendered) <= max_tokens:
+            break
+        items, truncated = _truncate_items(original, limit)
+        summary["truncated_fields"] = truncated
+        summary["truncated_to"] = limit
+        rendered = render_fn(_with_items(report, items))
+
+    if estimate_tokens(rendered) > max_tokens:
+        overhead = estimate_tokens(render_fn(_with_items(report, {})))
+        candidates: List[Tuple[float, int, int, int]] = []
+        for source_rank, source in enumerate(SOURCES):
+            for pos, item in enumerate(items[source]):
+                alone = render_fn(_with_items(report, {source: [item]}))
+                cost = max(1, estimate_tokens(alone) - overhead)
+                value = getattr(item, "score", 0) or 0
+                candidates.append((-value / cost, source_rank, pos, cost))
+        candidates.sort()
+
+        remaining = max_tokens - overhead
+        kept = []
+        for candidate in candidates:
+            if candidate[3] <= remaining:
+                kept.append(candidate)
+                remaining -= candidate[3]
+
+        def _select(chosen) -> Dict[str, list]:
+            keys = {(c[1], c[2]) for c in chosen}
+            return {
+                source: [item for pos, item in enumerate(items[source]) if (rank, pos) in keys]
+                for rank, source in enumerate(SOURCES)
+            }
+
+        # Per-item costs are estimates; drop the weakest until it really fits
+        selected = _select(kept)
+        rendered = render_fn(_with_items(report, selected))
+        while kept and estimate_tokens(rendered) > max_tokens:
+            kept.pop()
+            selected = _select(kept)
+            rendered = render_fn(_with_items(report, selected))
+
+        for source in SOURCES:
+            ids = {id(item) for item in selected[source]}
+            dropped = [getattr(item, "id", "") for item in items[source] if id(item) not in ids]
+            if dropped:
+                summary["dropped"][source] = dropped
+        items = selected
+
+    summary["estimated_tokens"] = estimate_tokens(rendered)
+    return _with_items(report, items), rendered, summary
+
+
+def fit_with_note(
+    report: Any,
+    max_tokens: int,
+    render_fn: Callable[[Any], str],
+) -> Tuple[Any, str, Dict[str, Any]]:
+    """fit_report(), with the budget note appended and counted in the budget.
+
+    The note lists dropped items, so it grows as the report shrinks; the
+    report is refitted into whatever the note leaves over.
+
+    Returns:
+        Tuple of (trimmed_report, rendered_with_note, summary)
+    """
+    remaining = max_tokens
+    while True:
+        trimmed, rendered, summary = fit_report(report, remaining, render_fn)
+        text = rendered + render_budget_note(summary)
+        overflow = estimate_tokens(text) - max_tokens
+        if overflow <= 0 or remaining <= 0:
+            return trimmed, text, summary
+        remaining -= overflow
+
+
+def render_budget_note(summary: Dict[str, Any]) -> str:
+    """One-line note on what the token budget removed (empty if nothing)."""
+    parts = []
+    if summary.get("truncated_fields"):
+        parts.append(
+            f"shortened {summary['truncated_fields']} long fields to "
+            f"{summary['truncated_to']} chars"
+        )
+    dropped = summary.get("dropped") or {}
+    if dropped:
+        total = sum(len(ids) for ids in dropped.values())
+        listed = "; ".join(f"{source}: {', '.join(ids)}" for source, ids in dropped.items())
+        parts.append(f"dropped {total} lower-value items ({listed})")
+    if not parts:
+        return ""
+    return f"\n_Token budget {summary['max_tokens']}: {'; '.join(parts)}._"
@@ -0,0 +1,183 @@
+"""Cross-source clustering for last30days.
+
+Per-source dedupe (dedupe.dedupe_reddit etc.) leaves the same story showing up
+once per source. This pass groups items from different sources that share a
+URL or a near-identical title/text, keeps the top-scored item of each cluster
+as its representative, and records the others as corroborating sightings.
+"""
+
+from typing import Any, Dict, List, Tuple
+from urllib.parse import urlsplit
+
+from . import dedupe, score
+
+# Titles vs tweets vs snippets vary more than items within one source
+CROSS_SOURCE_THRESHOLD = 0.6
+
+# Shorter texts ("Thoughts?", empty titles) are too generic to match on
+MIN_MATCH_CHARS = 20
+
+# Score bonus per additional source that corroborates a story (capped)
+CORROBORATION_BONUS = 5
+MAX_CORROBORATION_BONUS = 15
+
+SOURCES = ("reddit", "x", "youtube", "web")
+
+
+def canonical_url(url: str) -> str:
+    """Reduce a URL to host + path so trivially different links compare equal."""
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if host in ("twitter.com", "mobile.twitter.com"):
+        host = "x.com"
+    path = parts.path.rstrip("/")
+    if host in ("youtube.com", "m.youtube.com") and path == "/watch":
+        # Video identity lives in the query string
+        return f"youtube.com/watch?{parts.query}"
+    return f"{host}{path}"
+
+
+def item_text(item: Any) -> str:
+    """Text used for story matching (title, or post text for X)."""
+    return getattr(item, "title", None) or getattr(item, "text", "") or ""
+
+
+def _find(parent: List[int], i: int) -> int:
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def cluster_items(
+    items_by_source: Dict[str, list],
+    threshold: float = CROSS_SOURCE_THRESHOLD,
+) -> List[List[Tuple[str, Any]]]:
+    """Group items from different sources that describe the same story.
+
+    Only cross-source pairs are compared; within-source duplicates are already
+    removed by per-source dedupe.
+
+    Args:
+        items_by_source: Source name -> scored items
+        threshold: Jaccard similarity threshold for story matching
+
+    Returns:
+        List of clusters, each a list of (source, item) sorted by score desc.
+        Singletons are included.
+    """
+    flat = [
+        (source, item)
+        for source in SOURCES
+        for item in items_by_source.get(source, [])
+    ]
+    parent = list(range(len(flat)))
+
+    def union(i: int, j: int):
+        ri, rj = _find(parent, i), _find(parent, j)
+        if ri != rj:
+            parent[rj] = ri
+
+    # Same URL (e.g. a tweet linking the Reddit thread it was taken from)
+    by_url: Dict[str, int] = {}
+    for i, (_, item) in enumerate(flat):
+        key = canonical_url(getattr(item, "url", ""))
+        if not key:
+            continue
+        if key in by_url:
+            union(by_url[key], i)
+        else:
+            by_url[key] = i
+
+    # Same story, different URLs
+    ngrams = []
+    for _, item in flat:
+        text = dedupe.normalize_text(item_text(item))
+        ngrams.append(dedupe.get_ngrams(text) if len(text) >= MIN_MATCH_CHARS else set())
+    for i in range(len(flat)):
+        for j in range(i + 1, len(flat)):
+            if flat[i][0] == flat[j][0]:
+                continue
+            if dedupe.jaccard_similarity(ngrams[i], ngrams[j]) >= threshold:
+                union(i, j)
+
+    groups: Dict[int, List[Tuple[str, Any]]] = {}
+    for i, entry in enumerate(flat):
+        groups.setdefault(_find(parent, i), []).append(entry)
+
+    return [
+        sorted(members, key=lambda e: getattr(e[1], "score", 0), reverse=True)
+        for members in groups.values()
+    ]
+
+
+def _sighting(source: str, item: Any) -> Dict[str, Any]:
+    return {
+        "source": source,
+        "id": getattr(item, "id", ""),
+        "url": getattr(item, "url", ""),
+        "title": item_text(item)[:120],
+        "score": getattr(item, "score", 0),
+    }
+
+
+def merge_clusters(
+    items_by_source: Dict[str, list],
+    threshold: float = CROSS_SOURCE_THRESHOLD,
+) -> Tuple[Dict[str, list], Dict[str, List[Dict[str, Any]]]]:
+    """Collapse cross-source clusters onto their top-scored representative.
+
+    The representative gets a score bonus for each additional source that
+    corroborates it; the other members are dropped from their source lists
+    and returned as sightings.
+
+    Args:
+        items_by_source: Source name -> scored, per-source deduped items
+        threshold: Jaccard similarity threshold for story matching
+
+    Returns:
+        Tuple of (items_by_source, corroboration) where corroboration maps a
+        representative's ID to its list of sighting dicts
+    """
+    kept: Dict[str, list] = {source: [] for source in SOURCES}
+    corroboration: Dict[str, List[Dict[str, Any]]] = {}
+
+    for members in cluster_items(items_by_source, threshold):
+        rep_source, rep = members[0]
+        others = members[1:]
+        if others:
+            extra_sources = len({source for source, _ in members}) - 1
+            bonus = min(MAX_CORROBORATION_BONUS, CORROBORATION_BONUS * extra_sources)
+            rep.score = min(100, rep.score + bonus)
+            corroboration[rep.id] = [_sighting(source, item) for source, item in others]
+        kept[rep_source].append(rep)
+
+    # Restore score order within each source after bonuses
+    for source in SOURCES:
+        kept[source] = score.sort_items(kept[source])
+
+    return kept, corroboration
+
+
+def render_corroboration(
+    items_by_source: Dict[str, list],
+    corroboration: Dict[str, List[Dict[str, Any]]],
+) -> str:
+    """Render a short 'seen on multiple sources' footer for compact output."""
+    if not corroboration:
+        return ""
+    lines = ["", "### Corroborated Across Sources", ""]
+    for source in SOURCES:
+        for item in items_by_source.get(source, []):
+            sightings = corroboration.get(item.id)
+            if not sightings:
+                continue
+            seen_on = ", ".join(
+                f"{s['source']} {s['id']}" for s in sightings
+            )
+            lines.append(f"- **{item.id}** ({source}) also seen on: {seen_on}")
+    return "\n".join(lines)
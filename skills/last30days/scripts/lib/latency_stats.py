@@ -0,0 +1,109 @@
+"""Adaptive source timeouts for last30days.
+
+Static per-depth timeouts are either too tight for a slow day or far too
+loose for a fast source. LatencyStats keeps recent search latencies per
+depth and source and derives each source's timeout (and whether to hedge
+it) from their tail.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import List
+
+LATENCY_WINDOW = 50          # samples kept per depth/source
+LATENCY_MIN_SAMPLES = 10     # below this the static profile is used
+LATENCY_HEADROOM = 1.5       # timeout = p99 * headroom, then bounded
+TIMEOUT_FLOOR_SECONDS = 15
+TIMEOUT_CEILING_FACTOR = 1.5  # never more than 1.5x the static profile
+HEDGE_TAIL_RATIO = 3.0       # hedge when p99 exceeds 3x the median
+LATENCY_SOURCES = ("reddit", "x", "youtube", "web")
+# Reddit is never hedged: its job also runs enrichment and costs OpenAI tokens
+HEDGED_SOURCES = ("x", "youtube", "web")
+
+# Static profile key holding each source's search timeout
+STATIC_TIMEOUT_KEYS = {
+    "reddit": "reddit_future",
+    "x": "future",
+    "youtube": "youtube_future",
+    "web": "future",
+}
+
+
+def quantile(samples: List[float], q: float) -> float:
+    """Nearest-rank quantile of a non-empty sample list."""
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(q * len(ordered))) - 1))
+    return ordered[rank]
+
+
+class LatencyStats:
+    """Recent per-source search latencies, used to size source timeouts.
+
+    Samples are kept per depth (a deep search does more work than a quick
+    one) in the JSON file at path. A search that timed out is recorded at
+    its timeout, so a degrading source pushes its own timeout up towards
+    the ceiling instead of being cut off ever earlier.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            with open(self.path) as f:
+                self._samples = json.load(f)
+        except (OSError, ValueError):
+            self._samples = {}
+        if not isinstance(self._samples, dict):
+            self._samples = {}
+
+    def record(self, depth: str, source: str, seconds: float):
+        with self._lock:
+            samples = self._samples.setdefault(f"{depth}:{source}", [])
+            samples.append(round(seconds, 2))
+            del samples[:-LATENCY_WINDOW]
+
+    def samples(self, depth: str, source: str) -> List[float]:
+        with self._lock:
+            return list(self._samples.get(f"{depth}:{source}", []))
+
+    def save(self):
+        """Write samples atomically; failures are ignored.
+
+        research_many saves from several threads, so the write is done under
+        the lock (the tmp name is per-process, not per-thread).
+        """
+        with self._lock:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_path, "w") as f:
+                    json.dump(self._samples, f)
+                os.replace(tmp_path, self.path)
+            except OSError:
+                pass  # Stats are an optimization only
+
+    def timeouts(self, depth: str, static_profile: dict) -> dict:
+        """The depth's static timeout profile with timeouts learned from history.
+
+        Adds "<source>_future" keys for every source with enough samples
+        (p99 * LATENCY_HEADROOM, clamped to [TIMEOUT_FLOOR_SECONDS,
+        TIMEOUT_CEILING_FACTOR * static]) and a "hedge_after" map of
+        source -> p95 for long-tailed sources, after which run_research
+        fires a second identical request.
+        """
+        profile = dict(static_profile)
+        hedge_after = {}
+        for source in LATENCY_SOURCES:
+            samples = self.samples(depth, source)
+            if len(samples) < LATENCY_MIN_SAMPLES:
+                continue
+            static = profile[STATIC_TIMEOUT_KEYS[source]]
+            p50, p95, p99 = (quantile(samples, q) for q in (0.5, 0.95, 0.99))
+            timeout = min(static * TIMEOUT_CEILING_FACTOR, max(TIMEOUT_FLOOR_SECONDS, p99 * LATENCY_HEADROOM))
+            profile[f"{source}_future"] = round(timeout, 1)
+            if source in HEDGED_SOURCES and p50 > 0 and p99 > HEDGE_TAIL_RATIO * p50 and p95 < timeout:
+                hedge_after[source] = round(p95, 1)
+        profile["hedge_after"] = hedge_after
+        return profile
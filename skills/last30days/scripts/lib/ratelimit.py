@@ -0,0 +1,251 @@
+"""Process-wide request pacing for last30days upstreams.
+
+Every source call goes through paced(), which takes a token from the
+upstream's TokenBucket first. Buckets are shared by all threads in the
+process, so concurrent topics (research_many) and parallel enrichment
+fetches stay under one request rate per upstream, and a 429 from any
+caller pauses the upstream for everyone.
+"""
+
+import email.utils
+import re
+import threading
+import time
+from typing import Any, Callable, Optional
+
+# Request pacing per upstream: (requests per second, burst). Reddit covers
+# reddit.com JSON (thread enrichment and Phase 2 subreddit search); the
+# others are the search APIs. Unlisted upstreams are not paced.
+UPSTREAM_RATES = {
+    "reddit": (2.0, 5),
+    "openai": (5.0, 10),
+    "xai": (5.0, 10),
+    "bird": (1.0, 2),
+    "youtube": (2.0, 4),
+}
+# Backoff when a 429 carries no usable Retry-After / x-ratelimit-reset
+DEFAULT_RETRY_AFTER = 10.0
+MAX_RETRY_AFTER = 120.0
+# Quota headers, in lookup order (plain, then OpenAI's per-request variant)
+REMAINING_HEADERS = ("x-ratelimit-remaining", "x-ratelimit-remaining-requests")
+RESET_HEADERS = ("x-ratelimit-reset", "x-ratelimit-reset-requests")
+# Numeric reset values above this are Unix timestamps, not delta seconds
+EPOCH_THRESHOLD = 1e9
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+_buckets: dict = {}
+_buckets_lock = threading.Lock()
+
+
+class RateBudgetExceeded(Exception):
+    """An upstream is rate-limited for longer than the caller can wait."""
+
+
+class TokenBucket:
+    """Token-bucket pacing for one upstream, shared by the whole process.
+
+    acquire() blocks until a token is free; pause() empties the bucket and
+    stops refills until a server-imposed backoff (Retry-After) has passed;
+    throttle() lowers the refill rate until the server's rate-limit window
+    resets, so a nearly spent quota is stretched instead of hitting a 429.
+    clock and sleep are injectable for tests.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate = rate
+        self.capacity = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._slow_rate = rate
+        self._slow_until = 0.0
+        self._lock = threading.Lock()
+
+    def pause(self, seconds: float):
+        with self._lock:
+            until = self._clock() + seconds
+            if until > self._paused_until:
+                self._paused_until = until
+                self._tokens = 0.0
+                self._updated = until
+
+    def throttle(self, remaining: float, reset_seconds: float):
+        """Spread the server's remaining quota over its reset window.
+
+        Args:
+            remaining: Requests the server still allows (x-ratelimit-remaining)
+            reset_seconds: Seconds until that quota resets
+        """
+        if remaining < 1:
+            self.pause(reset_seconds)
+            return
+        with self._lock:
+            self._tokens = min(self._tokens, remaining)
+            self._slow_rate = min(self.rate, remaining / reset_seconds)
+            self._slow_until = self._clock() + reset_seconds
+
+    def acquire(self, deadline: Optional[float] = None) -> bool:
+        """Take a token, waiting if needed.
+
+        Args:
+            deadline: clock value (time.monotonic() by default); give up
+                instead of waiting past it
+
+        Returns:
+            False if no token could be had before the deadline
+        """
+        while True:
+            with self._lock:
+                now = self._clock()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    rate = self._slow_rate if now < self._slow_until else self.rate
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * rate)
+                    self._updated = now
+                    # Tolerate float error so a full token is not missed by 1e-15
+                    if self._tokens >= 1 - 1e-9:
+                        self._tokens -= 1
+                        return True
+                    wait = (1 - self._tokens) / rate
+            if deadline is not None and self._clock() + wait > deadline:
+                return False
+            self._sleep(wait)
+
+
+def rate_bucket(upstream: str) -> Optional[TokenBucket]:
+    """Process-wide TokenBucket for an upstream (None if it is not paced)."""
+    if upstream not in UPSTREAM_RATES:
+        return None
+    with _buckets_lock:
+        bucket = _buckets.get(upstream)
+        if bucket is None:
+            bucket = _buckets[upstream] = TokenBucket(*UPSTREAM_RATES[upstream])
+        return bucket
+
+
+def _header(headers: Any, name: str) -> Optional[str]:
+    """Case-insensitive header lookup on a dict or an http.client message."""
+    if not headers:
+        return None
+    value = headers.get(name)
+    if value is None and isinstance(headers, dict):
+        lower = name.lower()
+        value = next((v for k, v in headers.items() if k.lower() == lower), None)
+    return value
+
+
+def _first_header(headers: Any, *names: str) -> Optional[str]:
+    for name in names:
+        value = _header(headers, name)
+        if value is not None:
+            return value
+    return None
+
+
+def parse_wait(value: Any, now: Optional[float] = None) -> Optional[float]:
+    """Seconds to wait from a Retry-After or x-ratelimit-reset value.
+
+    Accepts delta seconds ("30"), Unix timestamps (epoch-style resets),
+    Go-style durations ("1m30s", "250ms") and HTTP-dates (Retry-After).
+
+    Args:
+        now: Current Unix time for timestamps and dates (default: time.time())
+
+    Returns:
+        Seconds (may be negative for a time already past), or None if the
+        value cannot be parsed
+    """
+    if value is None:
+        return None
+    now = time.time() if now is None else now
+    text = str(value).strip()
+    try:
+        number = float(text)
+    except ValueError:
+        pass
+    else:
+        return number - now if number > EPOCH_THRESHOLD else number
+    parts = _DURATION_PART.findall(text)
+    if parts and "".join(amount + unit for amount, unit in parts) == text:
+        return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+    try:
+        when = email.utils.parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        return None
+    return when.timestamp() - now
+
+
+def retry_after(error: BaseException, now: Optional[float] = None) -> Optional[float]:
+    """Backoff in seconds if error is a rate-limit response, else None.
+
+    Reads a retry_after attribute or Retry-After / x-ratelimit-reset headers
+    when the adapter exposes them (see parse_wait() for accepted formats).
+    """
+    status = getattr(error, "status_code", None) or getattr(error, "code", None)
+    if status != 429 and type(error).__name__ != "RedditRateLimitError":
+        return None
+    headers = getattr(error, "headers", None)
+    value = getattr(error, "retry_after", None)
+    if value is None:
+        value = _first_header(headers, "Retry-After", *RESET_HEADERS)
+    wait = parse_wait(value, now)
+    if wait is None:
+        return DEFAULT_RETRY_AFTER
+    return min(MAX_RETRY_AFTER, max(0.0, wait))
+
+
+def observe(upstream: str, headers: Any, now: Optional[float] = None):
+    """Slow an upstream's bucket from x-ratelimit-remaining / -reset headers.
+
+    Called by paced() with the headers of every response or error that
+    exposes them; an HTTP layer can also call it directly.
+    """
+    bucket = rate_bucket(upstream)
+    remaining = _first_header(headers, *REMAINING_HEADERS)
+    reset = parse_wait(_first_header(headers, *RESET_HEADERS), now)
+    if bucket is None or remaining is None or reset is None or reset <= 0:
+        return
+    try:
+        remaining = float(remaining)
+    except ValueError:
+        return
+    bucket.throttle(remaining, min(reset, MAX_RETRY_AFTER))
+
+
+def paced(upstream: str, func: Callable, *args, deadline: Optional[float] = None, **kwargs):
+    """Call func under the upstream's token bucket.
+
+    A rate-limit error pauses the bucket for every caller in the process
+    before it is re-raised. Rate-limit headers on the result or on any
+    other error (a ``headers`` attribute) throttle the bucket through
+    observe().
+
+    Raises:
+        RateBudgetExceeded: if no token is available before deadline
+    """
+    bucket = rate_bucket(upstream)
+    if bucket and not bucket.acquire(deadline):
+        raise RateBudgetExceeded(f"{upstream} rate-limited past the time budget")
+    try:
+        result = func(*args, **kwargs)
+    except Exception as e:
+        wait = retry_after(e)
+        if bucket and wait is not None:
+            bucket.pause(wait)
+        elif bucket:
+            observe(upstream, getattr(e, "headers", None))
+        raise
+    if bucket:
+        observe(upstream, getattr(result, "headers", None))
+    return result
@@ -0,0 +1,68 @@
+"""Per-stage timing for last30days.
+
+One SpanTracer is threaded through a research run (source searches,
+enrichment, Phase 2, per-source processing, clustering, rendering) and
+becomes the report's "timings" block.
+"""
+
+import contextlib
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+
+class SpanTracer:
+    """Per-stage timings for one research run.
+
+    Each span records its wall time, offset from the start of the run and,
+    where known, item count and payload bytes. Spans may be recorded from
+    worker threads. The result is emitted as the report's "timings" block and
+    stored in research_runs.timings with --store.
+    """
+
+    def __init__(self):
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self.spans: List[Dict[str, Any]] = []
+
+    def add(self, name: str, seconds: float, items: Optional[int] = None,
+            nbytes: Optional[int] = None, start: Optional[float] = None):
+        """Record a span measured elsewhere (start is a perf_counter value)."""
+        if start is None:
+            start = time.perf_counter() - seconds
+        span = {"name": name, "start": round(start - self._start, 4), "seconds": round(seconds, 4)}
+        if items is not None:
+            span["items"] = items
+        if nbytes is not None:
+            span["bytes"] = nbytes
+        with self._lock:
+            self.spans.append(span)
+
+    @contextlib.contextmanager
+    def span(self, name: str):
+        """Time a block; set "items"/"bytes" on the yielded dict to record them."""
+        start = time.perf_counter()
+        extra: Dict[str, Any] = {}
+        try:
+            yield extra
+        finally:
+            self.add(name, time.perf_counter() - start,
+                     extra.get("items"), extra.get("bytes"), start=start)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s["start"])
+        return {
+            "total_seconds": round(time.perf_counter() - self._start, 4),
+            "spans": spans,
+        }
+
+    def render(self) -> str:
+        """Plain-text span table for --debug."""
+        lines = [f"{'stage':<28} {'start':>8} {'seconds':>8} {'items':>6} {'bytes':>9}"]
+        for span in self.to_dict()["spans"]:
+            lines.append(
+                f"{span['name']:<28} {span['start']:>8.3f} {span['seconds']:>8.3f} "
+                f"{span.get('items', ''):>6} {span.get('bytes', ''):>9}"
+            )
+        return "\n".join(lines)
@@ -11,12 +11,16 @@ Database location: ~/.local/share/last30days/research.db
 """
 
 import argparse
+import atexit
 import json
+import os
 import sqlite3
 import sys
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 DB_DIR = Path.home() / ".local" / "share" / "last30days"
 DB_PATH = DB_DIR / "research.db"
@@ -83,7 +87,6 @@ CREATE TABLE IF NOT EXISTS findings (
     dismissed INTEGER DEFAULT 0
 );
 
-CREATE INDEX IF NOT EXISTS idx_findings_topic ON findings(topic_id, first_seen);
 CREATE INDEX IF NOT EXISTS idx_findings_source ON findings(source, topic_id);
 CREATE INDEX IF NOT EXISTS idx_findings_url ON findings(source_url);
 
@@ -129,14 +132,54 @@ INSERT OR IGNORE INTO settings (key, value) VALUES ('default_schedule', '0 8 * *
 
 # Future migrations keyed by version number
 MIGRATIONS: Dict[int, str] = {
-    # 2: "ALTER TABLE findings ADD COLUMN tags TEXT DEFAULT '[]';",
+    # Per-stage timing spans (JSON) recorded by last30days.py --store
+    2: "ALTER TABLE research_runs ADD COLUMN timings TEXT;",
+    # Reindex FTS only when an indexed column changes, not on re-sightings
+    # (last_seen, sighting_count, engagement_score, run_id) or dismissals
+    3: """
+DROP TRIGGER IF EXISTS findings_au;
+CREATE TRIGGER findings_au AFTER UPDATE OF content, summary, source_title, author ON findings BEGIN
+    INSERT INTO findings_fts(findings_fts, rowid, content, summary, source_title, author)
+    VALUES ('delete', old.id, old.content, old.summary, old.source_title, old.author);
+    INSERT INTO findings_fts(rowid, content, summary, source_title, author)
+    VALUES (new.id, new.content, new.summary, new.source_title, new.author);
+END;
+""",
+    # Covering indexes for briefing, trending and cost queries. One findings
+    # index serves both the all-findings reads (trending, topic counts) and
+    # the undismissed ones (briefings); dismissed is stored last so the
+    # filter is answered from the index. It supersedes idx_findings_topic.
+    4: """
+DROP INDEX IF EXISTS idx_findings_topic;
+CREATE INDEX IF NOT EXISTS idx_findings_topic_engagement
+    ON findings(topic_id, first_seen, engagement_score, dismissed);
+CREATE INDEX IF NOT EXISTS idx_runs_date ON research_runs(run_date, status, token_cost);
+CREATE INDEX IF NOT EXISTS idx_runs_topic
+    ON research_runs(topic_id, created_at, status, run_date);
+""",
 }
 
 
+# Idle connections kept open per database file (LAST30DAYS_DB_POOL_SIZE)
+POOL_SIZE = int(os.environ.get("LAST30DAYS_DB_POOL_SIZE", "4"))
+# Prepared statements cached per connection
+STATEMENT_CACHE_SIZE = 256
+
+_pools: Dict[str, List[sqlite3.Connection]] = {}
+_pools_lock = threading.Lock()
+_bound = threading.local()  # connection borrowed by the current thread
+_initialized: set = set()
+
+
 def _connect(db_path: Optional[Path] = None) -> sqlite3.Connection:
     """Open a connection with WAL mode and row factory."""
     path = db_path or _get_db_path()
-    conn = sqlite3.connect(str(path))
+    # Pooled connections may be borrowed by different threads in turn
+    conn = sqlite3.connect(
+        str(path),
+        cached_statements=STATEMENT_CACHE_SIZE,
+        check_same_thread=False,
+    )
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("PRAGMA synchronous=NORMAL")
@@ -144,19 +187,92 @@ def _connect(db_path: Optional[Path] = None) -> sqlite3.Connection:
     return conn
 
 
+@contextmanager
+def connection(db_path: Optional[Path] = None) -> Iterator[sqlite3.Connection]:
+    """Borrow a pooled connection for the duration of the block.
+
+    Store functions called inside the block (on the same thread) run over
+    the same connection, so a CLI command or briefing can wrap its work in
+    one ``with store.connection():`` and never reopen the database.
+    """
+    key = str(db_path or _get_db_path())
+    bound = getattr(_bound, "conns", None)
+    if bound is None:
+        bound = _bound.conns = {}
+    if key in bound:
+        yield bound[key]
+        return
+
+    with _pools_lock:
+        idle = _pools.setdefault(key, [])
+        conn = idle.pop() if idle else None
+    if conn is None:
+        conn = _connect(Path(key))
+
+    bound[key] = conn
+    try:
+        yield conn
+    finally:
+        del bound[key]
+        if conn.in_transaction:
+            conn.rollback()
+        with _pools_lock:
+            idle = _pools.setdefault(key, [])
+            if len(idle) < POOL_SIZE:
+                idle.append(conn)
+                conn = None
+        if conn is not None:
+            conn.close()
+
+
+@contextmanager
+def transaction(db_path: Optional[Path] = None) -> Iterator[sqlite3.Connection]:
+    """Run the block in one transaction: commit on success, roll back on error.
+
+    Nested transaction() blocks join the outermost one.
+    """
+    with connection(db_path) as conn:
+        if conn.in_transaction:
+            yield conn
+            return
+        conn.execute("BEGIN")
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
+
+def close_connections():
+    """Close every idle pooled connection."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for idle in pools:
+        for conn in idle:
+            conn.close()
+
+
+atexit.register(close_connections)
+
+
 def init_db(db_path: Optional[Path] = None) -> Path:
-    """Create database and tables if they don't exist. Returns the DB path."""
+    """Create database and tables if they don't exist. Returns the DB path.
+
+    Runs once per database file per process.
+    """
     path = db_path or _get_db_path()
+    if str(path) in _initialized:
+        return path
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    conn = _connect(path)
-    try:
+    with connection(path) as conn:
         conn.executescript(SCHEMA_V1)
         conn.executescript(SCHEMA_V1_DEFAULTS)
         _run_migrations(conn)
         conn.commit()
-    finally:
-        conn.close()
+    _initialized.add(str(path))
 
     return path
 
@@ -185,8 +301,7 @@ def add_topic(
 ) -> Dict[str, Any]:
     """Add a topic to the watchlist. Returns the topic dict."""
     init_db()
-    conn = _connect()
-    try:
+    with transaction() as conn:
         queries_json = json.dumps(search_queries) if search_queries else None
         conn.execute(
             """INSERT INTO topics (name, search_queries, schedule)
@@ -197,20 +312,16 @@ def add_topic(
                    updated_at = datetime('now')""",
             (name, queries_json, schedule),
         )
-        conn.commit()
         row = conn.execute(
             "SELECT * FROM topics WHERE name = ?", (name,)
         ).fetchone()
         return dict(row)
-    finally:
-        conn.close()
 
 
 def remove_topic(name: str) -> bool:
     """Remove a topic from the watchlist. Returns True if found."""
     init_db()
-    conn = _connect()
-    try:
+    with transaction() as conn:
         row = conn.execute(
             "SELECT id FROM topics WHERE name = ?", (name,)
         ).fetchone()
@@ -221,17 +332,13 @@ def remove_topic(name: str) -> bool:
         conn.execute("DELETE FROM findings WHERE topic_id = ?", (topic_id,))
         conn.execute("DELETE FROM research_runs WHERE topic_id = ?", (topic_id,))
         conn.execute("DELETE FROM topics WHERE id = ?", (topic_id,))
-        conn.commit()
         return True
-    finally:
-        conn.close()
 
 
 def list_topics() -> List[Dict[str, Any]]:
     """List all topics with stats."""
     init_db()
-    conn = _connect()
-    try:
+    with connection() as conn:
         rows = conn.execute(
             """SELECT t.*,
                       (SELECT COUNT(*) FROM findings WHERE topic_id = t.id) as finding_count,
@@ -242,21 +349,16 @@ def list_topics() -> List[Dict[str, Any]]:
                ORDER BY t.name"""
         ).fetchall()
         return [dict(r) for r in rows]
-    finally:
-        conn.close()
 
 
 def get_topic(name: str) -> Optional[Dict[str, Any]]:
     """Get a topic by name."""
     init_db()
-    conn = _connect()
-    try:
+    with connection() as conn:
         row = conn.execute(
             "SELECT * FROM topics WHERE name = ?", (name,)
         ).fetchone()
         return dict(row) if row else None
-    finally:
-        conn.close()
 
 
 # --- Research Runs ---
@@ -273,8 +375,7 @@ def record_run(
     token_cost: float = 0,
 ) -> int:
     """Record a research run. Returns the run ID."""
-    conn = _connect()
-    try:
+    with transaction() as conn:
         cursor = conn.execute(
             """INSERT INTO research_runs
                (topic_id, run_date, source_mode, status, error_message,
@@ -285,95 +386,108 @@ def record_run(
                 duration_seconds, prompt_tokens, completion_tokens, token_cost,
             ),
         )
-        conn.commit()
         return cursor.lastrowid
-    finally:
-        conn.close()
 
 
 def update_run(run_id: int, **kwargs):
     """Update a research run's fields."""
-    conn = _connect()
-    try:
+    with transaction() as conn:
         sets = ", ".join(f"{k} = ?" for k in kwargs)
         values = list(kwargs.values()) + [run_id]
         conn.execute(f"UPDATE research_runs SET {sets} WHERE id = ?", values)
-        conn.commit()
-    finally:
-        conn.close()
 
 
 # --- Findings ---
 
 
+# Per-batch staging table for store_findings (one row per distinct URL)
+_STAGE_FINDINGS = """
+CREATE TEMP TABLE IF NOT EXISTS staged_findings (
+    source_url TEXT PRIMARY KEY,
+    source TEXT,
+    source_title TEXT,
+    author TEXT,
+    content TEXT,
+    summary TEXT,
+    engagement_score REAL,
+    relevance_score REAL,
+    hits INTEGER
+)"""
+
+
 def store_findings(
     run_id: int,
     topic_id: int,
     findings: List[Dict[str, Any]],
 ) -> Dict[str, int]:
-    """Store findings with URL-based dedup. Returns counts of new/updated."""
-    conn = _connect()
-    new_count = 0
-    updated_count = 0
+    """Store findings with URL-based dedup. Returns counts of new/updated.
+
+    The batch is staged in a temp table and merged with one
+    INSERT ... ON CONFLICT(source_url) DO UPDATE in a single transaction.
+    A URL seen again (in an earlier run or earlier in the same batch) counts
+    as updated: its sighting_count grows, engagement_score keeps the max and
+    last_seen/run_id move to this run. Text columns of existing findings are
+    never rewritten.
+    """
+    rows = []
+    for f in findings:
+        url = f.get("source_url") or f.get("url")
+        if not url:
+            continue
+        rows.append((
+            url,
+            f.get("source", "unknown"),
+            f.get("source_title") or f.get("title", ""),
+            f.get("author", ""),
+            f.get("content") or f.get("text", ""),
+            f.get("summary", ""),
+            f.get("engagement_score", 0),
+            f.get("relevance_score", 0),
+        ))
+
+    with transaction() as conn:
+        conn.execute(_STAGE_FINDINGS)
+        conn.execute("DELETE FROM temp.staged_findings")
+        # First occurrence of a URL wins, later ones count as re-sightings
+        conn.executemany(
+            """INSERT INTO temp.staged_findings
+               (source_url, source, source_title, author, content, summary,
+                engagement_score, relevance_score, hits)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1)
+               ON CONFLICT(source_url) DO UPDATE SET
+                   engagement_score = max(COALESCE(engagement_score, 0), COALESCE(excluded.engagement_score, 0)),
+                   hits = hits + 1""",
+            rows,
+        )
+        new_count = conn.execute(
+            """SELECT COUNT(*) FROM temp.staged_findings s
+               WHERE NOT EXISTS (SELECT 1 FROM findings f WHERE f.source_url = s.source_url)"""
+        ).fetchone()[0]
+        updated_count = len(rows) - new_count
 
-    try:
-        for f in findings:
-            url = f.get("source_url") or f.get("url")
-            if not url:
-                continue
-
-            existing = conn.execute(
-                "SELECT id, engagement_score, sighting_count FROM findings WHERE source_url = ?",
-                (url,),
-            ).fetchone()
-
-            if existing:
-                # Update engagement and re-sighting info
-                new_engagement = f.get("engagement_score", 0)
-                conn.execute(
-                    """UPDATE findings SET
-                           last_seen = datetime('now'),
-                           sighting_count = sighting_count + 1,
-                           engagement_score = ?,
-                           run_id = ?
-                       WHERE id = ?""",
-                    (
-                        max(new_engagement, existing["engagement_score"] or 0),
-                        run_id,
-                        existing["id"],
-                    ),
-                )
-                updated_count += 1
-            else:
-                # New finding
-                conn.execute(
-                    """INSERT INTO findings
-                       (run_id, topic_id, source, source_url, source_title,
-                        author, content, summary, engagement_score, relevance_score)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (
-                        run_id,
-                        topic_id,
-                        f.get("source", "unknown"),
-                        url,
-                        f.get("source_title") or f.get("title", ""),
-                        f.get("author", ""),
-                        f.get("content") or f.get("text", ""),
-                        f.get("summary", ""),
-                        f.get("engagement_score", 0),
-                        f.get("relevance_score", 0),
-                    ),
-                )
-                new_count += 1
+        conn.execute(
+            """INSERT INTO findings
+               (run_id, topic_id, source, source_url, source_title,
+                author, content, summary, engagement_score, relevance_score,
+                sighting_count)
+               SELECT ?, ?, source, source_url, source_title,
+                      author, content, summary, engagement_score, relevance_score,
+                      hits
+               FROM temp.staged_findings WHERE true
+               ON CONFLICT(source_url) DO UPDATE SET
+                   last_seen = datetime('now'),
+                   sighting_count = sighting_count + excluded.sighting_count,
+                   engagement_score = max(COALESCE(excluded.engagement_score, 0), COALESCE(findings.engagement_score, 0)),
+                   run_id = excluded.run_id""",
+            (run_id, topic_id),
+        )
+        conn.execute("DELETE FROM temp.staged_findings")
 
         # Update run stats
         conn.execute(
             "UPDATE research_runs SET findings_new = ?, findings_updated = ? WHERE id = ?",
             (new_count, updated_count, run_id),
         )
-        conn.commit()
-    finally:
-        conn.close()
 
     return {"new": new_count, "updated": updated_count}
 
@@ -381,33 +495,34 @@ def store_findings(
 def get_new_findings(
     topic_id: int,
     since: Optional[str] = None,
+    limit: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
-    """Get findings for a topic, optionally since a date."""
-    conn = _connect()
-    try:
+    """Get findings for a topic, newest first, optionally since a date."""
+    # LIMIT -1 means no limit in SQLite
+    limit = -1 if limit is None else limit
+    with connection() as conn:
         if since:
             rows = conn.execute(
                 """SELECT * FROM findings
                    WHERE topic_id = ? AND first_seen >= ? AND dismissed = 0
-                   ORDER BY first_seen DESC""",
-                (topic_id, since),
+                   ORDER BY first_seen DESC
+                   LIMIT ?""",
+                (topic_id, since, limit),
             ).fetchall()
         else:
             rows = conn.execute(
                 """SELECT * FROM findings
                    WHERE topic_id = ? AND dismissed = 0
-                   ORDER BY first_seen DESC""",
-                (topic_id,),
+                   ORDER BY first_seen DESC
+                   LIMIT ?""",
+                (topic_id, limit),
             ).fetchall()
         return [dict(r) for r in rows]
-    finally:
-        conn.close()
 
 
 def search_findings(query: str, limit: int = 20) -> List[Dict[str, Any]]:
     """FTS5 search across all findings with BM25 ranking."""
-    conn = _connect()
-    try:
+    with connection() as conn:
         rows = conn.execute(
             """SELECT f.*, bm25(findings_fts) as rank, t.name as topic_name
                FROM findings_fts
@@ -419,30 +534,20 @@ def search_findings(query: str, limit: int = 20) -> List[Dict[str, Any]]:
             (query, limit),
         ).fetchall()
         return [dict(r) for r in rows]
-    finally:
-        conn.close()
 
 
 def update_finding(finding_id: int, **kwargs):
     """Update a finding's fields."""
-    conn = _connect()
-    try:
+    with transaction() as conn:
         sets = ", ".join(f"{k} = ?" for k in kwargs)
         values = list(kwargs.values()) + [finding_id]
         conn.execute(f"UPDATE findings SET {sets} WHERE id = ?", values)
-        conn.commit()
-    finally:
-        conn.close()
 
 
 def delete_finding(finding_id: int):
     """Delete a finding."""
-    conn = _connect()
-    try:
+    with transaction() as conn:
         conn.execute("DELETE FROM findings WHERE id = ?", (finding_id,))
-        conn.commit()
-    finally:
-        conn.close()
 
 
 def dismiss_finding(finding_id: int):
@@ -455,19 +560,16 @@ def dismiss_finding(finding_id: int):
 
 def get_daily_cost(date: Optional[str] = None) -> float:
     """Get total token cost for a given day (default: today)."""
-    conn = _connect()
-    try:
+    with connection() as conn:
         if not date:
             date = datetime.now().strftime("%Y-%m-%d")
         row = conn.execute(
             """SELECT COALESCE(SUM(token_cost), 0) as total
                FROM research_runs
-               WHERE date(run_date) = date(?)""",
-            (date,),
+               WHERE run_date >= date(?) AND run_date < date(?, '+1 day')""",
+            (date, date),
         ).fetchone()
         return row["total"]
-    finally:
-        conn.close()
 
 
 # --- Settings ---
@@ -476,21 +578,17 @@ def get_daily_cost(date: Optional[str] = None) -> float:
 def get_setting(key: str, default: Optional[str] = None) -> Optional[str]:
     """Get a setting value."""
     init_db()
-    conn = _connect()
-    try:
+    with connection() as conn:
         row = conn.execute(
             "SELECT value FROM settings WHERE key = ?", (key,)
         ).fetchone()
         return row["value"] if row else default
-    finally:
-        conn.close()
 
 
 def set_setting(key: str, value: str):
     """Set a setting value."""
     init_db()
-    conn = _connect()
-    try:
+    with transaction() as conn:
         conn.execute(
             """INSERT INTO settings (key, value, updated_at)
                VALUES (?, ?, datetime('now'))
@@ -499,9 +597,6 @@ def set_setting(key: str, value: str):
                    updated_at = datetime('now')""",
             (key, value),
         )
-        conn.commit()
-    finally:
-        conn.close()
 
 
 # --- Stats ---
@@ -509,29 +604,21 @@ def set_setting(key: str, value: str):
 
 def get_stats() -> Dict[str, Any]:
     """Get overall database stats."""
-    conn = _connect()
-    try:
+    with connection() as conn:
         topic_count = conn.execute("SELECT COUNT(*) FROM topics WHERE enabled = 1").fetchone()[0]
-        finding_count = conn.execute("SELECT COUNT(*) FROM findings").fetchone()[0]
 
         week_ago = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
-        runs_7d = conn.execute(
-            "SELECT COUNT(*) FROM research_runs WHERE run_date >= ?", (week_ago,)
-        ).fetchone()[0]
-        successful_7d = conn.execute(
-            "SELECT COUNT(*) FROM research_runs WHERE run_date >= ? AND status = 'completed'",
-            (week_ago,),
-        ).fetchone()[0]
-        failed_7d = conn.execute(
-            "SELECT COUNT(*) FROM research_runs WHERE run_date >= ? AND status = 'failed'",
-            (week_ago,),
-        ).fetchone()[0]
-        cost_7d = conn.execute(
-            "SELECT COALESCE(SUM(token_cost), 0) FROM research_runs WHERE run_date >= ?",
+        runs = conn.execute(
+            """SELECT COUNT(*) as runs,
+                      COALESCE(SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END), 0) as successful,
+                      COALESCE(SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END), 0) as failed,
+                      COALESCE(SUM(token_cost), 0) as cost
+               FROM research_runs
+               WHERE run_date >= ?""",
             (week_ago,),
-        ).fetchone()[0]
+        ).fetchone()
 
-        # Source breakdown
+        # Source breakdown; the total is its sum
         sources = {}
         for row in conn.execute(
             "SELECT source, COUNT(*) as cnt FROM findings GROUP BY source"
@@ -543,23 +630,20 @@ def get_stats() -> Dict[str, Any]:
 
         return {
             "topics_active": topic_count,
-            "total_findings": finding_count,
+            "total_findings": sum(sources.values()),
             "db_size_bytes": db_size,
-            "runs_7d": runs_7d,
-            "successful_7d": successful_7d,
-            "failed_7d": failed_7d,
-            "cost_7d": cost_7d,
+            "runs_7d": runs["runs"],
+            "successful_7d": runs["successful"],
+            "failed_7d": runs["failed"],
+            "cost_7d": runs["cost"],
             "sources": sources,
             "daily_budget": get_setting("daily_budget", "5.00"),
         }
-    finally:
-        conn.close()
 
 
 def get_trending(days: int = 7) -> List[Dict[str, Any]]:
     """Get topics ranked by recent finding activity."""
-    conn = _connect()
-    try:
+    with connection() as conn:
         since = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
         rows = conn.execute(
             """SELECT t.name, t.id,
@@ -573,8 +657,31 @@ def get_trending(days: int = 7) -> List[Dict[str, Any]]:
             (since,),
         ).fetchall()
         return [dict(r) for r in rows]
-    finally:
-        conn.close()
+
+
+def get_weekly_rollup(week_ago: str, two_weeks_ago: str) -> List[Dict[str, Any]]:
+    """Per-topic finding counts and engagement for this week and last week.
+
+    One grouped query over undismissed findings first seen since two_weeks_ago;
+    "this week" is first_seen >= week_ago, "last week" the days before it.
+    """
+    with connection() as conn:
+        rows = conn.execute(
+            """SELECT t.id, t.name, t.enabled,
+                      COALESCE(SUM(f.first_seen >= ?), 0) as this_week_count,
+                      COALESCE(SUM(f.first_seen < ?), 0) as last_week_count,
+                      COALESCE(SUM(CASE WHEN f.first_seen >= ?
+                                   THEN f.engagement_score END), 0) as this_week_engagement,
+                      COALESCE(SUM(CASE WHEN f.first_seen < ?
+                                   THEN f.engagement_score END), 0) as last_week_engagement
+               FROM topics t
+               LEFT JOIN findings f
+                   ON f.topic_id = t.id AND f.first_seen >= ? AND f.dismissed = 0
+               GROUP BY t.id
+               ORDER BY t.name""",
+            (week_ago, week_ago, week_ago, week_ago, two_weeks_ago),
+        ).fetchall()
+        return [dict(r) for r in rows]
 
 
 # --- CLI interface ---
@@ -647,7 +754,8 @@ def main():
 
     # Ensure DB exists
     init_db()
-    args.func(args)
+    with connection():
+        args.func(args)
 
 
 if __name__ == "__main__":
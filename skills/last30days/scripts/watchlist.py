@@ -17,10 +17,7 @@ Usage:
 
 import argparse
 import json
-import subprocess
 import sys
-import time
-from datetime import datetime
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).parent.resolve()
@@ -86,7 +83,7 @@ def cmd_run_one(args):
         print(json.dumps({"error": f'Topic not found: "{args.topic}"'}))
         sys.exit(1)
 
-    _run_topic(topic)
+    print(json.dumps(_run_topics([topic])[0], default=str))
 
 
 def cmd_run_all(args):
@@ -99,21 +96,18 @@ def cmd_run_all(args):
         return
 
     budget_limit = float(store.get_setting("daily_budget", "5.00"))
-    results = []
-
-    for topic in enabled:
-        # Budget guard
-        daily_cost = store.get_daily_cost()
-        if daily_cost >= budget_limit:
-            results.append({
-                "topic": topic["name"],
-                "status": "skipped",
-                "reason": f"Budget exceeded: ${daily_cost:.2f}/${budget_limit:.2f}",
-            })
-            continue
 
-        result = _run_topic(topic)
-        results.append(result)
+    # Budget guard: checked before the batch (to skip setup when nothing can
+    # run) and again by research_many before each topic starts
+    budget_check = _budget_guard(budget_limit)
+    reason = budget_check()
+    if reason:
+        results = [
+            {"topic": topic["name"], "status": "skipped", "reason": reason}
+            for topic in enabled
+        ]
+    else:
+        results = _run_topics(enabled, budget_check)
 
     print(json.dumps({
         "action": "run_all",
@@ -123,74 +117,74 @@ def cmd_run_all(args):
     }, default=str))
 
 
-def _run_topic(topic: dict) -> dict:
-    """Run research for a single topic and store findings."""
-    start_time = time.time()
-    topic_id = topic["id"]
+def _budget_guard(budget_limit: float):
+    """Return a check that gives a skip reason once today's cost reaches budget_limit."""
+    def _check():
+        daily_cost = store.get_daily_cost()
+        if daily_cost >= budget_limit:
+            return f"Budget exceeded: ${daily_cost:.2f}/${budget_limit:.2f}"
+        return None
+    return _check
+
 
-    # Record the run
-    run_id = store.record_run(topic_id, source_mode="both", status="running")
+def _run_topics(topics: list, budget_check=None) -> list:
+    """Run research for several topics in one process and store findings.
+
+    Setup (config, source detection, model selection) is paid once by
+    last30days.research_many instead of once per topic subprocess. Topics
+    that overrun research_many's per-topic or batch deadline come back as
+    failed ("Research timed out after Ns") and are recorded that way.
+    Topics that budget_check stopped from starting are reported as skipped
+    and, like before the batch, get no run row.
+    """
+    import last30days
 
     try:
-        # Run the research script
-        cmd = [
-            sys.executable,
-            str(SCRIPT_DIR / "last30days.py"),
-            topic["name"],
-            "--emit=json",
-        ]
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300,
+        batch = last30days.research_many(
+            [topic["name"] for topic in topics], budget_check=budget_check,
         )
+    except Exception as e:
+        batch = [
+            {"topic": topic["name"], "status": "failed", "duration": 0, "error": str(e)}
+            for topic in topics
+        ]
+
+    results = []
+    for topic, outcome in zip(topics, batch):
+        if outcome["status"] == "skipped":
+            results.append({"topic": topic["name"], "status": "skipped", "reason": outcome["reason"]})
+            continue
 
-        duration = time.time() - start_time
+        topic_id = topic["id"]
+        run_id = store.record_run(topic_id, source_mode="both", status="running")
+        duration = outcome.get("duration", 0)
 
-        if result.returncode != 0:
+        if outcome["status"] != "completed":
             store.update_run(
                 run_id,
                 status="failed",
-                error_message=result.stderr[:500],
+                error_message=str(outcome.get("error", ""))[:500],
                 duration_seconds=duration,
             )
-            return {
+            results.append({
                 "topic": topic["name"],
                 "status": "failed",
-                "error": result.stderr[:200],
+                "error": str(outcome.get("error", ""))[:200],
                 "duration": duration,
-            }
-
-        # Parse research output
-        data = json.loads(result.stdout)
-
-        # Convert research items to findings format
-        findings = []
-        for item in data.get("reddit", []):
-            findings.append({
-                "source": "reddit",
-                "url": item.get("url", ""),
-                "title": item.get("title", ""),
-                "author": item.get("author", ""),
-                "content": item.get("title", ""),
-                "summary": item.get("top_comments_summary", ""),
-                "engagement_score": item.get("upvotes", 0),
-                "relevance_score": item.get("relevance", 0),
-            })
-        for item in data.get("x", []):
-            findings.append({
-                "source": "x",
-                "url": item.get("url", ""),
-                "title": item.get("text", "")[:100],
-                "author": item.get("author_handle", ""),
-                "content": item.get("text", ""),
-                "engagement_score": (item.get("engagement") or {}).get("likes", 0),
-                "relevance_score": item.get("relevance", 0),
             })
+            continue
 
-        # Store with dedup
-        counts = store.store_findings(run_id, topic_id, findings)
+        try:
+            # Store with dedup
+            counts = store.store_findings(run_id, topic_id, outcome["findings"])
+        except Exception as e:
+            store.update_run(
+                run_id, status="failed",
+                error_message=str(e)[:500],
+                duration_seconds=duration,
+            )
+            results.append({"topic": topic["name"], "status": "failed", "error": str(e)})
+            continue
 
         store.update_run(
             run_id,
@@ -199,41 +193,15 @@ def _run_topic(topic: dict) -> dict:
             findings_new=counts["new"],
             findings_updated=counts["updated"],
         )
-
-        return {
+        results.append({
             "topic": topic["name"],
             "status": "completed",
             "new": counts["new"],
             "updated": counts["updated"],
             "duration": duration,
-        }
-
-    except subprocess.TimeoutExpired:
-        duration = time.time() - start_time
-        store.update_run(
-            run_id, status="failed",
-            error_message="Research timed out after 300s",
-            duration_seconds=duration,
-        )
-        return {"topic": topic["name"], "status": "failed", "error": "timeout"}
-
-    except json.JSONDecodeError as e:
-        duration = time.time() - start_time
-        store.update_run(
-            run_id, status="failed",
-            error_message=f"Invalid JSON output: {e}",
-            duration_seconds=duration,
-        )
-        return {"topic": topic["name"], "status": "failed", "error": f"parse error: {e}"}
+        })
 
-    except Exception as e:
-        duration = time.time() - start_time
-        store.update_run(
-            run_id, status="failed",
-            error_message=str(e)[:500],
-            duration_seconds=duration,
-        )
-        return {"topic": topic["name"], "status": "failed", "error": str(e)}
+    return results
 
 
 def cmd_config(args):
@@ -289,7 +257,9 @@ def main():
         parser.print_help()
         sys.exit(1)
 
-    args.func(args)
+    # One database connection for the whole command
+    with store.connection():
+        args.func(args)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,79 @@
+"""Tests for the benchmark harness."""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import benchmark
+
+
+class TestSynthesizeItems(unittest.TestCase):
+    def test_splits_between_sources(self):
+        items = benchmark.synthesize_items(101, "2026-01-01", "2026-01-31")
+        self.assertEqual(len(items["reddit"]), 51)
+        self.assertEqual(len(items["x"]), 50)
+
+    def test_unique_urls(self):
+        items = benchmark.synthesize_items(200, "2026-01-01", "2026-01-31")
+        urls = [item["url"] for item in items["reddit"] + items["x"]]
+        self.assertEqual(len(urls), len(set(urls)))
+
+    def test_deterministic(self):
+        a = benchmark.synthesize_items(50, "2026-01-01", "2026-01-31", seed=1)
+        b = benchmark.synthesize_items(50, "2026-01-01", "2026-01-31", seed=1)
+        self.assertEqual(a, b)
+
+
+class TestCompare(unittest.TestCase):
+    def _report(self, seconds):
+        return {"sizes": {"1000": {"dedupe": {"seconds": seconds}}}}
+
+    def test_flags_slowdown(self):
+        regressions = benchmark.compare(self._report(0.5), self._report(0.2))
+        self.assertEqual(len(regressions), 1)
+        self.assertEqual(regressions[0]["stage"], "dedupe")
+
+    def test_ignores_noise(self):
+        regressions = benchmark.compare(self._report(0.002), self._report(0.001))
+        self.assertEqual(regressions, [])
+
+    def test_ignores_missing_baseline_sizes(self):
+        baseline = {"sizes": {"100": {"dedupe": {"seconds": 0.001}}}}
+        self.assertEqual(benchmark.compare(self._report(1.0), baseline), [])
+
+
+class TestLoadBaseline(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+
+    def test_explicit_path(self):
+        path = self.dir / "bench.json"
+        path.write_text(json.dumps({"sizes": {"100": {}}}))
+        self.assertEqual(benchmark.load_baseline(str(path)), {"sizes": {"100": {}}})
+
+    def test_defaults_to_reference_file(self):
+        reference = self.dir / "benchmark_baseline.json"
+        reference.write_text(json.dumps({"sizes": {}}))
+        with mock.patch.object(benchmark, "BASELINE_FILE", reference):
+            self.assertEqual(benchmark.load_baseline(None), {"sizes": {}})
+
+    def test_no_reference_file(self):
+        with mock.patch.object(benchmark, "BASELINE_FILE", self.dir / "missing.json"):
+            self.assertIsNone(benchmark.load_baseline(None))
+
+
+class TestDefaults(unittest.TestCase):
+    def test_default_sizes_skip_quadratic_tiers(self):
+        self.assertLessEqual(max(benchmark.DEFAULT_SIZES), 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+"""Tests for budget module."""
+
+import sys
+import unittest
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import budget
+
+
+@dataclass
+class FakeItem:
+    id: str
+    title: str
+    score: int
+    top_comments_summary: str = ""
+
+
+@dataclass
+class FakeReport:
+    topic: str
+    reddit: list = field(default_factory=list)
+    x: list = field(default_factory=list)
+    youtube: list = field(default_factory=list)
+    web: list = field(default_factory=list)
+
+
+def render(report):
+    lines = [f"# {report.topic}"]
+    for source in budget.SOURCES:
+        for item in getattr(report, source):
+            lines.append(f"- {item.id} {item.title} ({item.score}) {item.top_comments_summary}")
+    return "\n".join(lines)
+
+
+def make_report(n=10):
+    return FakeReport(
+        topic="test",
+        reddit=[
+            FakeItem(f"R{i}", "word " * 20, 100 - i, "comment " * 100)
+            for i in range(n)
+        ],
+    )
+
+
+class TestTruncateText(unittest.TestCase):
+    def test_short_text_unchanged(self):
+        self.assertEqual(budget.truncate_text("short", 10), "short")
+
+    def test_cuts_on_word_boundary(self):
+        result = budget.truncate_text("alpha beta gamma delta", 12)
+        self.assertEqual(result, "alpha beta…")
+
+
+class TestFitReport(unittest.TestCase):
+    def test_fits_without_changes(self):
+        report = make_report()
+        trimmed, text, summary = budget.fit_report(report, 100000, render)
+        self.assertEqual(text, render(report))
+        self.assertEqual(summary["dropped"], {})
+        self.assertEqual(summary["truncated_fields"], 0)
+
+    def test_truncates_before_dropping(self):
+        report = make_report()
+        trimmed, text, summary = budget.fit_report(report, 1500, render)
+        self.assertLessEqual(budget.estimate_tokens(text), 1500)
+        self.assertEqual(summary["dropped"], {})
+        self.assertEqual(summary["truncated_to"], 400)
+        self.assertEqual(len(trimmed.reddit), 10)
+
+    def test_drops_lowest_value_items(self):
+        report = make_report()
+        trimmed, text, summary = budget.fit_report(report, 400, render)
+        self.assertLessEqual(budget.estimate_tokens(text), 400)
+        self.assertIn("R9", summary["dropped"]["reddit"])
+        self.assertEqual(trimmed.reddit[0].id, "R0")
+
+    def test_does_not_modify_input(self):
+        report = make_report()
+        budget.fit_report(report, 100, render)
+        self.assertEqual(len(report.reddit), 10)
+        self.assertEqual(len(report.reddit[0].top_comments_summary), 800)
+
+    def test_deterministic(self):
+        first = budget.fit_report(make_report(), 300, render)[1]
+        second = budget.fit_report(make_report(), 300, render)[1]
+        self.assertEqual(first, second)
+
+
+class TestFitWithNote(unittest.TestCase):
+    def test_note_counts_against_budget(self):
+        for max_tokens in (200, 300, 400, 1500):
+            _, text, summary = budget.fit_with_note(make_report(), max_tokens, render)
+            self.assertLessEqual(budget.estimate_tokens(text), max_tokens)
+            self.assertTrue(text.endswith(budget.render_budget_note(summary)))
+
+    def test_footer_in_render_fn_is_budgeted(self):
+        def with_footer(report):
+            return render(report) + "\n" + "footer " * 50
+        _, text, _ = budget.fit_with_note(make_report(), 400, with_footer)
+        self.assertLessEqual(budget.estimate_tokens(text), 400)
+        self.assertIn("footer", text)
+
+
+class TestRenderBudgetNote(unittest.TestCase):
+    def test_empty_when_nothing_trimmed(self):
+        summary = {"max_tokens": 10, "truncated_fields": 0, "dropped": {}}
+        self.assertEqual(budget.render_budget_note(summary), "")
+
+    def test_lists_dropped_items(self):
+        summary = {"max_tokens": 10, "truncated_fields": 0, "dropped": {"x": ["X1", "X2"]}}
+        note = budget.render_budget_note(summary)
+        self.assertIn("dropped 2", note)
+        self.assertIn("X1, X2", note)
+
+
+if __name__ == "__main__":
+    unittest.main()
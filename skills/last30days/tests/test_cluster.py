@@ -0,0 +1,97 @@
+"""Tests for cluster module."""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import cluster, schema
+
+
+class TestCanonicalUrl(unittest.TestCase):
+    def test_strips_scheme_and_www(self):
+        result = cluster.canonical_url("https://www.example.com/post/1/")
+        self.assertEqual(result, "example.com/post/1")
+
+    def test_twitter_maps_to_x(self):
+        a = cluster.canonical_url("https://twitter.com/user/status/1")
+        b = cluster.canonical_url("https://x.com/user/status/1")
+        self.assertEqual(a, b)
+
+    def test_youtube_keeps_video_id(self):
+        a = cluster.canonical_url("https://www.youtube.com/watch?v=abc")
+        b = cluster.canonical_url("https://www.youtube.com/watch?v=xyz")
+        self.assertNotEqual(a, b)
+
+    def test_empty(self):
+        self.assertEqual(cluster.canonical_url(""), "")
+
+
+class TestMergeClusters(unittest.TestCase):
+    def test_merges_same_story_across_sources(self):
+        reddit = [
+            schema.RedditItem(
+                id="R1", title="OpenAI releases new reasoning model for coding",
+                url="https://reddit.com/r/test/1", subreddit="test", score=80,
+            ),
+        ]
+        x = [
+            schema.XItem(
+                id="X1", text="OpenAI releases new reasoning model for coding!",
+                url="https://x.com/user/1", author_handle="user", score=60,
+            ),
+        ]
+
+        kept, corroboration = cluster.merge_clusters({"reddit": reddit, "x": x})
+
+        self.assertEqual([item.id for item in kept["reddit"]], ["R1"])
+        self.assertEqual(kept["x"], [])
+        self.assertEqual(corroboration["R1"][0]["id"], "X1")
+        self.assertEqual(kept["reddit"][0].score, 80 + cluster.CORROBORATION_BONUS)
+
+    def test_merges_same_url(self):
+        reddit = [
+            schema.RedditItem(id="R1", title="A thread", url="https://reddit.com/r/a/1", subreddit="a", score=40),
+        ]
+        x = [
+            schema.XItem(id="X1", text="look", url="https://www.reddit.com/r/a/1/", author_handle="u", score=70),
+        ]
+
+        kept, corroboration = cluster.merge_clusters({"reddit": reddit, "x": x})
+
+        self.assertEqual(kept["reddit"], [])
+        self.assertEqual([item.id for item in kept["x"]], ["X1"])
+        self.assertIn("X1", corroboration)
+
+    def test_keeps_unrelated_items(self):
+        reddit = [
+            schema.RedditItem(id="R1", title="Topic about apples and orchards", url="", subreddit="", score=50),
+        ]
+        x = [
+            schema.XItem(id="X1", text="Completely different discussion of rockets", url="", author_handle="u", score=50),
+        ]
+
+        kept, corroboration = cluster.merge_clusters({"reddit": reddit, "x": x})
+
+        self.assertEqual(len(kept["reddit"]), 1)
+        self.assertEqual(len(kept["x"]), 1)
+        self.assertEqual(corroboration, {})
+
+    def test_short_texts_do_not_match(self):
+        reddit = [schema.RedditItem(id="R1", title="Thoughts?", url="", subreddit="", score=50)]
+        x = [schema.XItem(id="X1", text="Thoughts?", url="", author_handle="u", score=50)]
+
+        kept, corroboration = cluster.merge_clusters({"reddit": reddit, "x": x})
+
+        self.assertEqual(corroboration, {})
+
+    def test_empty(self):
+        kept, corroboration = cluster.merge_clusters({})
+        self.assertEqual(kept["reddit"], [])
+        self.assertEqual(corroboration, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""Tests for latency_stats module."""
+
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import latency_stats
+
+PROFILE = {"future": 60, "reddit_future": 90, "youtube_future": 90}
+
+
+class TestLatencyStats(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = Path(self._tmp.name) / "latency_stats.json"
+
+    def _stats(self, source="x", samples=()):
+        stats = latency_stats.LatencyStats(self.path)
+        for seconds in samples:
+            stats.record("default", source, seconds)
+        return stats
+
+    def test_quantile(self):
+        samples = list(range(1, 101))
+        self.assertEqual(latency_stats.quantile(samples, 0.5), 50)
+        self.assertEqual(latency_stats.quantile(samples, 0.99), 99)
+        self.assertEqual(latency_stats.quantile([7], 0.99), 7)
+
+    def test_static_profile_below_min_samples(self):
+        stats = self._stats(samples=[5] * (latency_stats.LATENCY_MIN_SAMPLES - 1))
+        self.assertEqual(stats.timeouts("default", PROFILE), dict(PROFILE, hedge_after={}))
+
+    def test_learned_timeout_is_clamped(self):
+        fast = self._stats(samples=[1] * 20).timeouts("default", PROFILE)
+        self.assertEqual(fast["x_future"], latency_stats.TIMEOUT_FLOOR_SECONDS)
+        slow = self._stats(samples=[200] * 20).timeouts("default", PROFILE)
+        self.assertEqual(slow["x_future"], 60 * latency_stats.TIMEOUT_CEILING_FACTOR)
+        typical = self._stats(samples=[20] * 20).timeouts("default", PROFILE)
+        self.assertEqual(typical["x_future"], 20 * latency_stats.LATENCY_HEADROOM)
+
+    def test_long_tail_is_hedged_at_p95(self):
+        samples = [4] * 45 + [10] * 3 + [30] * 2
+        timeouts = self._stats(samples=samples).timeouts("default", PROFILE)
+        self.assertEqual(timeouts["hedge_after"], {"x": 10})
+
+    def test_reddit_is_never_hedged(self):
+        samples = [4] * 45 + [10] * 3 + [30] * 2
+        timeouts = self._stats("reddit", samples).timeouts("default", PROFILE)
+        self.assertIn("reddit_future", timeouts)
+        self.assertEqual(timeouts["hedge_after"], {})
+
+    def test_window_keeps_recent_samples(self):
+        stats = self._stats(samples=range(latency_stats.LATENCY_WINDOW + 5))
+        self.assertEqual(stats.samples("default", "x")[0], 5)
+
+    def test_save_round_trip_and_corrupt_file(self):
+        self._stats(samples=[3, 4]).save()
+        self.assertEqual(latency_stats.LatencyStats(self.path).samples("default", "x"), [3, 4])
+        self.path.write_text("[not a dict]")
+        self.assertEqual(latency_stats.LatencyStats(self.path).samples("default", "x"), [])
+
+    def test_concurrent_saves_keep_file_valid(self):
+        stats = self._stats(samples=range(200))
+        threads = [threading.Thread(target=stats.save) for _ in range(32)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        reloaded = latency_stats.LatencyStats(self.path)
+        self.assertEqual(len(reloaded.samples("default", "x")), latency_stats.LATENCY_WINDOW)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,238 @@
+"""Tests for ratelimit module."""
+
+import sys
+import unittest
+from email.utils import formatdate
+from pathlib import Path
+from unittest import mock
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import ratelimit
+
+NOW = 1_760_000_000.0  # fixed Unix time for date/timestamp parsing
+
+
+class FakeClock:
+    """Monotonic clock that only moves when the bucket sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.slept.append(round(seconds, 6))
+        self.now += seconds
+
+
+def bucket(rate=2.0, burst=3):
+    clock = FakeClock()
+    return ratelimit.TokenBucket(rate, burst, clock=clock, sleep=clock.sleep), clock
+
+
+class HTTPError(Exception):
+    def __init__(self, code, headers=None):
+        super().__init__(f"HTTP {code}")
+        self.code = code
+        self.headers = headers or {}
+
+
+class RedditRateLimitError(Exception):
+    def __init__(self, retry_after=None):
+        super().__init__("429")
+        self.retry_after = retry_after
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_refill_rate(self):
+        tb, clock = bucket(rate=2.0, burst=3)
+        for _ in range(3):
+            self.assertTrue(tb.acquire())
+        self.assertEqual(clock.now, 0)
+        self.assertTrue(tb.acquire())
+        self.assertAlmostEqual(clock.now, 0.5)
+
+    def test_refill_is_capped_at_capacity(self):
+        tb, clock = bucket(rate=2.0, burst=3)
+        for _ in range(3):
+            tb.acquire()
+        clock.now += 60
+        for _ in range(3):
+            tb.acquire()
+        self.assertEqual(clock.slept, [])
+        tb.acquire()
+        self.assertEqual(clock.slept, [0.5])
+
+    def test_deadline_gives_up_without_sleeping(self):
+        tb, clock = bucket(rate=1.0, burst=1)
+        tb.acquire()
+        self.assertFalse(tb.acquire(deadline=0.5))
+        self.assertEqual(clock.slept, [])
+        self.assertTrue(tb.acquire(deadline=1.0))
+
+    def test_pause_blocks_until_backoff_ends(self):
+        tb, clock = bucket(rate=2.0, burst=3)
+        tb.pause(30)
+        self.assertFalse(tb.acquire(deadline=10))
+        self.assertTrue(tb.acquire())
+        # Paused bucket starts empty: first token is one refill after the pause
+        self.assertAlmostEqual(clock.now, 30.5)
+
+    def test_throttle_spreads_remaining_quota(self):
+        tb, clock = bucket(rate=5.0, burst=10)
+        tb.throttle(remaining=2, reset_seconds=20)
+        tb.acquire()
+        tb.acquire()
+        self.assertEqual(clock.now, 0)
+        tb.acquire()
+        # 2 requests per 20s until the reset
+        self.assertAlmostEqual(clock.now, 10)
+
+    def test_throttle_ends_at_reset(self):
+        tb, clock = bucket(rate=5.0, burst=10)
+        tb.throttle(remaining=1, reset_seconds=4)
+        tb.acquire()
+        self.assertFalse(tb.acquire(deadline=3.9))
+        clock.now = 4.0
+        # The quota has reset: the full burst is available again
+        for _ in range(10):
+            tb.acquire()
+        self.assertEqual(clock.now, 4.0)
+
+    def test_throttle_never_speeds_up(self):
+        tb, clock = bucket(rate=1.0, burst=1)
+        tb.throttle(remaining=500, reset_seconds=10)
+        tb.acquire()
+        tb.acquire()
+        self.assertAlmostEqual(clock.now, 1.0)
+
+    def test_exhausted_quota_pauses(self):
+        tb, clock = bucket(rate=5.0, burst=10)
+        tb.throttle(remaining=0, reset_seconds=15)
+        tb.acquire()
+        self.assertAlmostEqual(clock.now, 15.2)
+
+
+class TestRetryAfter(unittest.TestCase):
+    def test_not_rate_limited(self):
+        self.assertIsNone(ratelimit.retry_after(HTTPError(500, {"Retry-After": "5"})))
+
+    def test_retry_after_seconds(self):
+        self.assertEqual(ratelimit.retry_after(HTTPError(429, {"Retry-After": "7"})), 7)
+
+    def test_retry_after_http_date(self):
+        error = HTTPError(429, {"Retry-After": formatdate(NOW + 42, usegmt=True)})
+        self.assertEqual(ratelimit.retry_after(error, now=NOW), 42)
+
+    def test_header_names_are_case_insensitive(self):
+        self.assertEqual(ratelimit.retry_after(HTTPError(429, {"retry-after": "3"})), 3)
+
+    def test_reset_as_delta_timestamp_and_duration(self):
+        cases = {"12": 12, str(int(NOW + 30)): 30, "1m30s": 90, "250ms": 0.25}
+        for value, expected in cases.items():
+            with self.subTest(value=value):
+                error = HTTPError(429, {"x-ratelimit-reset": value})
+                self.assertAlmostEqual(ratelimit.retry_after(error, now=NOW), expected)
+
+    def test_openai_request_reset_header(self):
+        error = HTTPError(429, {"x-ratelimit-reset-requests": "6s"})
+        self.assertEqual(ratelimit.retry_after(error), 6)
+
+    def test_reddit_error_attribute(self):
+        self.assertEqual(ratelimit.retry_after(RedditRateLimitError(retry_after=4)), 4)
+
+    def test_missing_or_unparseable_uses_default(self):
+        for headers in ({}, {"Retry-After": "soon"}):
+            with self.subTest(headers=headers):
+                self.assertEqual(
+                    ratelimit.retry_after(HTTPError(429, headers)), ratelimit.DEFAULT_RETRY_AFTER,
+                )
+
+    def test_clamped(self):
+        self.assertEqual(
+            ratelimit.retry_after(HTTPError(429, {"Retry-After": "99999"})), ratelimit.MAX_RETRY_AFTER,
+        )
+        error = HTTPError(429, {"Retry-After": formatdate(NOW - 10, usegmt=True)})
+        self.assertEqual(ratelimit.retry_after(error, now=NOW), 0)
+
+
+class Response(dict):
+    """Parsed JSON body that also exposes the response headers."""
+
+    def __init__(self, headers):
+        super().__init__()
+        self.headers = headers
+
+
+class TestPaced(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.bucket = ratelimit.TokenBucket(5.0, 10, clock=self.clock, sleep=self.clock.sleep)
+        patches = [
+            mock.patch.dict(ratelimit.UPSTREAM_RATES, {"test": (5.0, 10)}),
+            mock.patch.dict(ratelimit._buckets, {"test": self.bucket}),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_unpaced_upstream_calls_through(self):
+        self.assertEqual(ratelimit.paced("other", pow, 2, 3), 8)
+
+    def test_rate_limit_pauses_bucket_for_everyone(self):
+        def limited():
+            raise HTTPError(429, {"Retry-After": "30"})
+
+        with self.assertRaises(HTTPError):
+            ratelimit.paced("test", limited)
+        with self.assertRaises(ratelimit.RateBudgetExceeded):
+            ratelimit.paced("test", pow, 2, 3, deadline=self.clock.now + 5)
+        self.assertEqual(ratelimit.paced("test", pow, 2, 3), 8)
+        self.assertGreaterEqual(self.clock.now, 30)
+
+    def test_other_errors_do_not_pause(self):
+        def broken():
+            raise ValueError("bad json")
+
+        with self.assertRaises(ValueError):
+            ratelimit.paced("test", broken)
+        ratelimit.paced("test", pow, 2, 3)
+        self.assertEqual(self.clock.slept, [])
+
+    def test_response_headers_throttle_before_429(self):
+        response = Response({"x-ratelimit-remaining": "1", "x-ratelimit-reset": "10"})
+        ratelimit.paced("test", lambda: response)
+        ratelimit.paced("test", pow, 2, 3)
+        self.assertEqual(self.clock.now, 0)
+        ratelimit.paced("test", pow, 2, 3)
+        self.assertAlmostEqual(self.clock.now, 10)
+
+    def test_retry_waits_out_backoff(self):
+        # The enrichment retry loop: a 429, then the same call succeeds
+        attempts = []
+
+        def flaky():
+            attempts.append(self.clock.now)
+            if len(attempts) == 1:
+                raise RedditRateLimitError(retry_after=3)
+            return "ok"
+
+        with self.assertRaises(RedditRateLimitError):
+            ratelimit.paced("test", flaky)
+        self.assertEqual(ratelimit.paced("test", flaky), "ok")
+        self.assertGreaterEqual(attempts[1] - attempts[0], 3)
+
+
+class TestProcessBuckets(unittest.TestCase):
+    def test_one_bucket_per_upstream(self):
+        with mock.patch.dict(ratelimit._buckets, clear=True):
+            self.assertIs(ratelimit.rate_bucket("reddit"), ratelimit.rate_bucket("reddit"))
+            self.assertIsNone(ratelimit.rate_bucket("unlisted"))
+
+
+if __name__ == "__main__":
+    unittest.main()
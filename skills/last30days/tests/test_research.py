@@ -0,0 +1,641 @@
+"""Tests for the research runtime in last30days.py (pools, deadlines, streaming).
+
+lib adapters are replaced per test, so these run without any API keys.
+"""
+
+import io
+import json
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from concurrent.futures import Future
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
+
+# Add scripts to path
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import last30days
+from lib import latency_stats, ratelimit
+
+
+class FakeReport:
+    def to_dict(self):
+        return {"reddit": [], "x": []}
+
+
+class TestDaemonThreadPool(unittest.TestCase):
+    def test_runs_jobs(self):
+        pool = last30days.DaemonThreadPool(2)
+        futures = [pool.submit(pow, 2, n) for n in range(5)]
+        self.assertEqual([f.result(timeout=5) for f in futures], [1, 2, 4, 8, 16])
+        pool.shutdown()
+
+    def test_abandoned_job_does_not_block_exit(self):
+        code = (
+            "import time, last30days\n"
+            "from concurrent.futures import wait\n"
+            "pool = last30days.DaemonThreadPool(2)\n"
+            "wait([pool.submit(time.sleep, 6)], timeout=0.5)\n"
+            "pool.shutdown(wait=False, cancel_futures=True)\n"
+        )
+        start = time.monotonic()
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=str(SCRIPTS_DIR),
+            capture_output=True, text=True, timeout=30,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertLess(time.monotonic() - start, 3)
+
+    def test_shutdown_cancels_queued_jobs(self):
+        pool = last30days.DaemonThreadPool(1)
+        pool.submit(time.sleep, 0.3)
+        queued = pool.submit(pow, 2, 2)
+        pool.shutdown(wait=False, cancel_futures=True)
+        self.assertTrue(queued.cancelled())
+
+
+NO_RESULTS = ([], [], [], [], False, None, None, [], None, None, None, None)
+
+
+def patch_pipeline(test: unittest.TestCase, run_research=None, build_report=None):
+    """Replace config, source detection and the pipeline stages for one test."""
+    patches = [
+        mock.patch.object(last30days, "env", SimpleNamespace(get_config=dict)),
+        mock.patch.object(last30days, "dates", SimpleNamespace(
+            get_date_range=lambda days: ("2026-01-01", "2026-01-31"))),
+        mock.patch.object(last30days, "_probe_sources", return_value=({"source": None}, False)),
+        mock.patch.object(last30days, "_resolve_sources", return_value=("both", None)),
+        mock.patch.object(last30days, "_select_models", return_value={}),
+        mock.patch.object(last30days, "run_research",
+                          side_effect=run_research or (lambda *a, **k: NO_RESULTS)),
+        mock.patch.object(last30days, "_build_report",
+                          return_value=build_report or (FakeReport(), {}, {})),
+    ]
+    for patch in patches:
+        patch.start()
+        test.addCleanup(patch.stop)
+
+
+class TestSourceJobs(unittest.TestCase):
+    def test_timeout_comes_from_loop(self):
+        start = time.monotonic()
+        results = last30days._run_source_jobs([
+            ("fast", None, pow, (2, 3), 5),
+            ("slow", None, time.sleep, (5,), 0.2),
+        ])
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual(results["fast"], (8, None))
+        self.assertIsInstance(results["slow"][1], TimeoutError)
+
+    def test_on_done_true_cancels_remaining(self):
+        start = time.monotonic()
+        results = last30days._run_source_jobs(
+            [("fast", None, pow, (2, 3), 5), ("slow", None, time.sleep, (5,), 5)],
+            on_done=lambda name, value, error: name == "fast",
+        )
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual(list(results), ["fast"])
+
+    def test_await_futures(self):
+        pool = last30days.DaemonThreadPool(2)
+        futures = {
+            "done": (pool.submit(pow, 2, 2), 5),
+            "slow": (pool.submit(time.sleep, 5), 0.2),
+        }
+        results = last30days._await_futures(futures)
+        pool.shutdown(wait=False)
+        self.assertEqual(results["done"], (4, None))
+        self.assertIsInstance(results["slow"][1], TimeoutError)
+
+    def test_await_futures_finished_without_time_left(self):
+        done = Future()
+        done.set_result(4)
+        failed = Future()
+        failed.set_exception(ValueError("boom"))
+        results = last30days._await_futures({"done": (done, 0), "failed": (failed, 0)})
+        self.assertEqual(results["done"], (4, None))
+        self.assertIsInstance(results["failed"][1], ValueError)
+
+
+class RateLimited(Exception):
+    pass
+
+
+class TestEnrichReddit(unittest.TestCase):
+    def _enrich(self, fetch, items, enrich_per=5, enrich_total=0.5):
+        reddit_enrich = SimpleNamespace(RedditRateLimitError=RateLimited, enrich_reddit_item=fetch)
+        timeouts = {"enrich_max_items": len(items), "enrich_per": enrich_per, "enrich_total": enrich_total}
+        with mock.patch.object(last30days, "reddit_enrich", reddit_enrich), \
+                mock.patch.object(last30days, "_enrich_priority",
+                                  side_effect=lambda items: list(range(len(items)))):
+            return last30days._enrich_reddit(items, timeouts, mock=False)
+
+    def test_budget_keeps_slow_items_unenriched(self):
+        def fetch(item):
+            if item["url"] == "slow":
+                time.sleep(5)
+            return dict(item, enriched=True)
+
+        start = time.monotonic()
+        items, raw, rate_limited = self._enrich(fetch, [{"url": "a"}, {"url": "slow"}, {"url": "b"}])
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual([item.get("enriched", False) for item in items], [True, False, True])
+        self.assertEqual(len(raw), 3)
+        self.assertFalse(rate_limited)
+
+    def test_per_fetch_budget(self):
+        def fetch(item):
+            if item["url"] == "slow":
+                time.sleep(5)
+            return dict(item, enriched=True)
+
+        start = time.monotonic()
+        items, _, _ = self._enrich(
+            fetch, [{"url": "slow"}, {"url": "a"}], enrich_per=0.3, enrich_total=10,
+        )
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual([item.get("enriched", False) for item in items], [False, True])
+
+    def test_queued_fetches_get_full_per_fetch_budget(self):
+        def fetch(item):
+            time.sleep(0.2)
+            return dict(item, enriched=True)
+
+        with mock.patch.object(last30days, "ENRICH_CONCURRENCY", 1):
+            items, _, _ = self._enrich(
+                fetch, [{"url": "a"}, {"url": "b"}, {"url": "c"}], enrich_per=0.5, enrich_total=10,
+            )
+        self.assertTrue(all(item.get("enriched") for item in items))
+
+    def test_rate_limit_stops_enrichment(self):
+        def fetch(item):
+            raise RateLimited("429")
+
+        _, _, rate_limited = self._enrich(fetch, [{"url": "a"}])
+        self.assertTrue(rate_limited)
+
+
+def reddit_item(url, relevance=0.5, date=None, score=None):
+    item = {"url": url, "relevance": relevance, "date": date}
+    if score is not None:
+        item["engagement"] = {"score": score}
+    return item
+
+
+class TestEnrichPriority(unittest.TestCase):
+    def setUp(self):
+        recency = {"2026-01-30": 100, "2026-01-20": 50}
+        for name, value in (
+            ("schema", SimpleNamespace(Engagement=SimpleNamespace)),
+            ("score", SimpleNamespace(compute_reddit_engagement_raw=lambda eng: eng.score)),
+            ("dates", SimpleNamespace(recency_score=lambda date: recency.get(date, 0))),
+        ):
+            patcher = mock.patch.object(last30days, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_engagement_orders_equal_relevance(self):
+        items = [reddit_item("low", score=10), reddit_item("high", score=500), reddit_item("none")]
+        self.assertEqual(last30days._enrich_priority(items), [1, 0, 2])
+
+    def test_recency_orders_equal_relevance(self):
+        items = [reddit_item("old", date="2026-01-02"), reddit_item("new", date="2026-01-30"),
+                 reddit_item("mid", date="2026-01-20")]
+        self.assertEqual(last30days._enrich_priority(items), [1, 2, 0])
+
+    def test_ties_keep_search_order(self):
+        items = [reddit_item("a"), reddit_item("b"), reddit_item("c")]
+        self.assertEqual(last30days._enrich_priority(items), [0, 1, 2])
+
+    def test_max_items_cutoff_enriches_top_items(self):
+        items = [reddit_item("a", score=1), reddit_item("b", score=300),
+                 reddit_item("c", score=2), reddit_item("d", score=200)]
+        reddit_enrich = SimpleNamespace(
+            RedditRateLimitError=RateLimited,
+            enrich_reddit_item=lambda item: dict(item, enriched=True),
+        )
+        timeouts = {"enrich_max_items": 2, "enrich_per": 5, "enrich_total": 5}
+        with mock.patch.object(last30days, "reddit_enrich", reddit_enrich):
+            enriched, raw, _ = last30days._enrich_reddit(items, timeouts, mock=False)
+        self.assertEqual([item["url"] for item in enriched if item.get("enriched")], ["b", "d"])
+        self.assertEqual(sorted(item["url"] for item in raw), ["b", "d"])
+
+
+def extract_entities(reddit_items, x_items, max_handles, max_subreddits):
+    """Stand-in for lib.entity_extract: entities in order of first mention."""
+    subs = list(dict.fromkeys(item["subreddit"] for item in reddit_items))
+    handles = list(dict.fromkeys(item["author_handle"] for item in x_items))
+    return {"reddit_subreddits": subs[:max_subreddits], "x_handles": handles[:max_handles]}
+
+
+def reddit_items(*subs):
+    return [{"url": f"https://reddit.com/r/{sub}/p{n}", "subreddit": sub} for n, sub in enumerate(subs)]
+
+
+def x_items(*handles):
+    return [{"url": f"https://x.com/{h}/status/{n}", "author_handle": h} for n, h in enumerate(handles)]
+
+
+class TestSpeculativeSupplemental(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.delays = {}
+
+        def search_subreddits(subreddits, topic, from_date, to_date, count_per):
+            self.calls.append(("reddit", list(subreddits), count_per))
+            for sub in subreddits:
+                time.sleep(self.delays.get(sub, 0))
+            return [
+                {"url": f"https://reddit.com/r/{sub}/drill{n}", "subreddit": sub}
+                for sub in subreddits for n in range(count_per)
+            ]
+
+        def search_handles(handles, topic, from_date, count_per):
+            self.calls.append(("x", list(handles), count_per))
+            return [
+                {"url": f"https://x.com/{h}/status/drill{n}", "author_handle": h}
+                for h in handles for n in range(count_per)
+            ]
+
+        patches = [
+            mock.patch.object(last30days, "entity_extract", SimpleNamespace(extract_entities=extract_entities)),
+            mock.patch.object(last30days, "openai_reddit", SimpleNamespace(search_subreddits=search_subreddits)),
+            mock.patch.object(last30days, "bird_x", SimpleNamespace(search_handles=search_handles)),
+            mock.patch.dict(ratelimit._buckets, clear=True),
+            mock.patch.dict(ratelimit.UPSTREAM_RATES, clear=True),
+            mock.patch("sys.stderr"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def _speculative(self, x_source="bird"):
+        return last30days.SpeculativeSupplemental("topic", "2026-01-01", "2026-01-31", "default", x_source)
+
+    def _wait_started(self, spec):
+        for future, _ in spec._futures.values():
+            future.result(timeout=5)
+
+    def test_starts_one_drill_down_per_entity(self):
+        spec = self._speculative()
+        spec.on_items("reddit", reddit_items("a", "a", "b", "c", "c"), "search")
+        spec.on_items("x", x_items("h1", "h2", "h2", "h3", "h3"), "search")
+        self._wait_started(spec)
+        self.assertEqual(sorted(self.calls), [
+            ("reddit", ["a"], 3), ("reddit", ["b"], 3), ("reddit", ["c"], 3),
+            ("x", ["h1"], 3), ("x", ["h2"], 3), ("x", ["h3"], 3),
+        ])
+
+    def test_waits_for_enough_search_items(self):
+        spec = self._speculative(x_source="xai")
+        spec.on_items("reddit", reddit_items("a", "b", "c", "d"), "search")
+        spec.on_items("reddit", reddit_items("a", "b", "c", "d", "e"), "enriched")
+        spec.on_items("x", x_items("h1", "h2", "h3", "h4", "h5"), "search")
+        self.assertEqual(spec._futures, {})
+
+    def test_collect_drops_entities_that_no_longer_rank(self):
+        spec = self._speculative()
+        spec.on_items("reddit", reddit_items("a", "b", "b", "c", "c"), "search")
+        final = reddit_items("d", "d", "e", "e", "a")
+        sup_reddit, sup_x = spec.collect(final, [])
+        self.assertEqual(
+            sorted({item["subreddit"] for item in sup_reddit}), ["a", "d", "e"],
+        )
+        self.assertEqual(len(sup_reddit), 9)
+        self.assertEqual(sup_x, [])
+
+    def test_collect_skips_reddit_when_rate_limited(self):
+        spec = self._speculative()
+        spec.on_items("reddit", reddit_items("a", "b", "b", "c", "c"), "search")
+        sup_reddit, _ = spec.collect(reddit_items("a", "b", "c"), [], skip_reddit=True)
+        self.assertEqual(sup_reddit, [])
+
+    def test_collect_keeps_drill_downs_finished_before_phase1(self):
+        # Phase 1 outlasting SUPPLEMENTAL_TIMEOUT must not discard finished work
+        with mock.patch.object(last30days, "SUPPLEMENTAL_TIMEOUT", 0.2):
+            spec = self._speculative()
+            items = reddit_items("a", "b", "b", "c", "c")
+            spec.on_items("reddit", items, "search")
+            self._wait_started(spec)
+            time.sleep(0.3)
+            sup_reddit, _ = spec.collect(items, [])
+        self.assertEqual(len(sup_reddit), 9)
+
+    def test_collect_drops_slow_drill_down(self):
+        self.delays["slow"] = 5
+        with mock.patch.object(last30days, "SUPPLEMENTAL_TIMEOUT", 0.3):
+            spec = self._speculative()
+            items = reddit_items("a", "slow", "slow", "c", "c")
+            spec.on_items("reddit", items, "search")
+            start = time.monotonic()
+            sup_reddit, _ = spec.collect(items, [])
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual(sorted({item["subreddit"] for item in sup_reddit}), ["a", "c"])
+
+    def test_same_items_as_barrier_mode(self):
+        reddit = reddit_items("a", "b", "b", "c", "c")
+        x = x_items("h1", "h2", "h2", "h3", "h3")
+        barrier = last30days._run_supplemental(
+            "topic", reddit, x, "2026-01-01", "2026-01-31", "default", "bird",
+        )
+        spec = self._speculative()
+        spec.on_items("reddit", reddit, "search")
+        adaptive = spec.collect(reddit, x)
+        for barrier_items, adaptive_items in zip(barrier, adaptive):
+            self.assertEqual(
+                sorted(item["url"] for item in barrier_items),
+                sorted(item["url"] for item in adaptive_items),
+            )
+
+    def test_run_research_phase2_modes(self):
+        search_x = mock.patch.object(
+            last30days, "_search_x", return_value=(x_items("h1", "h2", "h2", "h3", "h3"), None, None),
+        )
+        for phase2 in ("adaptive", "barrier"):
+            with self.subTest(phase2=phase2), search_x, mock.patch.object(
+                last30days, "_run_supplemental", wraps=last30days._run_supplemental,
+            ) as barrier:
+                results = last30days.run_research(
+                    "topic", "x", {}, {}, "2026-01-01", "2026-01-31", "default",
+                    x_source="bird", phase2=phase2,
+                )
+                self.assertEqual(barrier.called, phase2 == "barrier")
+                # 5 Phase 1 items + 3 handles x count_per 3
+                self.assertEqual(len(results[1]), 14)
+
+
+class TestResearchManyDeadlines(unittest.TestCase):
+    def setUp(self):
+        def slow_run_research(topic, *args, **kwargs):
+            if topic.startswith("slow"):
+                time.sleep(5)
+            return NO_RESULTS
+
+        patch_pipeline(self, run_research=slow_run_research)
+
+    def test_topic_timeout_marks_failed(self):
+        start = time.monotonic()
+        results = last30days.research_many(
+            ["fast", "slow one"], mock=True, topic_timeout=0.3,
+        )
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual([r["status"] for r in results], ["completed", "failed"])
+        self.assertIn("timed out", results[1]["error"])
+
+    def test_batch_timeout_covers_queued_topics(self):
+        start = time.monotonic()
+        results = last30days.research_many(
+            ["slow a", "slow b", "fast"], mock=True, max_workers=1,
+            topic_timeout=10, batch_timeout=0.3,
+        )
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual([r["status"] for r in results], ["failed"] * 3)
+
+
+class TestResearchManyBudget(unittest.TestCase):
+    def test_stops_starting_topics_once_budget_is_spent(self):
+        patch_pipeline(self)
+        spent = iter([None, "Budget exceeded: $5.00/$5.00"])
+        results = last30days.research_many(
+            ["a", "b", "c"], mock=True, max_workers=1,
+            budget_check=lambda: next(spent, "Budget exceeded: $5.00/$5.00"),
+        )
+        self.assertEqual([r["status"] for r in results], ["completed", "skipped", "skipped"])
+        self.assertEqual(results[1]["reason"], "Budget exceeded: $5.00/$5.00")
+        self.assertEqual(last30days.run_research.call_count, 1)
+
+
+class TestJsonlStream(unittest.TestCase):
+    def test_report_is_last_line(self):
+        out = io.StringIO()
+        stream = last30days.JsonlStream("2026-01-01", "2026-01-31", out)
+        with mock.patch.object(last30days, "_process_source", return_value=[]):
+            stream.emit_items("reddit", [], "search")
+            stream.emit_report(FakeReport())
+            # A source the run gave up on finishes after the report
+            stream.emit_items("reddit", [], "enriched")
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([line["type"] for line in lines], ["partial", "report"])
+
+
+class TestFindingsFromItems(unittest.TestCase):
+    def test_converts_every_source(self):
+        engagement = SimpleNamespace(score=40, likes=7, views=900)
+        findings = last30days._findings_from_items({
+            "reddit": [SimpleNamespace(
+                url="https://reddit.com/r/a/1", title="Thread", subreddit="a",
+                top_comments_summary="summary", engagement=engagement, relevance=0.9,
+            )],
+            "x": [SimpleNamespace(
+                url="https://x.com/b/status/1", text="Same story", author_handle="b",
+                engagement=engagement, relevance=0.8,
+            )],
+            "youtube": [],
+            "web": [],
+        })
+        self.assertEqual([f["source"] for f in findings], ["reddit", "x"])
+        self.assertEqual(findings[0]["engagement_score"], 40)
+        self.assertEqual(findings[0]["summary"], "summary")
+        self.assertEqual(findings[1]["engagement_score"], 7)
+
+    def test_research_many_returns_findings(self):
+        deduped = {"reddit": [], "x": [SimpleNamespace(
+            url="https://x.com/b/status/1", text="Folded into a Reddit thread",
+            author_handle="b", engagement=None, relevance=0.5,
+        )]}
+        patch_pipeline(self, build_report=(FakeReport(), {}, deduped))
+        result = last30days.research_many(["topic"], mock=True)[0]
+        self.assertEqual([f["url"] for f in result["findings"]], ["https://x.com/b/status/1"])
+
+
+class TestDeltaSnapshot(unittest.TestCase):
+    def test_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "delta.json"
+            last30days._save_delta_snapshot(path, "2026-01-01", "2026-01-31", {"x": [{"url": "u"}]})
+            snapshot = last30days._load_delta_snapshot(path, "2026-01-02", "2026-02-01")
+            self.assertEqual(snapshot["x"], [{"url": "u", last30days.DELTA_FIRST_SEEN: "2026-01-31"}])
+            self.assertEqual(json.loads(path.read_text())["to_date"], "2026-01-31")
+
+    def test_keeps_first_seen_stamp(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "delta.json"
+            item = {"url": "u", last30days.DELTA_FIRST_SEEN: "2026-01-10"}
+            last30days._save_delta_snapshot(path, "2026-01-02", "2026-02-01", {"web": [item]})
+            saved = json.loads(path.read_text())["web"]
+            self.assertEqual(saved[0][last30days.DELTA_FIRST_SEEN], "2026-01-10")
+
+    def test_unwritable_cache_is_ignored(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            blocker = Path(tmp) / "not-a-dir"
+            blocker.write_text("")
+            with mock.patch("sys.stderr"):
+                last30days._save_delta_snapshot(blocker / "delta.json", "2026-01-01", "2026-01-31", {})
+
+
+def seen(url, first_seen, date=None):
+    return {"url": url, "date": date, last30days.DELTA_FIRST_SEEN: first_seen}
+
+
+class TestMergeDelta(unittest.TestCase):
+    def test_fresh_items_win_on_url(self):
+        cached = [seen("a", "2026-01-20", date="2026-01-15"), seen("b", "2026-01-20", date="2026-01-16")]
+        fresh = [{"url": "a", "date": "2026-01-15", "score": 99}]
+        merged = last30days._merge_delta(cached, fresh, "2026-01-05")
+        self.assertEqual([item["url"] for item in merged], ["a", "b"])
+        self.assertEqual(merged[0]["score"], 99)
+
+    def test_dated_items_before_window_are_dropped(self):
+        cached = [seen("old", "2026-01-31", date="2026-01-01"), seen("new", "2026-01-31", date="2026-01-20")]
+        merged = last30days._merge_delta(cached, [], "2026-01-05")
+        self.assertEqual([item["url"] for item in merged], ["new"])
+
+    def test_undated_items_age_out_by_first_seen(self):
+        cached = [seen("stale", "2026-01-02"), seen("recent", "2026-01-20")]
+        merged = last30days._merge_delta(cached, [], "2026-01-05")
+        self.assertEqual([item["url"] for item in merged], ["recent"])
+
+    def test_date_wins_over_first_seen(self):
+        # A dated item first seen long ago is kept while its date is in the window
+        merged = last30days._merge_delta([seen("a", "2026-01-01", date="2026-01-10")], [], "2026-01-05")
+        self.assertEqual(len(merged), 1)
+
+    def test_unstamped_undated_items_are_dropped(self):
+        self.assertEqual(last30days._merge_delta([{"url": "a"}], [], "2026-01-05"), [])
+
+
+class TestRedditFallback(unittest.TestCase):
+    def _search(self, fallback):
+        queries = []
+
+        def search_reddit(key, model, query, from_date, to_date, depth):
+            queries.append(query)
+            return {"items": [{"url": f"{query}-1"}]}
+
+        openai_reddit = SimpleNamespace(
+            search_reddit=search_reddit,
+            parse_reddit_response=lambda raw: list(raw.get("items", [])),
+            _extract_core_subject=lambda topic: "core",
+            _build_subreddit_query=lambda topic: "subs",
+        )
+        with mock.patch.object(last30days, "openai_reddit", openai_reddit):
+            items, _, error = last30days._search_reddit(
+                "long topic", {"OPENAI_API_KEY": "k"}, {"openai": "m"},
+                "2026-01-01", "2026-01-31", "quick", False, fallback,
+            )
+        self.assertIsNone(error)
+        return queries, items
+
+    def test_few_results_trigger_fallback_searches(self):
+        queries, items = self._search(fallback=True)
+        self.assertEqual(queries, ["long topic", "core", "subs"])
+        self.assertEqual(len(items), 3)
+
+    def test_fallback_disabled(self):
+        queries, items = self._search(fallback=False)
+        self.assertEqual(queries, ["long topic"])
+        self.assertEqual(len(items), 1)
+
+    def test_incremental_run_disables_fallback(self):
+        with mock.patch.object(last30days, "_search_reddit", return_value=([], None, None)) as search:
+            last30days.run_research(
+                "topic", "reddit", {}, {}, "2026-01-25", "2026-01-31", "quick", mock=True,
+                incremental=True,
+            )
+        self.assertFalse(search.call_args.args[7])
+
+
+class NoCache:
+    """Stands in for lib.cache where a code path must not load it."""
+
+    def __getattr__(self, attr):
+        raise AssertionError(f"lib.cache.{attr} accessed")
+
+
+class TestProbeSources(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.probes = 0
+
+        def get_x_source_status(config):
+            self.probes += 1
+            return {"source": "bird", "probe": self.probes}
+
+        env = SimpleNamespace(get_x_source_status=get_x_source_status, is_ytdlp_available=lambda: True)
+        for patcher in (
+            mock.patch.object(last30days, "env", env),
+            mock.patch.object(last30days, "_source_probe_path",
+                              return_value=Path(tmp.name) / "source_probe.json"),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_reuses_recent_probe(self):
+        first = last30days._probe_sources({"XAI_API_KEY": "k"})
+        second = last30days._probe_sources({"XAI_API_KEY": "k"})
+        self.assertEqual(self.probes, 1)
+        self.assertEqual(first, second)
+
+    def test_expired_probe_is_redone(self):
+        last30days._probe_sources({})
+        with mock.patch.object(last30days, "SOURCE_PROBE_TTL_SECONDS", 0):
+            status, _ = last30days._probe_sources({})
+        self.assertEqual(self.probes, 2)
+        self.assertEqual(status["probe"], 2)
+
+    def test_config_change_invalidates(self):
+        last30days._probe_sources({"XAI_API_KEY": "a"})
+        last30days._probe_sources({"XAI_API_KEY": "b"})
+        self.assertEqual(self.probes, 2)
+
+    def test_binary_change_invalidates(self):
+        last30days._probe_sources({})
+        with mock.patch.object(last30days.shutil, "which", return_value="/opt/new/bird"):
+            last30days._probe_sources({})
+        self.assertEqual(self.probes, 2)
+
+    def test_fresh_probe_skips_cache(self):
+        last30days._probe_sources({})
+        with mock.patch.object(last30days, "cache", NoCache()), \
+                mock.patch.object(last30days, "_source_probe_path",
+                                  side_effect=AssertionError("cache path used")):
+            status, has_ytdlp = last30days._probe_sources({}, fresh=True)
+        self.assertEqual(status["probe"], 2)
+        self.assertTrue(has_ytdlp)
+
+
+class TestLatencyRecording(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = Path(self._tmp.name) / "latency_stats.json"
+
+    def _run_x(self, x_error, incremental=False):
+        latency = latency_stats.LatencyStats(self.path)
+        with mock.patch.object(last30days, "_search_x", return_value=([], None, x_error)):
+            last30days.run_research(
+                "topic", "x", {}, {}, "2026-01-01", "2026-01-31", "quick", mock=True,
+                latency=latency, incremental=incremental,
+            )
+        return latency.samples("quick", "x")
+
+    def test_records_successful_search(self):
+        self.assertEqual(len(self._run_x(None)), 1)
+
+    def test_skips_adapter_errors(self):
+        self.assertEqual(self._run_x("HTTP 401: Unauthorized"), [])
+
+    def test_skips_incremental_runs(self):
+        self.assertEqual(self._run_x(None, incremental=True), [])
+        self.assertFalse(self.path.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""Cold-start benchmark for last30days.py.
+
+The skill runs as a short-lived CLI many times a day, so import cost is paid
+on every call. These tests guard the startup budget and check that lib
+adapters are only imported when a run actually needs them.
+"""
+
+import json
+import subprocess
+import sys
+import time
+import unittest
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
+
+# Best-of-N wall time for a fresh interpreter importing last30days
+STARTUP_BUDGET_SECONDS = 0.5
+RUNS = 5
+
+
+def _run_python(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=str(SCRIPTS_DIR),
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+
+
+class TestStartup(unittest.TestCase):
+    def test_import_within_budget(self):
+        timings = []
+        for _ in range(RUNS):
+            start = time.perf_counter()
+            result = _run_python("import last30days")
+            timings.append(time.perf_counter() - start)
+            self.assertEqual(result.returncode, 0, result.stderr)
+
+        best = min(timings)
+        self.assertLess(
+            best, STARTUP_BUDGET_SECONDS,
+            f"cold start {best:.3f}s exceeds {STARTUP_BUDGET_SECONDS}s budget",
+        )
+
+    def test_import_loads_no_lib_modules(self):
+        result = _run_python(
+            "import json, sys, last30days; "
+            "print(json.dumps(sorted(m for m in sys.modules if m == 'lib' or m.startswith('lib.'))))"
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(json.loads(result.stdout), [])
+
+    def test_import_skips_asyncio(self):
+        result = _run_python("import sys, last30days; print('asyncio' in sys.modules)")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "False")
+
+    def test_help_does_not_import_lib(self):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", str(SCRIPTS_DIR / "last30days.py"), "--help"],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertNotIn(" lib.", result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
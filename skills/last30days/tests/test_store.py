@@ -0,0 +1,272 @@
+"""Tests for store module."""
+
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import store
+
+
+def finding(url, engagement=10, content="Some content", source="reddit"):
+    return {
+        "source": source,
+        "url": url,
+        "title": f"Title for {url}",
+        "author": "someone",
+        "content": content,
+        "engagement_score": engagement,
+        "relevance_score": 0.5,
+    }
+
+
+class StoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self._tmp.name) / "research.db"
+        store._db_override = self.db_path
+        store.init_db()
+        self.topic_id = store.add_topic("test topic")["id"]
+
+    def tearDown(self):
+        store.close_connections()
+        store._db_override = None
+        self._tmp.cleanup()
+
+    def new_run(self):
+        return store.record_run(self.topic_id)
+
+    def query(self, sql, params=()):
+        conn = store._connect()
+        try:
+            return [dict(r) for r in conn.execute(sql, params).fetchall()]
+        finally:
+            conn.close()
+
+
+class TestStoreFindings(StoreTestCase):
+    def test_inserts_new_findings(self):
+        counts = store.store_findings(self.new_run(), self.topic_id, [
+            finding("https://a"), finding("https://b"),
+        ])
+        self.assertEqual(counts, {"new": 2, "updated": 0})
+        self.assertEqual(len(store.get_new_findings(self.topic_id)), 2)
+
+    def test_resighting_updates_counts_and_engagement(self):
+        store.store_findings(self.new_run(), self.topic_id, [finding("https://a", engagement=10)])
+        run_id = self.new_run()
+        counts = store.store_findings(run_id, self.topic_id, [
+            finding("https://a", engagement=50),
+            finding("https://c"),
+        ])
+        self.assertEqual(counts, {"new": 1, "updated": 1})
+
+        row = self.query("SELECT * FROM findings WHERE source_url = ?", ("https://a",))[0]
+        self.assertEqual(row["sighting_count"], 2)
+        self.assertEqual(row["engagement_score"], 50)
+        self.assertEqual(row["run_id"], run_id)
+
+    def test_resighting_keeps_higher_engagement(self):
+        store.store_findings(self.new_run(), self.topic_id, [finding("https://a", engagement=80)])
+        store.store_findings(self.new_run(), self.topic_id, [finding("https://a", engagement=5)])
+        row = self.query("SELECT engagement_score FROM findings")[0]
+        self.assertEqual(row["engagement_score"], 80)
+
+    def test_duplicate_urls_in_one_batch(self):
+        counts = store.store_findings(self.new_run(), self.topic_id, [
+            finding("https://a", engagement=1),
+            finding("https://a", engagement=9),
+        ])
+        self.assertEqual(counts, {"new": 1, "updated": 1})
+        row = self.query("SELECT sighting_count, engagement_score FROM findings")[0]
+        self.assertEqual(row["sighting_count"], 2)
+        self.assertEqual(row["engagement_score"], 9)
+
+    def test_skips_findings_without_url(self):
+        counts = store.store_findings(self.new_run(), self.topic_id, [{"content": "no url"}])
+        self.assertEqual(counts, {"new": 0, "updated": 0})
+
+    def test_records_run_counts(self):
+        run_id = self.new_run()
+        store.store_findings(run_id, self.topic_id, [finding("https://a")])
+        row = self.query("SELECT findings_new, findings_updated FROM research_runs WHERE id = ?", (run_id,))[0]
+        self.assertEqual((row["findings_new"], row["findings_updated"]), (1, 0))
+
+    def test_new_findings_are_searchable(self):
+        store.store_findings(self.new_run(), self.topic_id, [
+            finding("https://a", content="kubernetes operators in production"),
+        ])
+        results = store.search_findings("kubernetes")
+        self.assertEqual([r["source_url"] for r in results], ["https://a"])
+
+
+class TestFtsTrigger(StoreTestCase):
+    def _store_one(self, content="original words here"):
+        store.store_findings(self.new_run(), self.topic_id, [finding("https://a", content=content)])
+        return self.query("SELECT id FROM findings")[0]["id"]
+
+    def test_dismiss_does_not_touch_fts(self):
+        finding_id = self._store_one()
+        with store.connection() as conn:
+            before = conn.total_changes
+            store.dismiss_finding(finding_id)
+            self.assertEqual(conn.total_changes - before, 1)
+
+    def test_content_update_reindexes(self):
+        finding_id = self._store_one()
+        store.update_finding(finding_id, content="replacement vocabulary")
+        self.assertEqual(len(store.search_findings("replacement")), 1)
+        self.assertEqual(store.search_findings("original"), [])
+
+    def test_resighting_keeps_index(self):
+        self._store_one()
+        self._store_one()
+        self.assertEqual(len(store.search_findings("original")), 1)
+
+
+def days_ago(days):
+    return (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d %H:%M:%S")
+
+
+class TestAggregates(StoreTestCase):
+    def set_first_seen(self, url, when):
+        with store.transaction() as conn:
+            conn.execute("UPDATE findings SET first_seen = ? WHERE source_url = ?", (when, url))
+
+    def test_get_stats(self):
+        store.record_run(self.topic_id, token_cost=0.5)
+        store.record_run(self.topic_id, status="failed", token_cost=0.25)
+        store.store_findings(self.new_run(), self.topic_id, [
+            finding("https://a"), finding("https://b", source="x"), finding("https://c", source="x"),
+        ])
+        stats = store.get_stats()
+        self.assertEqual(stats["topics_active"], 1)
+        self.assertEqual(stats["total_findings"], 3)
+        self.assertEqual(stats["sources"], {"reddit": 1, "x": 2})
+        self.assertEqual((stats["runs_7d"], stats["successful_7d"], stats["failed_7d"]), (3, 2, 1))
+        self.assertEqual(stats["cost_7d"], 0.75)
+
+    def test_weekly_rollup(self):
+        store.add_topic("quiet topic")
+        store.store_findings(self.new_run(), self.topic_id, [
+            finding("https://new", engagement=30),
+            finding("https://old", engagement=10),
+            finding("https://older", engagement=99),
+            finding("https://gone", engagement=50),
+        ])
+        self.set_first_seen("https://old", days_ago(10))
+        self.set_first_seen("https://older", days_ago(20))
+        store.dismiss_finding(self.query(
+            "SELECT id FROM findings WHERE source_url = 'https://gone'")[0]["id"])
+
+        rows = store.get_weekly_rollup(days_ago(7)[:10], days_ago(14)[:10])
+        self.assertEqual([r["name"] for r in rows], ["quiet topic", "test topic"])
+        quiet, topic = rows
+        self.assertEqual(
+            (quiet["this_week_count"], quiet["last_week_count"], quiet["this_week_engagement"]),
+            (0, 0, 0),
+        )
+        self.assertEqual((topic["this_week_count"], topic["last_week_count"]), (1, 1))
+        self.assertEqual((topic["this_week_engagement"], topic["last_week_engagement"]), (30, 10))
+
+    def test_get_new_findings_limit(self):
+        store.store_findings(self.new_run(), self.topic_id, [finding(f"https://{i}") for i in range(8)])
+        self.assertEqual(len(store.get_new_findings(self.topic_id, limit=5)), 5)
+        self.assertEqual(len(store.get_new_findings(self.topic_id)), 8)
+
+
+class TestQueryPlans(StoreTestCase):
+    """Hot read paths must be served from an index, never a table scan or sort."""
+
+    def setUp(self):
+        super().setUp()
+        run_id = self.new_run()
+        store.store_findings(run_id, self.topic_id, [finding(f"https://{i}") for i in range(50)])
+        store.dismiss_finding(1)
+
+    def _plans(self, func, *args):
+        statements = []
+        with store.connection() as conn:
+            conn.set_trace_callback(statements.append)
+            try:
+                func(*args)
+            finally:
+                conn.set_trace_callback(None)
+            plans = {}
+            for sql in statements:
+                if sql.lstrip().upper().startswith("SELECT"):
+                    rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+                    plans[sql] = [row["detail"] for row in rows]
+        self.assertTrue(plans)
+        return plans
+
+    def assertIndexed(self, func, *args, sorts_aggregate=False):
+        for sql, details in self._plans(func, *args).items():
+            for detail in details:
+                if detail.startswith("SCAN") and detail.split()[1] in ("findings", "research_runs"):
+                    self.assertIn("COVERING INDEX", detail, f"{sql}\n{details}")
+                if sorts_aggregate and detail == "USE TEMP B-TREE FOR ORDER BY":
+                    continue  # one row per topic, not per finding
+                self.assertNotIn("TEMP B-TREE", detail, f"{sql}\n{details}")
+
+    def test_get_new_findings(self):
+        self.assertIndexed(store.get_new_findings, self.topic_id, "2000-01-01")
+        self.assertIndexed(store.get_new_findings, self.topic_id)
+
+    def test_get_trending(self):
+        self.assertIndexed(store.get_trending, sorts_aggregate=True)
+
+    def test_get_daily_cost(self):
+        self.assertIndexed(store.get_daily_cost)
+
+    def test_get_stats(self):
+        self.assertIndexed(store.get_stats)
+
+    def test_list_topics(self):
+        self.assertIndexed(store.list_topics)
+
+    def test_get_weekly_rollup(self):
+        self.assertIndexed(store.get_weekly_rollup, "2000-01-08", "2000-01-01", sorts_aggregate=True)
+        for details in self._plans(store.get_weekly_rollup, "2000-01-08", "2000-01-01").values():
+            self.assertIn("COVERING INDEX idx_findings_topic_engagement", " ".join(details))
+
+
+class TestConnections(StoreTestCase):
+    def test_nested_calls_share_connection(self):
+        with store.connection() as outer:
+            with store.connection() as inner:
+                self.assertIs(outer, inner)
+
+    def test_connection_is_pooled(self):
+        with store.connection() as first:
+            pass
+        with store.connection() as second:
+            self.assertIs(first, second)
+
+    def test_transaction_rolls_back_on_error(self):
+        with self.assertRaises(RuntimeError):
+            with store.transaction():
+                store.add_topic("rolled back")
+                raise RuntimeError("boom")
+        self.assertIsNone(store.get_topic("rolled back"))
+
+    def test_nested_transaction_joins_outer(self):
+        with self.assertRaises(RuntimeError):
+            with store.transaction():
+                store.record_run(self.topic_id)
+                store.store_findings(self.new_run(), self.topic_id, [finding("https://a")])
+                raise RuntimeError("boom")
+        self.assertEqual(self.query("SELECT COUNT(*) AS n FROM findings")[0]["n"], 0)
+        self.assertEqual(self.query("SELECT COUNT(*) AS n FROM research_runs")[0]["n"], 0)
+
+    def test_functions_commit_without_transaction(self):
+        store.set_setting("delivery_mode", "silent")
+        self.assertEqual(store.get_setting("delivery_mode"), "silent")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""Tests for timing module."""
+
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import timing
+
+
+class TestSpanTracer(unittest.TestCase):
+    def test_span_records_items_and_bytes(self):
+        tracer = timing.SpanTracer()
+        with tracer.span("x.search") as span:
+            span["items"] = 3
+            span["bytes"] = 120
+        (recorded,) = tracer.to_dict()["spans"]
+        self.assertEqual(recorded["name"], "x.search")
+        self.assertEqual((recorded["items"], recorded["bytes"]), (3, 120))
+        self.assertGreaterEqual(recorded["seconds"], 0)
+
+    def test_span_recorded_when_block_raises(self):
+        tracer = timing.SpanTracer()
+        with self.assertRaises(ValueError):
+            with tracer.span("render"):
+                raise ValueError
+        self.assertEqual([s["name"] for s in tracer.to_dict()["spans"]], ["render"])
+
+    def test_spans_sorted_by_start(self):
+        tracer = timing.SpanTracer()
+        now = time.perf_counter()
+        tracer.add("late", 0.1, start=now + 1)
+        tracer.add("early", 0.1, start=now)
+        data = tracer.to_dict()
+        self.assertEqual([s["name"] for s in data["spans"]], ["early", "late"])
+        self.assertNotIn("items", data["spans"][0])
+        self.assertIn("total_seconds", data)
+
+    def test_add_from_threads(self):
+        tracer = timing.SpanTracer()
+        threads = [
+            threading.Thread(target=lambda: [tracer.add("fetch", 0.01, 1) for _ in range(100)])
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(tracer.to_dict()["spans"]), 400)
+
+    def test_render_table(self):
+        tracer = timing.SpanTracer()
+        tracer.add("phase1", 1.5, items=7)
+        lines = tracer.render().splitlines()
+        self.assertTrue(lines[0].startswith("stage"))
+        self.assertIn("phase1", lines[1])
+        self.assertIn("7", lines[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""Tests for watchlist module."""
+
+import io
+import json
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import last30days
+import store
+import watchlist
+
+
+class TestRunAllBudget(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        store._db_override = Path(self._tmp.name) / "research.db"
+        store.init_db()
+        store.set_setting("daily_budget", "1.00")
+        for name in ("first", "second"):
+            store.add_topic(name)
+
+    def tearDown(self):
+        store.close_connections()
+        store._db_override = None
+        self._tmp.cleanup()
+
+    def _run_all(self) -> dict:
+        out = io.StringIO()
+        with redirect_stdout(out):
+            watchlist.cmd_run_all(SimpleNamespace())
+        return json.loads(out.getvalue())
+
+    def _spend(self, cost: float):
+        run_id = store.record_run(store.get_topic("first")["id"])
+        store.update_run(run_id, token_cost=cost)
+
+    def test_guard_is_checked_before_each_topic(self):
+        def research_many(topics, budget_check=None):
+            results = []
+            for topic in topics:
+                reason = budget_check()
+                if reason:
+                    results.append({"topic": topic, "status": "skipped", "reason": reason})
+                    continue
+                # The first topic's spend uses up the budget
+                self._spend(1.5)
+                results.append({"topic": topic, "status": "completed", "duration": 1, "findings": []})
+            return results
+
+        with mock.patch.object(last30days, "research_many", side_effect=research_many):
+            output = self._run_all()
+        self.assertEqual(
+            [r["status"] for r in output["results"]], ["completed", "skipped"],
+        )
+        self.assertIn("Budget exceeded", output["results"][1]["reason"])
+
+    def test_spent_budget_skips_the_batch(self):
+        self._spend(2.0)
+        with mock.patch.object(last30days, "research_many") as research_many:
+            output = self._run_all()
+        research_many.assert_not_called()
+        self.assertEqual([r["status"] for r in output["results"]], ["skipped", "skipped"])
+
+
+if __name__ == "__main__":
+    unittest.main()